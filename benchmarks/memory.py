@@ -0,0 +1,117 @@
+"""
+Memory benchmark of games held by GameRepository.
+
+Plays several games at once, all kept in the repository, and reports how
+much memory a game takes and how much it grows every season.
+
+Usage example:
+    python -m benchmarks.memory --games 4 --seasons 3 --config long
+
+Created October 18, 2026
+
+@author montreal91
+"""
+import argparse
+import gc
+import sqlite3
+import tracemalloc
+from typing import List
+from typing import NamedTuple
+
+from configuration.game_params import LONG_GAME_CONFIG
+from configuration.game_params import SHORT_GAME_CONFIG
+from configuration.game_params import load_game_params
+from core.ports.inbound.commands.create_new_game import CreateNewGameCommand
+from core.ports.inbound.commands.create_new_game import CreateNewGameCommandHandler
+from core.ports.outbound.game_repository import GameRepository
+from core.ports.outbound.temporal_club_provider import TemporalClubProvider
+from persistence.migration_history import migrate
+
+_CONFIGS = {
+    "short": SHORT_GAME_CONFIG,
+    "long": LONG_GAME_CONFIG,
+}
+
+
+class MemoryReport(NamedTuple):
+    games: int
+    seasons: int
+    # Traced memory after every finished season, index 0 is a new game
+    bytes_held: List[int]
+
+    @property
+    def bytes_per_game(self) -> float:
+        return self.bytes_held[-1] / self.games
+
+    @property
+    def bytes_per_season(self) -> float:
+        if self.seasons == 0:
+            return 0.0
+        growth = self.bytes_held[-1] - self.bytes_held[0]
+        return growth / self.seasons / self.games
+
+
+def measure_memory(config_path: str, games: int, seasons: int, seed: int = 0):
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    migrate(conn)
+    TemporalClubProvider.initialize(conn)
+    repository = GameRepository(conn)
+    create_game = CreateNewGameCommandHandler(
+        repository,
+        load_game_params(config_path),
+        TemporalClubProvider.get_instance(),
+    )
+
+    tracemalloc.start()
+    try:
+        start = _traced_memory()
+
+        for i in range(games):
+            create_game(CreateNewGameCommand(
+                game_id=f"memory-{i}",
+                seed=seed + i,
+            ))
+
+        bytes_held = [_traced_memory() - start]
+        for season in range(1, seasons + 1):
+            for game in repository._games.values():
+                while len(game.history) <= season:
+                    success, reason = game.update()
+                    assert success, reason
+            bytes_held.append(_traced_memory() - start)
+    finally:
+        tracemalloc.stop()
+        conn.close()
+
+    return MemoryReport(games=games, seasons=seasons, bytes_held=bytes_held)
+
+
+def _traced_memory() -> int:
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    return current
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--config", default="short")
+    parser.add_argument("--games", type=int, default=4)
+    parser.add_argument("--seasons", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = _parse_args()
+    report = measure_memory(
+        config_path=_CONFIGS.get(args.config, args.config),
+        games=args.games,
+        seasons=args.seasons,
+        seed=args.seed,
+    )
+
+    for season, held in enumerate(report.bytes_held):
+        print(f"After season {season}: {held / 2 ** 20:8.2f} MiB")
+    print(f"Bytes per game:   {report.bytes_per_game:12,.0f}")
+    print(f"Bytes per season: {report.bytes_per_season:12,.0f}")
@@ -0,0 +1,499 @@
+"""
+Speed benchmarks of the engine, competitions, persistence and queries.
+
+Times every benchmark with timeit, and either saves the times as a JSON
+baseline or compares them with a saved one.
+
+Every repeat of a benchmark is preceded by a repeat of a fixed calibration
+loop, and times are compared in units of it. So a baseline saved on a faster
+or a slower machine is still comparable, and the machine getting busier in
+the middle of a run slows down both. A benchmark is a regression if it got
+slower by more than the threshold plus the spread of its repeats in both
+runs, so noisy benchmarks need a bigger slowdown to fail.
+
+Every workload is fixed: games and matches are seeded, so runs differ
+only in how fast the code is. Baselines are still best compared on the
+same Python version.
+
+Usage examples:
+    python -m benchmarks.suite --save
+    python -m benchmarks.suite --compare --threshold 0.2
+    python -m benchmarks.suite --filter queries. --repeats 3
+
+Created October 18, 2026
+
+@author montreal91
+"""
+import argparse
+import json
+import pickle
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import timeit
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+from configuration.game_params import SHORT_GAME_CONFIG
+from configuration.game_params import load_game_params
+from core.game import Game
+from core.match import MatchEngine
+from core.player import Player
+from core.ports.inbound.commands.create_new_game import CreateNewGameCommand
+from core.ports.inbound.commands.create_new_game import CreateNewGameCommandHandler
+from core.ports.inbound.commands.next_day import NextDayCommand
+from core.ports.inbound.commands.next_day import NextDayCommandHandler
+from core.ports.outbound.game_repository import GameRepository
+from core.ports.outbound.identity_map import IdentityMap
+from core.ports.outbound.match_history_repository import MatchHistoryRepository
+from core.ports.outbound.player_repository import PlayerRepository
+from core.ports.outbound.temporal_club_provider import TemporalClubProvider
+from core.queries.club_selection_screen_query import ClubSelectionScreenQuery
+from core.queries.club_selection_screen_query import ClubSelectionScreenQueryHandler
+from core.queries.day_results_query import DayResultsQuery
+from core.queries.day_results_query import DayResultsQueryHandler
+from core.queries.game_screen_query import GameScreenGuiQueryHandler
+from core.queries.game_screen_query import GameScreenQuery
+from core.queries.level_up_screen_query import LevelUpScreenQuery
+from core.queries.level_up_screen_query import LevelUpScreenQueryHandler
+from core.queries.player_details_screen_query import PlayerDetailsScreenQuery
+from core.queries.player_details_screen_query import PlayerDetailsScreenQueryHandler
+from core.queries.practice_screen_query import PracticeScreenQuery
+from core.queries.practice_screen_query import PracticeScreenQueryHandler
+from core.queries.roster_management_screen_query import RosterManagementScreenQuery
+from core.queries.roster_management_screen_query import RosterManagementScreenQueryHandler
+from core.queries.season_forecast_query import SeasonForecastQuery
+from core.queries.season_forecast_query import SeasonForecastQueryHandler
+from core.regular_championship import RegularChampionship
+from core.rng import GameRng
+from core.season_forecast import simulate_season
+from persistence.migration_history import migrate
+
+BASELINE_PATH = "benchmarks/baseline.json"
+
+_GAME_ID = "benchmark"
+_SEED = 1
+# Days played before the benchmarks, so there are results and standings
+_WARM_UP_DAYS = 20
+_FORECAST_RUNS = 8
+
+# Makes the benchmarked callable, its own time is not measured
+Setup = Callable[[], Callable[[], object]]
+
+
+class BenchmarkResult(NamedTuple):
+    name: str
+    # Calls in every repeat
+    number: int
+    # Seconds per call
+    best: float
+    median: float
+    # Best seconds per call of the calibration loop next to the benchmark
+    unit: float
+
+    @property
+    def spread(self) -> float:
+        """How much slower the median repeat is than the best one."""
+
+        return self.median / self.best - 1
+
+    @property
+    def json(self):
+        return {
+            "number": self.number,
+            "best": self.best,
+            "median": self.median,
+            "unit": self.unit,
+        }
+
+
+class Comparison(NamedTuple):
+    name: str
+    # Best time per call, in calibration times
+    baseline: float
+    current: float
+    # Slowdown that still counts as noise
+    tolerance: float
+    is_regression: bool
+
+    @property
+    def change(self) -> float:
+        """Relative change of the time, 0.1 means 10% slower."""
+
+        return self.current / self.baseline - 1
+
+
+def run_benchmarks(
+        names: Optional[Iterable[str]] = None,
+        repeats: int = 7,
+) -> List[BenchmarkResult]:
+    """
+    Runs the given benchmarks, or all of them.
+
+    Every benchmark is called as many times as needed to take at least
+    0.2 seconds, and that is repeated the given number of times. Before
+    each repeat the calibration loop is timed the same way.
+    """
+
+    names = list(BENCHMARKS) if names is None else list(names)
+
+    calibration = timeit.Timer(_calibration())
+    calibration_number, _ = calibration.autorange()
+
+    results = []
+    for name in names:
+        timer = timeit.Timer(BENCHMARKS[name]())
+        number, _ = timer.autorange()
+
+        units = []
+        times = []
+        for _ in range(repeats):
+            unit = calibration.timeit(calibration_number)
+            units.append(unit / calibration_number)
+            times.append(timer.timeit(number) / number)
+
+        results.append(BenchmarkResult(
+            name=name,
+            number=number,
+            best=min(times),
+            median=statistics.median(times),
+            unit=min(units),
+        ))
+    return results
+
+
+def save_baseline(results: List[BenchmarkResult], path: str = BASELINE_PATH):
+    baseline = {
+        "python": platform.python_version(),
+        "benchmarks": {result.name: result.json for result in results},
+    }
+    with open(path, "w") as baseline_file:
+        json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+        baseline_file.write("\n")
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Dict[str, BenchmarkResult]:
+    with open(path) as baseline_file:
+        baseline = json.load(baseline_file)
+
+    return {
+        name: BenchmarkResult(name=name, **fields)
+        for name, fields in baseline["benchmarks"].items()
+    }
+
+
+def compare(
+        results: List[BenchmarkResult],
+        baseline: Dict[str, BenchmarkResult],
+        threshold: float = 0.2,
+) -> List[Comparison]:
+    """
+    Compares best times with the baseline, both in calibration units.
+
+    A slowdown is a regression if it is bigger than the threshold plus
+    the spreads of the benchmark in the baseline and in the results.
+    Benchmarks missing in the baseline are skipped.
+    """
+
+    comparisons = []
+    for result in results:
+        if result.name not in baseline:
+            continue
+
+        saved = baseline[result.name]
+        baseline_time = saved.best / saved.unit
+        current_time = result.best / result.unit
+        tolerance = threshold + saved.spread + result.spread
+        comparisons.append(Comparison(
+            name=result.name,
+            baseline=baseline_time,
+            current=current_time,
+            tolerance=tolerance,
+            is_regression=current_time > baseline_time * (1 + tolerance),
+        ))
+    return comparisons
+
+
+def _calibration():
+    # Plain interpreter work: loops, arithmetic, dicts and sorting
+    rng = random.Random(_SEED)
+    values = [rng.random() for _ in range(1000)]
+
+    def calibrate():
+        totals = {}
+        for index, value in enumerate(values):
+            key = index % 16
+            totals[key] = totals.get(key, 0) + value * value
+        return sorted(totals.values())
+
+    return calibrate
+
+
+def _match_engine():
+    params = load_game_params().championship_params.match_params
+    rng = GameRng(_SEED)
+
+    def process_match():
+        home_player = Player(technique=60, endurance=50, player_id="home")
+        away_player = Player(technique=50, endurance=70, player_id="away")
+        MatchEngine(params, rng=rng.spawn()).process_match(
+            home_player,
+            away_player,
+        )
+
+    return process_match
+
+
+def _game_day():
+    game = _make_game()
+    return game.update
+
+
+def _game_season():
+    snapshot = pickle.dumps(_make_game(), pickle.HIGHEST_PROTOCOL)
+    return lambda: simulate_season(pickle.loads(snapshot))
+
+
+def _championship_schedule():
+    game = _make_game()
+    clubs = game.clubs
+    params = load_game_params().championship_params
+    rng = GameRng(_SEED)
+
+    return lambda: RegularChampionship(clubs, params, rng)
+
+
+def _championship_standings():
+    game = _make_game(days=_WARM_UP_DAYS)
+    return lambda: game.competition.standings
+
+
+def _game_repository_round_trip():
+    saved = _SavedGame()
+
+    def round_trip():
+        GameRepository(saved.conn).save_game(saved.game)
+        GameRepository(saved.conn).get_game(_GAME_ID)
+
+    return round_trip
+
+
+def _club_provider_save_clubs():
+    saved = _SavedGame()
+    clubs = list(saved.game.clubs.values())
+
+    # A new provider has nothing saved yet, so every row is written
+    return lambda: TemporalClubProvider(saved.conn).save_clubs(clubs)
+
+
+def _club_provider_get_clubs():
+    provider = TemporalClubProvider(_SavedGame().conn)
+    return lambda: provider.get_clubs_for_game(_GAME_ID)
+
+
+def _make_query(handler_factory, query_factory):
+    def setup():
+        app = _SavedGame()
+        handler = handler_factory(app)
+        query = query_factory(app)
+        return lambda: handler(query)
+
+    return setup
+
+
+class _SavedGame:
+    """A game played for a few days and saved the way the application does."""
+
+    def __init__(self):
+        self.conn = _make_connection()
+        self.identity_map = IdentityMap()
+        TemporalClubProvider.initialize(self.conn, self.identity_map)
+        self.club_provider = TemporalClubProvider.get_instance()
+        self.game_repository = GameRepository(
+            self.conn,
+            identity_map=self.identity_map,
+        )
+        self.match_history_repository = MatchHistoryRepository(self.conn)
+
+        create_game = CreateNewGameCommandHandler(
+            self.game_repository,
+            load_game_params(SHORT_GAME_CONFIG),
+            self.club_provider,
+        )
+        create_game(CreateNewGameCommand(game_id=_GAME_ID, seed=_SEED))
+        self.game = self.game_repository.get_game(_GAME_ID)
+
+        next_day = NextDayCommandHandler(
+            self.game_repository,
+            self.club_provider,
+            self.match_history_repository,
+        )
+        for _ in range(_WARM_UP_DAYS):
+            result = next_day(NextDayCommand(game_id=_GAME_ID))
+            if not result.success:
+                raise RuntimeError(result.reason)
+
+        self.club_id = sorted(self.game.clubs)[0]
+        self.player_id = self.game.clubs[self.club_id].players[0].player.player_id
+
+
+def _make_connection():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    migrate(conn)
+    return conn
+
+
+def _make_game(days: int = 0) -> Game:
+    TemporalClubProvider.initialize(None)
+    game = Game(
+        load_game_params(SHORT_GAME_CONFIG),
+        _GAME_ID,
+        created_ts=0,
+        updated_ts=0,
+        seed=_SEED,
+    )
+    for _ in range(days):
+        success, reason = game.update()
+        if not success:
+            raise RuntimeError(reason)
+    return game
+
+
+BENCHMARKS: Dict[str, Setup] = {
+    "engine.process_match": _match_engine,
+    "game.update_day": _game_day,
+    "game.full_season": _game_season,
+    "championship.schedule": _championship_schedule,
+    "championship.standings": _championship_standings,
+    "persistence.game_round_trip": _game_repository_round_trip,
+    "persistence.save_clubs": _club_provider_save_clubs,
+    "persistence.get_clubs_for_game": _club_provider_get_clubs,
+    "queries.club_selection_screen": _make_query(
+        lambda app: ClubSelectionScreenQueryHandler(app.club_provider),
+        lambda app: ClubSelectionScreenQuery(game_id=_GAME_ID),
+    ),
+    "queries.day_results": _make_query(
+        lambda app: DayResultsQueryHandler(
+            app.game_repository,
+            app.club_provider,
+        ),
+        lambda app: DayResultsQuery(
+            game_id=_GAME_ID,
+            manager_club_id=app.club_id,
+        ),
+    ),
+    "queries.game_screen": _make_query(
+        lambda app: GameScreenGuiQueryHandler(
+            app.game_repository,
+            app.club_provider,
+            app.match_history_repository,
+        ),
+        lambda app: GameScreenQuery(
+            game_id=_GAME_ID,
+            manager_club_id=app.club_id,
+        ),
+    ),
+    "queries.level_up_screen": _make_query(
+        lambda app: LevelUpScreenQueryHandler(app.club_provider),
+        lambda app: LevelUpScreenQuery(game_id=_GAME_ID, club_id=app.club_id),
+    ),
+    "queries.player_details_screen": _make_query(
+        lambda app: PlayerDetailsScreenQueryHandler(
+            PlayerRepository(app.conn, app.identity_map),
+        ),
+        lambda app: PlayerDetailsScreenQuery(
+            game_id=_GAME_ID,
+            player_id=app.player_id,
+        ),
+    ),
+    "queries.practice_screen": _make_query(
+        lambda app: PracticeScreenQueryHandler(app.game_repository),
+        lambda app: PracticeScreenQuery(
+            game_id=_GAME_ID,
+            manager_club_id=app.club_id,
+        ),
+    ),
+    "queries.roster_management_screen": _make_query(
+        lambda app: RosterManagementScreenQueryHandler(app.game_repository),
+        lambda app: RosterManagementScreenQuery(
+            game_id=_GAME_ID,
+            manager_club_id=app.club_id,
+        ),
+    ),
+    "queries.season_forecast": _make_query(
+        lambda app: SeasonForecastQueryHandler(app.game_repository),
+        lambda app: SeasonForecastQuery(
+            game_id=_GAME_ID,
+            runs=_FORECAST_RUNS,
+            seed=_SEED,
+        ),
+    ),
+}
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "--filter",
+        default="",
+        help="run only benchmarks whose names start with it",
+    )
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--save",
+        action="store_true",
+        help="save the results as the new baseline",
+    )
+    mode.add_argument(
+        "--compare",
+        action="store_true",
+        help="compare the results with the baseline",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="slowdown past the noise that counts as a regression"
+             " (default: 0.2)",
+    )
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = _parse_args()
+    results = run_benchmarks(
+        names=[name for name in BENCHMARKS if name.startswith(args.filter)],
+        repeats=args.repeats,
+    )
+
+    for result in results:
+        print(
+            f"{result.name:36} {result.best * 1000:10.3f} ms"
+            f" (median {result.median * 1000:.3f} ms, {result.number} calls)"
+        )
+
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+
+    if args.compare:
+        comparisons = compare(results, load_baseline(args.baseline), args.threshold)
+        print()
+        for comparison in comparisons:
+            verdict = "REGRESSION" if comparison.is_regression else "ok"
+            print(
+                f"{comparison.name:36} {comparison.change:+8.1%}"
+                f" (allowed {comparison.tolerance:+.1%})  {verdict}"
+            )
+
+        if any(comparison.is_regression for comparison in comparisons):
+            sys.exit(1)
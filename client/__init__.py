@@ -4,4 +4,11 @@ Created May 20, 2024
 @author montreal91
 """
 
-from client.duck_client import DuckClientApp
+
+def __getattr__(name):
+    # The application is imported on demand, so the modules of the client
+    # that don't need Kivy can be used without it.
+    if name == "DuckClientApp":
+        from client.duck_client import DuckClientApp
+        return DuckClientApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
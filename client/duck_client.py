@@ -8,6 +8,7 @@ from kivy.uix.screenmanager import ScreenManager
 from kivy.uix.screenmanager import NoTransition
 from kivy.clock import Clock
 
+from client.executor import ClientExecutor
 from client.screens.about_screen import AboutScreen
 from client.screens.club_selection_screen import ClubSelectionScreen
 from client.screens.day_results_screen import DayResultsScreen
@@ -40,6 +41,7 @@ class DuckClientApp(App):
         self._practice_screen = None
         self._roster_management_screen = None
         self._about_screen = None
+        self._executor = None
 
         self.sm = None
 
@@ -50,39 +52,57 @@ class DuckClientApp(App):
         self._about_screen = AboutScreen(name="about")
 
         ac = get_application_context()
+        self._executor = ClientExecutor(
+            dispatch=_dispatch_on_main_thread,
+            lock=ac.writer_lock,
+        )
 
         self.game_screen = GameScreen(
-            game_service=ac.game_service,
+            executor=self._executor,
             next_day_command_handler=ac.next_day_command_handler,
             query_handler=ac.game_screen_ui_query_handler,
             name="game"
         )
 
-        self.story_name_screen = StoryNameScreen(name="story_name")
-        self._club_selection_screen = ClubSelectionScreen(name="club_selection")
+        self.story_name_screen = StoryNameScreen(
+            executor=self._executor,
+            name="story_name",
+        )
+        self._club_selection_screen = ClubSelectionScreen(
+            executor=self._executor,
+            name="club_selection",
+        )
         self._level_up_screen = LevelUpScreen(
+            executor=self._executor,
             query_handler=ac.level_up_screen_query_handler,
             improve_player_skill_command_handler=(
                 ac.improve_player_skill_command_handler
             ),
             name="level_up",
         )
-        self._load_story_screen = LoadStoryScreen(name="load_story")
+        self._load_story_screen = LoadStoryScreen(
+            executor=self._executor,
+            name="load_story",
+        )
         self._player_selection_screen = PlayerSelectionScreen(
+            executor=self._executor,
             game_service=ac.game_service,
             select_player_for_match_command_handler=ac.select_player_for_match_command_handler,
             name="player_selection",
         )
         self._player_details_screen = PlayerDetailsScreen(
+            executor=self._executor,
             query_handler=ac.player_details_screen_query_handler,
             name="player_details",
         )
         self._practice_screen = PracticeScreen(
+            executor=self._executor,
             query_handler=ac.practice_screen_query_handler,
             select_coach_for_player_command_handler=ac.select_coach_for_player_command_handler,
             name="practice",
         )
         self._roster_management_screen = RosterManagementScreen(
+            executor=self._executor,
             query_handler=ac.roster_management_screen_query_handler,
             hire_new_player_command_handler=ac.hire_new_player_command_handler,
             sign_player_command_handler=ac.sign_player_command_handler,
@@ -90,6 +110,7 @@ class DuckClientApp(App):
             name="roster_management",
         )
         self._day_results_screen = DayResultsScreen(
+            executor=self._executor,
             name="day_results",
             day_results_query_handler=ac.day_results_query_handler,
         )
@@ -112,6 +133,10 @@ class DuckClientApp(App):
 
         return self.sm
 
+    def on_stop(self):
+        self._executor.shutdown()
+        get_application_context().close()
+
     def switch_to_main(self, _):
         self.sm.current = "main"
 
@@ -162,3 +187,7 @@ class DuckClientApp(App):
     def switch_to_day_results(self):
         self.sm.current = "day_results"
         self._day_results_screen.update()
+
+
+def _dispatch_on_main_thread(callback):
+    Clock.schedule_once(lambda _: callback())
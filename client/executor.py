@@ -0,0 +1,147 @@
+"""
+Runs commands and queries of the client off the main thread.
+
+Created October 18, 2026
+
+@author montreal91
+"""
+import contextlib
+import functools
+import logging
+import queue
+import threading
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+
+# Runs the given callback on the main thread
+Dispatcher = Callable[[Callable[[], None]], None]
+
+_STOP = object()
+
+
+class ClientExecutor:
+    """
+    Runs tasks on worker threads and delivers results to the main thread.
+
+    Every game has its own queue served by a single worker, so tasks of
+    a game run in the order they were submitted: a query submitted after
+    a command sees the result of the command. Callbacks are passed to the
+    dispatcher, which should call them on the main thread.
+
+    Tasks that write run under the given lock, so workers of different
+    games never write on the database connection at the same time. Other
+    tasks are queries, they read on the reader connections and don't wait
+    for the writes of other games.
+    """
+
+    def __init__(self, dispatch: Dispatcher, lock=None):
+        self._dispatch = dispatch
+        self._lock = contextlib.nullcontext() if lock is None else lock
+        self._queues: Dict[str, queue.SimpleQueue] = {}
+        self._workers: Dict[str, threading.Thread] = {}
+        self._pending: Dict[str, int] = {}
+        self._state_lock = threading.Lock()
+
+    def submit(
+            self,
+            game_id: str,
+            task: Callable[[], Any],
+            on_done: Optional[Callable[[Any], None]] = None,
+            on_error: Optional[Callable[[Exception], None]] = None,
+            writes: bool = False,
+    ):
+        """
+        Queues the task of the given game.
+
+        Commands should be submitted with writes set, so they hold the lock.
+        Either on_done is called with the result of the task, or on_error
+        with the exception it has raised. Errors are logged in any case.
+        """
+
+        with self._state_lock:
+            self._pending[game_id] = self._pending.get(game_id, 0) + 1
+            self._get_queue(game_id).put((task, on_done, on_error, writes))
+
+    def is_busy(self, game_id: str) -> bool:
+        """Whether some task of the game is queued or not delivered yet."""
+
+        with self._state_lock:
+            return self._pending.get(game_id, 0) > 0
+
+    def shutdown(self, wait: bool = True):
+        """Stops the workers once they have run all the queued tasks."""
+
+        with self._state_lock:
+            workers = list(self._workers.values())
+            for game_queue in self._queues.values():
+                game_queue.put(_STOP)
+            self._queues.clear()
+            self._workers.clear()
+
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    def _get_queue(self, game_id: str) -> queue.SimpleQueue:
+        game_queue = self._queues.get(game_id)
+        if game_queue is None:
+            game_queue = queue.SimpleQueue()
+            worker = threading.Thread(
+                target=self._work,
+                args=(game_id, game_queue),
+                name=f"executor-{game_id}",
+                daemon=True,
+            )
+            self._queues[game_id] = game_queue
+            self._workers[game_id] = worker
+            worker.start()
+        return game_queue
+
+    def _work(self, game_id: str, game_queue: queue.SimpleQueue):
+        while True:
+            item = game_queue.get()
+            if item is _STOP:
+                return
+
+            task, on_done, on_error, writes = item
+            try:
+                result = self._run(task, writes)
+            except Exception as error:
+                callback = functools.partial(
+                    self._deliver_error,
+                    game_id,
+                    on_error,
+                    error,
+                )
+            else:
+                callback = functools.partial(
+                    self._deliver,
+                    game_id,
+                    on_done,
+                    result,
+                )
+            self._dispatch(callback)
+
+    def _run(self, task: Callable[[], Any], writes: bool):
+        if not writes:
+            return task()
+
+        with self._lock:
+            return task()
+
+    def _deliver(self, game_id: str, on_done, result):
+        self._finish(game_id)
+        if on_done is not None:
+            on_done(result)
+
+    def _deliver_error(self, game_id: str, on_error, error: Exception):
+        self._finish(game_id)
+        logging.error("Task of game %s has failed", game_id, exc_info=error)
+        if on_error is not None:
+            on_error(error)
+
+    def _finish(self, game_id: str):
+        with self._state_lock:
+            self._pending[game_id] -= 1
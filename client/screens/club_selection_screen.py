@@ -3,6 +3,8 @@ Created December 22, 2025
 
 @author montreal91
 """
+import functools
+
 from kivy.app import App
 from kivy.metrics import dp
 from kivy.uix.button import Button
@@ -22,8 +24,9 @@ _INFO_LABEL_WIDTH = 360
 
 
 class ClubSelectionScreen(Screen):
-    def __init__(self, **kwargs):
+    def __init__(self, executor, **kwargs):
         super(ClubSelectionScreen, self).__init__(**kwargs)
+        self._executor = executor
         self._current_id = None
         self._club_infos = {}
         self._game_service = get_application_context().game_service
@@ -66,10 +69,17 @@ class ClubSelectionScreen(Screen):
         self._club_buttons = []
         self._club_infos = {}
         self._current_id = None
+        self._start_button.disabled = True
 
         query = ClubSelectionScreenQuery(game_id=GameContext.get_instance().game_name)
+        self._executor.submit(
+            query.game_id,
+            functools.partial(self._query_handler, query),
+            on_done=self._show_clubs,
+        )
 
-        for club in self._query_handler(query).club_infos:
+    def _show_clubs(self, query_result):
+        for club in query_result.club_infos:
             self._club_infos[club.club_id] = club
             button = ToggleButton(
                 text=club.club_name,
@@ -83,7 +93,6 @@ class ClubSelectionScreen(Screen):
             self._club_buttons.append(button)
 
         self._layout.center_col.add_widget(Widget())
-        self._start_button.disabled = True
         self._render_club_info(None)
 
     def _on_select(self, btn):
@@ -101,9 +110,22 @@ class ClubSelectionScreen(Screen):
             club_id=context.club_id,
         )
 
-        self._command_handler(command)
+        self.disabled = True
+        self._executor.submit(
+            command.game_id,
+            functools.partial(self._command_handler, command),
+            on_done=self._on_club_selected,
+            on_error=self._on_club_selection_failed,
+            writes=True,
+        )
+
+    def _on_club_selected(self, _):
+        self.disabled = False
         App.get_running_app().start_game()
 
+    def _on_club_selection_failed(self, _):
+        self.disabled = False
+
     def _render_club_info(self, club):
         self._layout.right_col.clear_widgets()
 
@@ -3,6 +3,8 @@ Created December 24, 2025
 
 @author montreal91
 """
+import functools
+
 from kivy.app import App
 from kivy.graphics import Color
 from kivy.graphics import Rectangle
@@ -20,9 +22,10 @@ from core.queries.day_results_query import DayResultsQuery
 
 
 class DayResultsScreen(Screen):
-    def __init__(self, day_results_query_handler, **kwargs):
+    def __init__(self, executor, day_results_query_handler, **kwargs):
         super(DayResultsScreen, self).__init__(**kwargs)
 
+        self._executor = executor
         self._day_results_query_handler = day_results_query_handler
 
         self._layout = make_three_column_layout(
@@ -46,11 +49,17 @@ class DayResultsScreen(Screen):
         self.add_widget(self._layout.root)
 
     def update(self):
-        q_res = self._day_results_query_handler(DayResultsQuery(
+        query = DayResultsQuery(
             game_id=GameContext.get_instance().game_name,
             manager_club_id=GameContext.get_instance().club_id,
-        ))
+        )
+        self._executor.submit(
+            query.game_id,
+            functools.partial(self._day_results_query_handler, query),
+            on_done=self._show_results,
+        )
 
+    def _show_results(self, q_res):
         self._layout.center_col.clear_widgets()
 
         cid = GameContext.get_instance().club_id
@@ -3,6 +3,8 @@ Created December 21, 2025
 
 @author montreal91
 """
+import functools
+
 from kivy.app import App
 from kivy.uix.button import Button
 from kivy.uix.label import Label
@@ -18,12 +20,13 @@ from client.widgets.standings_table_widget import StandingsTableWidget
 from client.widgets.upcoming_match_widget import UpcomingMatchWidget
 from core.competition import CompetitionType
 from core.ports.inbound.commands.next_day import NextDayCommand
+from core.queries.game_screen_query import GameScreenQuery
 
 
 class GameScreen(Screen):
     def __init__(
             self,
-            game_service,
+            executor,
             next_day_command_handler,
             query_handler,
             **kwargs
@@ -31,7 +34,7 @@ class GameScreen(Screen):
         super(GameScreen, self).__init__(**kwargs)
 
         self._info = None
-        self._game_service = game_service
+        self._executor = executor
         self._next_day_command_handler = next_day_command_handler
         self._query_handler = query_handler
 
@@ -139,10 +142,18 @@ class GameScreen(Screen):
         self._club_id = GameContext.get_instance().club_id
 
     def update(self):
-        info = self._game_service.get_main_screen_info(self._game_id, self._club_id)
-        gui_info = self._query_handler(self._game_id, self._club_id)
+        query = GameScreenQuery(
+            game_id=self._game_id,
+            manager_club_id=self._club_id,
+        )
+        self._executor.submit(
+            self._game_id,
+            functools.partial(self._query_handler, query),
+            on_done=self._show_info,
+        )
 
-        self._layout.title.text = info.club_name
+    def _show_info(self, gui_info):
+        self._layout.title.text = gui_info.club_name
         self._date_label.text = f"Day: {gui_info.day}"
         self._season_label.text = f"Your Season: {gui_info.season}"
         self._current_stage_label.text = f"Current Stage: {gui_info.current_competition}"
@@ -156,7 +167,21 @@ class GameScreen(Screen):
         self._update_center_widget(gui_info)
 
     def _on_next(self, _):
-        res = self._next_day_command_handler(NextDayCommand(self._game_id))
+        # The whole screen is disabled until the day is played
+        self.disabled = True
+        self._executor.submit(
+            self._game_id,
+            functools.partial(
+                self._next_day_command_handler,
+                NextDayCommand(self._game_id),
+            ),
+            on_done=self._on_next_done,
+            on_error=self._on_next_failed,
+            writes=True,
+        )
+
+    def _on_next_done(self, res):
+        self.disabled = False
 
         if res.success:
             self._error_label.text = ""
@@ -169,6 +194,11 @@ class GameScreen(Screen):
 
         self.update()
 
+    def _on_next_failed(self, error):
+        self.disabled = False
+        self._error_label.text = str(error)
+        self.update()
+
     def _on_select_player(self, _):
         self._error_label.text = ""
         App.get_running_app().switch_to_player_selection()
@@ -3,6 +3,8 @@ Created August 20, 2026
 
 @author montreal91
 """
+import functools
+
 from kivy.app import App
 from kivy.metrics import dp
 from kivy.uix.boxlayout import BoxLayout
@@ -33,11 +35,13 @@ _SKILL_ENDURANCE = "endurance"
 class LevelUpScreen(Screen):
     def __init__(
             self,
+            executor,
             query_handler,
             improve_player_skill_command_handler,
             **kwargs,
     ):
         super(LevelUpScreen, self).__init__(**kwargs)
+        self._executor = executor
         self._query_handler = query_handler
         self._improve_player_skill_command_handler = (
             improve_player_skill_command_handler
@@ -88,10 +92,17 @@ class LevelUpScreen(Screen):
         self.add_widget(self._layout.root)
 
     def update(self):
-        query_result = self._query_handler(LevelUpScreenQuery(
+        query = LevelUpScreenQuery(
             game_id=GameContext.get_instance().game_name,
             club_id=GameContext.get_instance().club_id,
-        ))
+        )
+        self._executor.submit(
+            query.game_id,
+            functools.partial(self._query_handler, query),
+            on_done=self._show_players,
+        )
+
+    def _show_players(self, query_result):
         self._players = query_result.players
         self._skill_points_by_player_id = {
             player.player_id: self._skill_points_by_player_id.get(
@@ -235,15 +246,25 @@ class LevelUpScreen(Screen):
         player = self._selected_player
         skill_points = self._get_selected_skill_points()
 
-        result = self._improve_player_skill_command_handler(
-            ImprovePlayerSkillCommand(
-                game_id=GameContext.get_instance().game_name,
-                club_id=GameContext.get_instance().club_id,
-                player_id=player.player_id,
-                skill_points=dict(skill_points),
-            ),
+        command = ImprovePlayerSkillCommand(
+            game_id=GameContext.get_instance().game_name,
+            club_id=GameContext.get_instance().club_id,
+            player_id=player.player_id,
+            skill_points=dict(skill_points),
+        )
+
+        self.disabled = True
+        self._executor.submit(
+            command.game_id,
+            functools.partial(self._improve_player_skill_command_handler, command),
+            on_done=functools.partial(self._on_submit_done, player, skill_points),
+            on_error=self._on_submit_failed,
+            writes=True,
         )
 
+    def _on_submit_done(self, player, skill_points, result):
+        self.disabled = False
+
         if result.success:
             self._apply_successful_skill_improvement(player, skill_points)
             self._skill_points_by_player_id[player.player_id] = (
@@ -256,6 +277,11 @@ class LevelUpScreen(Screen):
         self._message = result.message
         self._render_player_stats()
 
+    def _on_submit_failed(self, error):
+        self.disabled = False
+        self._message = str(error)
+        self._render_player_stats()
+
     def _apply_successful_skill_improvement(self, player, skill_points):
         updated_player = player._replace(
             technique=(
@@ -3,6 +3,8 @@ Created December 22, 2025
 
 @author montreal91
 """
+import functools
+
 from kivy.app import App
 from kivy.uix.button import Button
 from kivy.uix.label import Label
@@ -16,9 +18,10 @@ from configuration.application_context import get_application_context
 
 
 class LoadStoryScreen(Screen):
-    def __init__(self, **kwargs):
+    def __init__(self, executor, **kwargs):
         super(LoadStoryScreen, self).__init__(**kwargs)
 
+        self._executor = executor
         self._game_service = get_application_context().game_service
 
         self._saved_games_buttons = []
@@ -84,13 +87,28 @@ class LoadStoryScreen(Screen):
             print("No game is selected")
             return
 
-        GameContext.get_instance().game_name = self._selected_save
-        GameContext.get_instance().club_id = self._game_service.get_manager_club_id(
-            self._selected_save
+        # Loading a large story takes a while
+        self.disabled = True
+        self._executor.submit(
+            self._selected_save,
+            functools.partial(
+                self._game_service.get_manager_club_id,
+                self._selected_save,
+            ),
+            on_done=functools.partial(self._on_loaded, self._selected_save),
+            on_error=self._on_loading_failed,
         )
 
+    def _on_loaded(self, game_name, club_id):
+        self.disabled = False
+        GameContext.get_instance().game_name = game_name
+        GameContext.get_instance().club_id = club_id
+
         App.get_running_app().start_game()
 
+    def _on_loading_failed(self, _):
+        self.disabled = False
+
 
 def _back_to_main_screen(_):
     App.get_running_app().switch_to_main(None)
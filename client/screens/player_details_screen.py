@@ -3,6 +3,8 @@ Created August 20, 2026
 
 @author montreal91
 """
+import functools
+
 from kivy.app import App
 from kivy.metrics import dp
 from kivy.uix.boxlayout import BoxLayout
@@ -23,8 +25,9 @@ _STAT_VALUE_WIDTH = 260
 
 
 class PlayerDetailsScreen(Screen):
-    def __init__(self, query_handler, **kwargs):
+    def __init__(self, executor, query_handler, **kwargs):
         super(PlayerDetailsScreen, self).__init__(**kwargs)
+        self._executor = executor
         self._query_handler = query_handler
         self._player_id = None
 
@@ -63,11 +66,17 @@ class PlayerDetailsScreen(Screen):
             self._layout.center_col.add_widget(Widget())
             return
 
-        query_result = self._query_handler(PlayerDetailsScreenQuery(
+        query = PlayerDetailsScreenQuery(
             game_id=GameContext.get_instance().game_name,
             player_id=self._player_id,
-        ))
+        )
+        self._executor.submit(
+            query.game_id,
+            functools.partial(self._query_handler, query),
+            on_done=self._show_player,
+        )
 
+    def _show_player(self, query_result):
         if not query_result.success:
             self._layout.center_col.add_widget(make_label(
                 text=query_result.message,
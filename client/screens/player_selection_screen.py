@@ -3,6 +3,8 @@ Created December 23, 2025
 
 @author montreal91
 """
+import functools
+
 from kivy.app import App
 from kivy.uix.button import Button
 from kivy.uix.screenmanager import Screen
@@ -20,11 +22,13 @@ from core.ports.inbound.commands.select_player_for_match import SelectPlayerForM
 class PlayerSelectionScreen(Screen):
     def __init__(
             self,
+            executor,
             game_service,
             select_player_for_match_command_handler,
             **kwargs,
     ):
         super(PlayerSelectionScreen, self).__init__(**kwargs)
+        self._executor = executor
         self._game_service = game_service
         self._select_player_for_match_command_handler = select_player_for_match_command_handler
 
@@ -72,11 +76,18 @@ class PlayerSelectionScreen(Screen):
         self.add_widget(self._layout.root)
 
     def update(self):
-        info = self._game_service.get_player_selection_gui_info(
-            GameContext.get_instance().game_name,
-            GameContext.get_instance().club_id,
+        game_id = GameContext.get_instance().game_name
+        self._executor.submit(
+            game_id,
+            functools.partial(
+                self._game_service.get_player_selection_gui_info,
+                game_id,
+                GameContext.get_instance().club_id,
+            ),
+            on_done=self._show_info,
         )
 
+    def _show_info(self, info):
         self._layout.right_col.clear_widgets()
         self._layout.center_col.clear_widgets()
 
@@ -114,7 +125,17 @@ class PlayerSelectionScreen(Screen):
             club_id=GameContext.get_instance().club_id,
             player_id=self._selection_table.selected_player_id,
         )
-        self._select_player_for_match_command_handler(command)
+        self.disabled = True
+        self._executor.submit(
+            command.game_id,
+            functools.partial(self._select_player_for_match_command_handler, command),
+            on_done=self._on_submit_done,
+            on_error=self._on_submit_done,
+            writes=True,
+        )
+
+    def _on_submit_done(self, _):
+        self.disabled = False
         self.update()
 
 
@@ -3,6 +3,8 @@ Created August 17, 2026
 
 @author montreal91
 """
+import functools
+
 from kivy.app import App
 from kivy.uix.button import Button
 from kivy.uix.screenmanager import Screen
@@ -20,11 +22,13 @@ from core.queries.practice_screen_query import PracticeScreenQuery
 class PracticeScreen(Screen):
     def __init__(
             self,
+            executor,
             query_handler,
             select_coach_for_player_command_handler,
             **kwargs
     ):
         super(PracticeScreen, self).__init__(**kwargs)
+        self._executor = executor
         self._query_handler = query_handler
         self._select_coach_for_player_command_handler = select_coach_for_player_command_handler
         self._info = None
@@ -64,7 +68,14 @@ class PracticeScreen(Screen):
             game_id=GameContext.get_instance().game_name,
             manager_club_id=GameContext.get_instance().club_id,
         )
-        self._info = self._query_handler(query)
+        self._executor.submit(
+            query.game_id,
+            functools.partial(self._query_handler, query),
+            on_done=self._show_info,
+        )
+
+    def _show_info(self, info):
+        self._info = info
         self._balance_label.text = f"Balance: {self._info.balance:_}".replace("_", " ")
         self._practice_table.update(self._info.players)
 
@@ -75,7 +86,17 @@ class PracticeScreen(Screen):
             player_id=player_id,
             coach_index=coach_index,
         )
-        self._select_coach_for_player_command_handler(command)
+        self.disabled = True
+        self._executor.submit(
+            command.game_id,
+            functools.partial(self._select_coach_for_player_command_handler, command),
+            on_done=self._on_command_done,
+            on_error=self._on_command_done,
+            writes=True,
+        )
+
+    def _on_command_done(self, _):
+        self.disabled = False
         self.update()
 
 
@@ -3,6 +3,8 @@ Created August 17, 2026
 
 @author montreal91
 """
+import functools
+
 from kivy.app import App
 from kivy.uix.button import Button
 from kivy.uix.screenmanager import Screen
@@ -22,6 +24,7 @@ from core.queries.roster_management_screen_query import RosterManagementScreenQu
 class RosterManagementScreen(Screen):
     def __init__(
             self,
+            executor,
             query_handler,
             hire_new_player_command_handler,
             sign_player_command_handler,
@@ -29,6 +32,7 @@ class RosterManagementScreen(Screen):
             **kwargs
     ):
         super(RosterManagementScreen, self).__init__(**kwargs)
+        self._executor = executor
         self._query_handler = query_handler
         self._hire_new_player_command_handler = hire_new_player_command_handler
         self._sign_player_command_handler = sign_player_command_handler
@@ -83,7 +87,14 @@ class RosterManagementScreen(Screen):
             game_id=GameContext.get_instance().game_name,
             manager_club_id=GameContext.get_instance().club_id,
         )
-        self._info = self._query_handler(query)
+        self._executor.submit(
+            query.game_id,
+            functools.partial(self._query_handler, query),
+            on_done=self._show_info,
+        )
+
+    def _show_info(self, info):
+        self._info = info
         self._balance_label.text = f"Balance: {self._info.balance:_}".replace("_", " ")
         self._roster_table.update(self._info.roster)
 
@@ -93,8 +104,7 @@ class RosterManagementScreen(Screen):
             club_id=GameContext.get_instance().club_id,
         )
 
-        self._hire_new_player_command_handler(command)
-        self.update()
+        self._run_command(self._hire_new_player_command_handler, command)
 
     def _on_sign_player(self, player_id):
         command = SignPlayerCommand(
@@ -103,8 +113,7 @@ class RosterManagementScreen(Screen):
             player_id=player_id,
         )
 
-        self._sign_player_command_handler(command)
-        self.update()
+        self._run_command(self._sign_player_command_handler, command)
 
     def _on_fire_player(self, player_id):
         command = FirePlayerCommand(
@@ -112,12 +121,26 @@ class RosterManagementScreen(Screen):
             club_id=GameContext.get_instance().club_id,
             player_id=player_id,
         )
-        self._fire_player_command_handler(command)
-        self.update()
+        self._run_command(self._fire_player_command_handler, command)
 
     def _on_show_player_details(self, player_id):
         App.get_running_app().switch_to_player_details(player_id)
 
+    def _run_command(self, command_handler, command):
+        # The whole screen is disabled until the command is applied
+        self.disabled = True
+        self._executor.submit(
+            command.game_id,
+            functools.partial(command_handler, command),
+            on_done=self._on_command_done,
+            on_error=self._on_command_done,
+            writes=True,
+        )
+
+    def _on_command_done(self, _):
+        self.disabled = False
+        self.update()
+
 
 def _on_back(_):
     App.get_running_app().return_to_game()
@@ -3,6 +3,8 @@ Created December 22, 2025
 
 @author montreal91
 """
+import functools
+
 from kivy.app import App
 from kivy.uix.button import Button
 from kivy.uix.label import Label
@@ -17,8 +19,9 @@ from core.ports.inbound.commands.create_new_game import CreateNewGameCommand
 
 
 class StoryNameScreen(Screen):
-    def __init__(self, **kwargs):
+    def __init__(self, executor, **kwargs):
         super(StoryNameScreen, self).__init__(**kwargs)
+        self._executor = executor
 
         layout, root = make_default_layout("Story Name")
 
@@ -56,12 +59,28 @@ class StoryNameScreen(Screen):
             self._error_label.text = "Please type at least 3 characters"
             return
 
-        GameContext.get_instance().game_name = self._create_new_game_command(
-            CreateNewGameCommand(self._text_input.text)
-        ).game_id
+        command = CreateNewGameCommand(self._text_input.text)
+
+        # New game simulates a few seasons before it starts
+        self.disabled = True
+        self._executor.submit(
+            command.game_id,
+            functools.partial(self._create_new_game_command, command),
+            on_done=self._on_game_created,
+            on_error=self._on_game_creation_failed,
+            writes=True,
+        )
+
+    def _on_game_created(self, result):
+        self.disabled = False
+        GameContext.get_instance().game_name = result.game_id
 
         App.get_running_app().switch_to_club_selection()
 
+    def _on_game_creation_failed(self, error):
+        self.disabled = False
+        self._error_label.text = str(error)
+
 
 def _back_to_main_screen(_):
     App.get_running_app().switch_to_main(None)
@@ -5,31 +5,38 @@ Created May 11, 2024
 
 @author montreal91
 """
-import configparser
-import json
-from pathlib import Path
-from sqlite3 import connect
-from sqlite3 import Row
-
+from configuration.game_params import SHORT_GAME_CONFIG
+from configuration.game_params import load_game_params
+from core.ports.inbound.commands.fast_forward import FastForwardCommand
+from core.ports.inbound.commands.fast_forward import FastForwardCommandHandler
+from core.ports.inbound.commands.fire_player import FirePlayerCommand
 from core.ports.inbound.commands.fire_player import FirePlayerCommandHandler
+from core.ports.inbound.commands.hire_new_player import HireNewPlayerCommand
 from core.ports.inbound.commands.hire_new_player import HireNewPlayerCommandHandler
+from core.ports.inbound.commands.improve_player_skill_command import (
+    ImprovePlayerSkillCommand,
+)
 from core.ports.inbound.commands.improve_player_skill_command import (
     ImprovePlayerSkillCommandHandler,
 )
+from core.ports.inbound.commands.journal import CommandReplayer
+from core.ports.inbound.commands.journal import JournaledCommandHandler
+from core.ports.inbound.commands.next_day import NextDayCommand
 from core.ports.inbound.commands.next_day import NextDayCommandHandler
+from core.ports.inbound.commands.select_player_for_match import SelectPlayerForMatchCommand
 from core.ports.inbound.commands.select_player_for_match import SelectPlayerForMatchCommandHandler
+from core.ports.inbound.commands.sign_player import SignPlayerCommand
 from core.ports.inbound.commands.sign_player import SignPlayerCommandHandler
+from core.ports.inbound.commands.select_coach_for_player import SelectCoachForPlayerCommand
 from core.ports.inbound.commands.select_coach_for_player import SelectCoachForPlayerCommandHandler
-from core.game import GameParams
 from core.game_service import GameService
-from core.match import ExhaustionCalculator
-from core.match import DdLinearProbabilityCalculator
-from core.match import DdMatchParams
-from core.player import PlayerReputationCalculator
-from core.playoffs import DdPlayoffParams
 from core.ports.inbound.commands.create_new_game import CreateNewGameCommandHandler
+from core.ports.inbound.commands.select_club import SelectClubCommand
 from core.ports.inbound.commands.select_club import SelectClubCommandHandler
+from core.ports.outbound.command_journal import CommandJournal
 from core.ports.outbound.game_repository import GameRepository
+from core.ports.outbound.identity_map import IdentityMap
+from core.ports.outbound.match_history_repository import MatchHistoryRepository
 from core.ports.outbound.player_repository import PlayerRepository
 from core.queries.club_selection_screen_query import ClubSelectionScreenQueryHandler
 from core.queries.day_results_query import DayResultsQueryHandler
@@ -37,35 +44,88 @@ from core.queries.game_screen_query import GameScreenGuiQueryHandler
 from core.queries.level_up_screen_query import LevelUpScreenQueryHandler
 from core.queries.player_details_screen_query import PlayerDetailsScreenQueryHandler
 from core.queries.practice_screen_query import PracticeScreenQueryHandler
+from core.queries.read_model_cache import CachedQueryHandler
+from core.queries.read_model_cache import ReadModelCache
 from core.queries.roster_management_screen_query import RosterManagementScreenQueryHandler
-from core.regular_championship import ChampionshipParams
+from core.queries.season_forecast_query import SeasonForecastQueryHandler
 from core.ports.outbound.temporal_club_provider import TemporalClubProvider
+from core.ports.outbound.write_behind import FlushingCommandHandler
+from core.ports.outbound.write_behind import WriteBehindQueue
+from persistence.connection_manager import ConnectionManager
+
+# Full game snapshot is saved once in this number of days,
+# commands in between are only journaled.
+_SNAPSHOT_EVERY_DAYS = 7
 
+_READ_MODEL_CACHE_SIZE = 128
 
-def _make_db_connection(db_path):
-    db_path = Path(db_path)
-    db_path.parent.mkdir(parents=True, exist_ok=True)
+# Saves of roster and practice commands are written together once
+# in this number of seconds, or when the game advances a day.
+_WRITE_BEHIND_DELAY_SECONDS = 2.0
 
-    conn = connect(db_path)
-    conn.row_factory = Row
-    conn.execute("PRAGMA foreign_keys = ON;")
-    return conn
+
+def _make_command_replayer():
+    return CommandReplayer({
+        SelectClubCommand: SelectClubCommandHandler,
+        NextDayCommand: lambda game_repository, storage: NextDayCommandHandler(
+            game_repository,
+            storage,
+            storage,
+        ),
+        FastForwardCommand: lambda game_repository, storage: FastForwardCommandHandler(
+            game_repository,
+            storage,
+            storage,
+        ),
+        HireNewPlayerCommand: HireNewPlayerCommandHandler,
+        SignPlayerCommand: SignPlayerCommandHandler,
+        FirePlayerCommand: FirePlayerCommandHandler,
+        SelectCoachForPlayerCommand: SelectCoachForPlayerCommandHandler,
+        SelectPlayerForMatchCommand: SelectPlayerForMatchCommandHandler,
+        ImprovePlayerSkillCommand: ImprovePlayerSkillCommandHandler,
+    })
 
 
 class ApplicationContext:
     def __init__(self):
-        self._db_connection = _make_db_connection("data/duck.db")
+        self._connection_manager = ConnectionManager("data/duck.db")
+        self._db_connection = self._connection_manager.writer
+        # Queries run without the writer lock, so they read only on these
+        self._readers = self._connection_manager.readers
 
-        TemporalClubProvider.initialize(self._db_connection)
+        self._identity_map = IdentityMap()
+
+        TemporalClubProvider.initialize(
+            self._db_connection,
+            self._identity_map,
+            self._readers,
+        )
         self._temporal_club_provider = TemporalClubProvider.get_instance()
 
         self._game_repository = GameRepository(
             self._db_connection,
+            journal=CommandJournal(self._db_connection, self._readers),
+            replayer=_make_command_replayer(),
+            snapshot_every=_SNAPSHOT_EVERY_DAYS,
+            identity_map=self._identity_map,
+            reader=self._readers,
         )
         self._player_repository = PlayerRepository(
+            self._readers,
+            self._identity_map,
+        )
+        self._match_history_repository = MatchHistoryRepository(
             self._db_connection,
+            self._readers,
+        )
+        self._params = load_game_params(SHORT_GAME_CONFIG)
+        self._read_model_cache = ReadModelCache(_READ_MODEL_CACHE_SIZE)
+        self._write_behind_queue = WriteBehindQueue(
+            self._game_repository,
+            self._temporal_club_provider,
+            delay=_WRITE_BEHIND_DELAY_SECONDS,
+            lock=self._connection_manager.writer_lock,
         )
-        self._params = _get_params()
 
         self._create_game_command_handler = CreateNewGameCommandHandler(
             self._game_repository,
@@ -73,18 +133,42 @@ class ApplicationContext:
             self._temporal_club_provider,
         )
 
-        self._select_club_command_handler = SelectClubCommandHandler(
+        self._select_club_command_handler = JournaledCommandHandler(
+            SelectClubCommandHandler(
+                self._game_repository,
+                self._temporal_club_provider,
+            ),
             self._game_repository,
-            self._temporal_club_provider,
         )
 
-        self._club_selection_screen_query_handler = ClubSelectionScreenQueryHandler(
-            club_provider=self._temporal_club_provider,
+        self._club_selection_screen_query_handler = self._cached(
+            ClubSelectionScreenQueryHandler(
+                club_provider=self._temporal_club_provider,
+            ),
         )
 
-        self._next_day_command_handler = NextDayCommandHandler(
+        self._next_day_command_handler = JournaledCommandHandler(
+            FlushingCommandHandler(
+                NextDayCommandHandler(
+                    self._game_repository,
+                    self._temporal_club_provider,
+                    self._match_history_repository,
+                ),
+                self._write_behind_queue,
+            ),
+            self._game_repository,
+        )
+
+        self._fast_forward_command_handler = JournaledCommandHandler(
+            FlushingCommandHandler(
+                FastForwardCommandHandler(
+                    self._game_repository,
+                    self._temporal_club_provider,
+                    self._match_history_repository,
+                ),
+                self._write_behind_queue,
+            ),
             self._game_repository,
-            self._temporal_club_provider,
         )
 
         self._game_service = GameService(
@@ -92,60 +176,110 @@ class ApplicationContext:
             game_parameters=self._params,
         )
 
-        self._game_screen_ui_query_handler = GameScreenGuiQueryHandler(
-            self._game_repository,
-            self._temporal_club_provider,
+        self._game_screen_ui_query_handler = self._cached(
+            GameScreenGuiQueryHandler(
+                self._game_repository,
+                self._temporal_club_provider,
+                self._match_history_repository,
+            ),
         )
 
-        self._day_results_query_handler = DayResultsQueryHandler(
-            self._game_repository,
-            self._temporal_club_provider,
+        self._day_results_query_handler = self._cached(
+            DayResultsQueryHandler(
+                self._game_repository,
+                self._temporal_club_provider,
+            ),
         )
 
-        self._roster_management_screen_query_handler = RosterManagementScreenQueryHandler(
-            self._game_repository,
+        self._roster_management_screen_query_handler = self._cached(
+            RosterManagementScreenQueryHandler(
+                self._game_repository,
+            ),
         )
 
-        self._practice_screen_query_handler = PracticeScreenQueryHandler(
-            self._game_repository,
+        self._practice_screen_query_handler = self._cached(
+            PracticeScreenQueryHandler(
+                self._game_repository,
+            ),
         )
 
-        self._player_details_screen_query_handler = PlayerDetailsScreenQueryHandler(
-            self._player_repository,
+        self._player_details_screen_query_handler = self._cached(
+            PlayerDetailsScreenQueryHandler(
+                self._player_repository,
+            ),
         )
 
-        self._level_up_screen_query_handler = LevelUpScreenQueryHandler(
-            self._temporal_club_provider,
+        self._level_up_screen_query_handler = self._cached(
+            LevelUpScreenQueryHandler(
+                self._temporal_club_provider,
+            ),
         )
 
-        self._hire_new_player_command_handler = HireNewPlayerCommandHandler(
+        self._season_forecast_query_handler = self._cached(
+            SeasonForecastQueryHandler(
+                self._game_repository,
+            ),
+        )
+
+        self._hire_new_player_command_handler = JournaledCommandHandler(
+            HireNewPlayerCommandHandler(
+                self._write_behind_queue.game_repository,
+                self._write_behind_queue.club_provider,
+            ),
             self._game_repository,
-            self._temporal_club_provider,
         )
 
-        self._sign_player_command_handler = SignPlayerCommandHandler(
+        self._sign_player_command_handler = JournaledCommandHandler(
+            SignPlayerCommandHandler(
+                self._write_behind_queue.game_repository,
+                self._write_behind_queue.club_provider,
+            ),
             self._game_repository,
-            self._temporal_club_provider,
         )
 
-        self._fire_player_command_handler = FirePlayerCommandHandler(
+        self._fire_player_command_handler = JournaledCommandHandler(
+            FirePlayerCommandHandler(
+                self._write_behind_queue.game_repository,
+                self._write_behind_queue.club_provider,
+            ),
             self._game_repository,
-            self._temporal_club_provider,
         )
 
-        self._select_coach_for_player_command_handler = SelectCoachForPlayerCommandHandler(
+        self._select_coach_for_player_command_handler = JournaledCommandHandler(
+            SelectCoachForPlayerCommandHandler(
+                self._write_behind_queue.game_repository,
+                self._write_behind_queue.club_provider,
+            ),
             self._game_repository,
-            self._temporal_club_provider,
         )
 
-        self._select_player_for_match_command_handler = SelectPlayerForMatchCommandHandler(
+        self._select_player_for_match_command_handler = JournaledCommandHandler(
+            SelectPlayerForMatchCommandHandler(
+                self._write_behind_queue.game_repository,
+                self._write_behind_queue.club_provider,
+            ),
             self._game_repository,
-            self._temporal_club_provider,
         )
 
-        self._improve_player_skill_command_handler = ImprovePlayerSkillCommandHandler(
+        self._improve_player_skill_command_handler = JournaledCommandHandler(
+            ImprovePlayerSkillCommandHandler(
+                self._write_behind_queue.game_repository,
+                self._write_behind_queue.club_provider,
+            ),
+            self._game_repository,
+        )
+
+    def close(self):
+        """Writes pending saves and closes the database."""
+
+        self._write_behind_queue.close()
+        self._connection_manager.close()
+
+    def _cached(self, query_handler):
+        return CachedQueryHandler(
+            query_handler,
+            self._read_model_cache,
             self._game_repository,
-            self._temporal_club_provider,
         )
 
     @property
@@ -156,10 +290,18 @@ class ApplicationContext:
     def next_day_command_handler(self):
         return self._next_day_command_handler
 
+    @property
+    def fast_forward_command_handler(self):
+        return self._fast_forward_command_handler
+
     @property
     def game_parameters(self):
         return self._params
 
+    @property
+    def writer_lock(self):
+        return self._connection_manager.writer_lock
+
     @property
     def create_game_command_handler(self):
         return self._create_game_command_handler
@@ -196,6 +338,10 @@ class ApplicationContext:
     def level_up_screen_query_handler(self):
         return self._level_up_screen_query_handler
 
+    @property
+    def season_forecast_query_handler(self):
+        return self._season_forecast_query_handler
+
     @property
     def hire_new_player_command_handler(self):
         return self._hire_new_player_command_handler
@@ -221,53 +367,6 @@ class ApplicationContext:
         return self._improve_player_skill_command_handler
 
 
-def _get_params() -> GameParams:
-    path = "configuration/short.ini"
-    config = configparser.ConfigParser()
-    config.read(path)
-    match_params = DdMatchParams(
-        games_to_win=config["match"].getint("games_to_win", 0),
-        sets_to_win=config["match"].getint("sets_to_win", 0),
-        exhaustion_function=ExhaustionCalculator(
-            config["match"].getint("exhaustion_coefficient", 0)
-        ),
-        reputation_function=PlayerReputationCalculator(
-            config["match"].getint("games_to_win", 0),
-            config["match"].getint("reputation_coefficient", 0)
-        ),
-        probability_function=DdLinearProbabilityCalculator(
-            config["match"].getfloat("probability_coefficient", 0.0)
-        ),
-    )
-
-    championship_params = ChampionshipParams(
-        match_params=match_params,
-        recovery_day=config["championship"].getint("recovery_day", 0),
-        rounds=config["championship"].getint("rounds", 0),
-        match_importance=config["championship"].getint(
-            "match_importance", 0
-        ),
-    )
-    playoff_params = DdPlayoffParams(
-        series_matches_pattern=(
-            True, True, False, False, True, False, True,
-        ),
-        match_params=match_params,
-        length=config["playoff"].getint("length", 0),
-        gap_days=config["playoff"].getint("gap_days", 0),
-        match_importance=config["playoff"].getint("match_importance", 0),
-    )
-    return GameParams(
-        championship_params=championship_params,
-        playoff_params=playoff_params,
-        contracts=json.loads(config.get("game", "contracts")),
-        exhaustion_factor=config["game"].getint("exhaustion_factor", 0),
-        is_hard=config["game"].getboolean("is_hard", True),
-        training_coefficient=config["game"].getint("training_coefficient", 0),
-        years_to_simulate=config["game"].getint("years_to_simulate", 0),
-    )
-
-
 _ac = ApplicationContext()
 
 
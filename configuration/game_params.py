@@ -0,0 +1,72 @@
+"""
+Loading of game parameters from ini files.
+
+Kept apart from the application context, so the game can be set up without
+a database or the GUI.
+
+Created October 18, 2026
+
+@author montreal91
+"""
+import configparser
+import json
+
+from core.game import GameParams
+from core.match import DdLinearProbabilityCalculator
+from core.match import DdMatchParams
+from core.match import ExhaustionCalculator
+from core.player import PlayerReputationCalculator
+from core.playoffs import DdPlayoffParams
+from core.regular_championship import ChampionshipParams
+
+SHORT_GAME_CONFIG = "configuration/short.ini"
+LONG_GAME_CONFIG = "configuration/long.ini"
+
+
+def load_game_params(path: str = SHORT_GAME_CONFIG) -> GameParams:
+    config = configparser.ConfigParser()
+    if not config.read(path):
+        raise FileNotFoundError(f"Config file not found: {path}")
+
+    match_params = DdMatchParams(
+        games_to_win=config["match"].getint("games_to_win", 0),
+        sets_to_win=config["match"].getint("sets_to_win", 0),
+        exhaustion_function=ExhaustionCalculator(
+            config["match"].getint("exhaustion_coefficient", 0)
+        ),
+        reputation_function=PlayerReputationCalculator(
+            config["match"].getint("games_to_win", 0),
+            config["match"].getint("reputation_coefficient", 0)
+        ),
+        probability_function=DdLinearProbabilityCalculator(
+            config["match"].getfloat("probability_coefficient", 0.0)
+        ),
+        use_batch_engine=config["match"].getboolean("batch_engine", False),
+    )
+
+    championship_params = ChampionshipParams(
+        match_params=match_params,
+        recovery_day=config["championship"].getint("recovery_day", 0),
+        rounds=config["championship"].getint("rounds", 0),
+        match_importance=config["championship"].getint(
+            "match_importance", 0
+        ),
+    )
+    playoff_params = DdPlayoffParams(
+        series_matches_pattern=(
+            True, True, False, False, True, False, True,
+        ),
+        match_params=match_params,
+        length=config["playoff"].getint("length", 0),
+        gap_days=config["playoff"].getint("gap_days", 0),
+        match_importance=config["playoff"].getint("match_importance", 0),
+    )
+    return GameParams(
+        championship_params=championship_params,
+        playoff_params=playoff_params,
+        contracts=json.loads(config.get("game", "contracts")),
+        exhaustion_factor=config["game"].getint("exhaustion_factor", 0),
+        is_hard=config["game"].getboolean("is_hard", True),
+        training_coefficient=config["game"].getint("training_coefficient", 0),
+        years_to_simulate=config["game"].getint("years_to_simulate", 0),
+    )
@@ -0,0 +1,246 @@
+"""
+Vectorized match engine.
+
+Created October 18, 2026
+
+@author montreal91
+"""
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+
+from core.match import DdMatchParams
+from core.match import DdMatchResult
+from core.match import DdSetResult
+from core.match import DdSetStatuses
+from core.match import MatchEngine
+from core.match import update_player_stats
+from core.player import Player
+
+PlayerPair = Tuple[Player, Player]
+
+_HOME = 0
+_AWAY = 1
+
+# Mirror Player.calculate_actual_technique
+_MIN_TECHNIQUE_FACTOR = 0.1
+_PRECISION = 1
+
+
+class BatchMatchEngine:
+    """
+    Plays all matches of a schedule day together.
+
+    Every step of the main loop plays one game in each unfinished match, so
+    the interpreter overhead is paid per step and not per game of every
+    match. Rules and player side effects are the same as in MatchEngine.
+    """
+
+    _GAP: int = MatchEngine._GAP
+    _STAMINA_LOST_IN_GAME: int = MatchEngine._STAMINA_LOST_IN_GAME
+
+    _params: DdMatchParams
+    _rng: np.random.Generator
+
+    def __init__(
+            self,
+            params: DdMatchParams,
+            rng: Optional[np.random.Generator] = None,
+    ):
+        self._params = params
+        self._rng = np.random.default_rng() if rng is None else rng
+
+    def process_matches(
+            self,
+            pairs: Sequence[PlayerPair],
+    ) -> List[DdMatchResult]:
+        """
+        Processes matches of (home, away) pairs and returns their results.
+
+        Results are in the same order as pairs.
+        """
+
+        results = [DdMatchResult(self._params.sets_to_win) for _ in pairs]
+        if not pairs:
+            return results
+
+        for result, (home_player, away_player) in zip(results, pairs):
+            result.home_player_snapshot = home_player.json
+            result.away_player_snapshot = away_player.json
+
+        technique = _pairs_to_array(pairs, lambda p: p.technique)
+        max_stamina = _pairs_to_array(pairs, lambda p: p.max_stamina)
+        stamina = _pairs_to_array(pairs, lambda p: p.current_stamina)
+
+        # Both players lose the same amount of stamina in every game,
+        # so a single counter per match is enough.
+        lost_stamina = np.zeros(len(pairs), dtype=int)
+        games = np.zeros((len(pairs), 2), dtype=int)
+        sets_won = np.zeros((len(pairs), 2), dtype=int)
+        sets_played = [0 for _ in pairs]
+
+        active = np.arange(len(pairs))
+        probability_function = self._vectorized_probability_function
+
+        while active.size > 0:
+            skill = _calculate_actual_skill(
+                technique[active],
+                max_stamina[active],
+                stamina[active] - lost_stamina[active, None],
+            )
+
+            retired = (skill == 0).any(axis=1)
+            for pos in np.flatnonzero(retired):
+                match = active[pos]
+                if skill[pos, _HOME] == 0:
+                    status, winner = DdSetStatuses.HOME_RETIRED, _AWAY
+                else:
+                    status, winner = DdSetStatuses.AWAY_RETIRED, _HOME
+                self._close_set(match, status, games, pairs, results, sets_played)
+
+                # Retirement gives the whole match to the opponent.
+                sets_won[match] = 0
+                sets_won[match, winner] = self._params.sets_to_win
+                self._finish_match(
+                    match, lost_stamina, sets_won, pairs, results, sets_played
+                )
+
+            if retired.any():
+                active = active[~retired]
+                skill = skill[~retired]
+
+            if active.size == 0:
+                break
+
+            probability = probability_function(skill[:, _HOME], skill[:, _AWAY])
+            home_won = self._rng.random(active.size) < probability
+
+            games[active, _HOME] += home_won
+            games[active, _AWAY] += ~home_won
+            lost_stamina[active] += self._STAMINA_LOST_IN_GAME
+
+            played = games[active]
+            set_over = (
+                (played >= self._params.games_to_win)
+                & (played - played[:, ::-1] >= self._GAP)
+            ).any(axis=1)
+
+            if not set_over.any():
+                continue
+
+            finished_sets = active[set_over]
+            home_won_set = (
+                games[finished_sets, _HOME] > games[finished_sets, _AWAY]
+            )
+            sets_won[finished_sets, _HOME] += home_won_set
+            sets_won[finished_sets, _AWAY] += ~home_won_set
+
+            for match in finished_sets:
+                self._close_set(
+                    match,
+                    DdSetStatuses.REGULAR,
+                    games,
+                    pairs,
+                    results,
+                    sets_played,
+                )
+
+            sets_to_win = self._params.sets_to_win
+            match_over = sets_won[active].max(axis=1) >= sets_to_win
+            for match in active[match_over]:
+                self._finish_match(
+                    match, lost_stamina, sets_won, pairs, results, sets_played
+                )
+
+            active = active[~match_over]
+
+        return results
+
+    @property
+    def _vectorized_probability_function(self) -> Callable:
+        function = self._params.probability_function
+        batch = getattr(function, "batch", None)
+        if batch is not None:
+            return batch
+        return np.vectorize(function, otypes=[float])
+
+    def _close_set(
+            self,
+            match: int,
+            status: DdSetStatuses,
+            games: np.ndarray,
+            pairs: Sequence[PlayerPair],
+            results: List[DdMatchResult],
+            sets_played: List[int],
+    ):
+        set_result = DdSetResult(
+            home_games=int(games[match, _HOME]),
+            away_games=int(games[match, _AWAY]),
+            set_status=status,
+        )
+        results[match].AddSetResult(set_result)
+        sets_played[match] += 1
+        games[match] = 0
+
+        home_player, away_player = pairs[match]
+        reputation_function = self._params.reputation_function
+        home_player.AddReputation(
+            reputation_function(set_result.home_games) * sets_played[match]
+        )
+        away_player.AddReputation(
+            reputation_function(set_result.away_games) * sets_played[match]
+        )
+
+    def _finish_match(
+            self,
+            match: int,
+            lost_stamina: np.ndarray,
+            sets_won: np.ndarray,
+            pairs: Sequence[PlayerPair],
+            results: List[DdMatchResult],
+            sets_played: List[int],
+    ):
+        result = results[match]
+        home_player, away_player = pairs[match]
+
+        home_player.add_experience(result.home_exp)
+        away_player.add_experience(result.away_exp)
+
+        home_player.RemoveStaminaLostInMatch(int(lost_stamina[match]))
+        away_player.RemoveStaminaLostInMatch(int(lost_stamina[match]))
+
+        exhaustion = self._params.exhaustion_function(sets_played[match])
+
+        home_player.AddExhaustion(exhaustion)
+        away_player.AddExhaustion(exhaustion)
+
+        home_sets = int(sets_won[match, _HOME])
+        away_sets = int(sets_won[match, _AWAY])
+        update_player_stats(home_player, home_sets, away_sets, is_home=True)
+        update_player_stats(away_player, home_sets, away_sets, is_home=False)
+
+
+def _calculate_actual_skill(
+        technique: np.ndarray,
+        max_stamina: np.ndarray,
+        actual_stamina: np.ndarray,
+) -> np.ndarray:
+    skill = np.maximum(
+        technique * (actual_stamina / max_stamina),
+        technique * _MIN_TECHNIQUE_FACTOR,
+    )
+    return skill.round(_PRECISION)
+
+
+def _pairs_to_array(
+        pairs: Sequence[PlayerPair],
+        getter: Callable[[Player], float],
+) -> np.ndarray:
+    return np.array(
+        [(getter(home), getter(away)) for home, away in pairs],
+        dtype=float,
+    )
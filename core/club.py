@@ -17,15 +17,25 @@ from core.player import Player
 from core.player import player_model_comparator
 from core.serialization import DdField
 from core.serialization import Jsonable
+from core.serialization import Slotted
 
 
-class ClubPlayerSlot(Jsonable):
+class ClubPlayerSlot(Jsonable, Slotted):
     """A passive data structure to store player-related data."""
 
+    __slots__ = (
+        "player",
+        "coach_level",
+        "contract_cost",
+        "has_next_contract",
+        "is_selected",
+    )
+
     player: Optional[Player]
     coach_level: int
     contract_cost: int
     has_next_contract: bool
+    is_selected: bool
 
     _FIELD_MAP = (
         DdField("player", "player"),
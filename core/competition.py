@@ -4,19 +4,20 @@ Created May 20, 2019
 
 @author montreal91
 """
-from copy import copy
 from enum import Enum
-from itertools import chain
 from typing import Any
 from typing import Dict
-from typing import Generator
 from typing import List
+from typing import NamedTuple
 from typing import Optional
 
+from core.batch_match import BatchMatchEngine
 from core.club import Club
 from core.match import MatchEngine
 from core.match import DdMatchResult
 from core.match import DdScheduledMatchStruct
+from core.rng import GameRng
+from core.rng import ensure_rng
 
 
 ScheduleDay = List[DdScheduledMatchStruct]
@@ -27,6 +28,22 @@ class CompetitionType(Enum):
     PLAY_OFFS = "play_offs"
 
 
+class Fixture(NamedTuple):
+    """A scheduled match as seen by one of the clubs."""
+
+    day: int
+    match: DdScheduledMatchStruct
+    is_home: bool
+
+    @property
+    def opponent_pk(self) -> str:
+        return self.match.away_pk if self.is_home else self.match.home_pk
+
+    @property
+    def is_played(self) -> bool:
+        return self.match.is_played
+
+
 class DdAbstractCompetition:
     """Abstract competition class."""
 
@@ -34,14 +51,21 @@ class DdAbstractCompetition:
     _schedule: List[Optional[ScheduleDay]]
     _day: int
     _params: Any
-    _results: List[List[DdMatchResult]]
+    # Fixtures of every club by day. It's not pickled, and None means
+    # that it has to be built from the schedule again.
+    _fixtures: Optional[Dict[str, Dict[int, Fixture]]] = None
 
     def __init__(self, clubs: Dict[str, Club], params: Any):
         self._clubs = clubs
         self._day = 0
         self._params = params
-        self._results = []
         self._schedule = []
+        self._fixtures = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_fixtures", None)
+        return state
 
     @property
     def current_matches(self) -> Optional[ScheduleDay]:
@@ -67,17 +91,6 @@ class DdAbstractCompetition:
         """Returns an importance factor of current matches."""
         return -1
 
-    @property
-    def results_(self) -> Generator[List[DdMatchResult], None, None]:
-        """
-        List of match results.
-
-        Actually, this method is present here for testing purposes and should
-        not be used for production.
-        """
-        for match in chain(*self._results):
-            yield copy(match)
-
     @property
     def standings(self) -> List[Any]:
         """List of current standings."""
@@ -88,28 +101,102 @@ class DdAbstractCompetition:
         """Title of the competition."""
         return ""
 
+    def get_club_fixtures(self, club_pk: str) -> List[Fixture]:
+        """Fixtures of a club which are not played yet, in order of days."""
+
+        return [
+            fixture for fixture in self._get_club_fixtures(club_pk).values()
+            if not fixture.is_played
+        ]
+
     def get_club_schedule(self, club_pk: str) -> List[DdScheduledMatchStruct]:
         """List of matches scheduled for a club."""
 
-        schedule = []
-        for day in self._schedule:
-            if day is None:
-                continue
-            for match in day:
-                if match.is_played:
-                    continue
-                if club_pk in (match.home_pk, match.away_pk):
-                    schedule.append(match)
-        return schedule
+        return [fixture.match for fixture in self.get_club_fixtures(club_pk)]
+
+    def get_current_match(self, club_pk: str) -> Optional[DdScheduledMatchStruct]:
+        """Match of a club scheduled for the current day, if any."""
+
+        fixture = self._get_club_fixtures(club_pk).get(self._day)
+        if fixture is None or fixture.is_played:
+            return None
+        return fixture.match
 
     def get_club_fame(self, club_pk: str) -> int:
         """Fame earned by club in the competition."""
 
-    def update(self) -> List[DdMatchResult]:
-        """Updates the state of the competition."""
+    def update(self, rng: Optional[GameRng] = None) -> List[DdMatchResult]:
+        """
+        Updates the state of the competition.
+
+        Matches of the day draw from their own child streams of rng.
+        """
 
-    def _make_match_processor(self) -> MatchEngine:
-        return MatchEngine(self._params.match_params)
+    def _add_schedule_day(self, day: Optional[ScheduleDay]):
+        """Appends a day to the schedule, None is a day without matches."""
+
+        self._schedule.append(day)
+        if self._fixtures is not None:
+            self._index_day(len(self._schedule) - 1, day)
+
+    def _get_club_fixtures(self, club_pk: str) -> Dict[int, Fixture]:
+        if self._fixtures is None:
+            self._fixtures = {}
+            for day_index, day in enumerate(self._schedule):
+                self._index_day(day_index, day)
+        return self._fixtures.get(club_pk, {})
+
+    def _index_day(self, day_index: int, day: Optional[ScheduleDay]):
+        for match in day or []:
+            self._fixtures.setdefault(match.home_pk, {})[day_index] = Fixture(
+                day=day_index,
+                match=match,
+                is_home=True,
+            )
+            self._fixtures.setdefault(match.away_pk, {})[day_index] = Fixture(
+                day=day_index,
+                match=match,
+                is_home=False,
+            )
+
+    def _make_match_processor(self, rng: GameRng) -> MatchEngine:
+        return MatchEngine(self._params.match_params, rng=rng)
+
+    def _play_matches(
+            self,
+            matches: ScheduleDay,
+            rng: Optional[GameRng],
+    ) -> List[DdMatchResult]:
+        """Plays scheduled matches and marks them as played."""
+
+        rng = ensure_rng(rng)
+
+        pairs = [
+            (
+                self._clubs[match.home_pk].selected_player,
+                self._clubs[match.away_pk].selected_player,
+            )
+            for match in matches
+        ]
+
+        if self._params.match_params.use_batch_engine:
+            engine = BatchMatchEngine(
+                self._params.match_params,
+                rng=rng.spawn_numpy(),
+            )
+            day_results = engine.process_matches(pairs)
+        else:
+            day_results = [
+                self._make_match_processor(rng.spawn()).process_match(*pair)
+                for pair in pairs
+            ]
+
+        for match, res in zip(matches, day_results):
+            match.is_played = True
+
+            res.home_pk = match.home_pk
+            res.away_pk = match.away_pk
+        return day_results
 
     def _make_schedule(self):
         pass
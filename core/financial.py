@@ -5,6 +5,8 @@ Created Jun 17, 2019
 @author montreal91
 """
 
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import NamedTuple
 from typing import Tuple
@@ -20,23 +22,57 @@ class DdTransaction(NamedTuple):
         return f"<[{id(self)}] {self.value} {self.comment:70}>"
 
 
+class DdRetentionPolicy(NamedTuple):
+    """
+    Named Tuple to store how much of the account history is kept.
+
+    The latest keep_latest transactions are always kept as they are. Older
+    ones are rolled into summary entries, one per period_length transactions.
+    When there are more than max_periods summaries, the oldest two are merged.
+    """
+
+    keep_latest: int = 50
+    period_length: int = 50
+    max_periods: int = 10
+
+
 class DdFinancialAccount:
     """
     Financial account.
 
     Balance can't become negative.
+    Balance is kept up to date with every transaction, and the history is
+    compacted according to the retention policy, so neither balance checks
+    nor the size of the account grow over time.
     """
 
     _transactions: List[DdTransaction]
+    _balance: int
+    _policy: DdRetentionPolicy
+    # Summary entries always go first in the list of transactions
+    _summaries: int
 
-    def __init__(self):
+    def __init__(self, policy: DdRetentionPolicy = DdRetentionPolicy()):
         self._transactions = []
+        self._balance = 0
+        self._policy = policy
+        self._summaries = 0
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+
+        # Accounts saved before the ledger kept every transaction
+        if "_balance" not in state:
+            self._balance = sum(t.value for t in self._transactions)
+            self._policy = DdRetentionPolicy()
+            self._summaries = 0
+            self._compact()
 
     @property
     def balance(self):
-        """Calculates balance of the account."""
+        """Current balance of the account."""
 
-        return sum(transaction.value for transaction in self._transactions)
+        return self._balance
 
     def GetLatestTransactions(self, n):
         """Returns n latest transactions.
@@ -50,6 +86,7 @@ class DdFinancialAccount:
 
         new_transaction = DdTransaction(value=self.balance, comment=comment)
         self._transactions = [new_transaction]
+        self._summaries = 0
 
     def ProcessTransaction(self, transaction: DdTransaction) -> bool:
         """
@@ -62,8 +99,33 @@ class DdFinancialAccount:
         if transaction.value < 0 and abs(transaction.value) > self.balance:
             return False
         self._transactions.append(transaction)
+        self._balance += transaction.value
+        self._compact()
         return True
 
+    def _compact(self):
+        policy = self._policy
+        limit = policy.keep_latest + policy.period_length
+
+        while len(self._transactions) - self._summaries >= limit:
+            start = self._summaries
+            end = start + policy.period_length
+            period = self._transactions[start:end]
+
+            self._transactions[start:end] = [DdTransaction(
+                value=sum(t.value for t in period),
+                comment=f"Summary of {len(period)} transactions",
+            )]
+            self._summaries += 1
+
+        while self._summaries > policy.max_periods:
+            first, second = self._transactions[:2]
+            self._transactions[:2] = [DdTransaction(
+                value=first.value + second.value,
+                comment="Summary of earlier transactions",
+            )]
+            self._summaries -= 1
+
 
 class DdQuadraticContractCalculator:
     """
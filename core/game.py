@@ -9,7 +9,7 @@ Created Apr 09, 2019
 """
 import logging
 import time
-from random import randint
+from functools import cached_property
 from typing import Any
 from typing import Callable
 from typing import Dict
@@ -30,6 +30,8 @@ from core.financial import DdTransaction
 from core.match import DdMatchResult
 from core.match import DdScheduledMatchStruct
 from core.match import DdStandingsRowStruct
+from core.phase_timer import NULL_PHASE_TIMER
+from core.phase_timer import Phase
 from core.player import ExhaustedLinearRecovery
 from core.player import Player
 from core.player import PlayerFactory
@@ -37,6 +39,7 @@ from core.playoffs import DdPlayoff
 from core.playoffs import DdPlayoffParams
 from core.regular_championship import ChampionshipParams
 from core.regular_championship import RegularChampionship
+from core.rng import GameRng
 from core.ports.outbound.temporal_club_provider import TemporalClubProvider
 from core.skill_upgrade_system import upgrade_skills
 
@@ -62,6 +65,18 @@ class GameParams(NamedTuple):
     years_to_simulate: int
 
 
+class MatchDay(NamedTuple):
+    """When matches of a single day were played."""
+
+    # Seasons are counted from one
+    season: int
+    competition_type: CompetitionType
+    day: int
+
+    # Clubs of a championship in the order that breaks ties in the standings
+    club_order: Tuple[str, ...] = ()
+
+
 class OpponentDto:
     """Passive class to store information about opponent for the next match."""
     club_name: str
@@ -69,6 +84,86 @@ class OpponentDto:
     fame: Optional[int]
 
 
+class GameContext:
+    """
+    Information about the game available for the user.
+
+    Every field is computed on the first access and then kept, so a context
+    is meant to live no longer than a single request.
+    """
+
+    def __init__(self, game: "Game", club_id: str):
+        self._game = game
+        self._club = game.clubs[club_id]
+        self._club_id = club_id
+
+    @cached_property
+    def balance(self) -> int:
+        return self._club.account.balance
+
+    @cached_property
+    def club_name(self) -> str:
+        return self._club.name
+
+    @cached_property
+    def day(self) -> int:
+        return self._game.competition.day
+
+    @cached_property
+    def clubs(self) -> List[str]:
+        return [club.name for club in self._game.clubs.values()]
+
+    @cached_property
+    def free_agents(self) -> List[Tuple[Player, int]]:
+        return self._game._get_free_agents()
+
+    @cached_property
+    def history(self) -> List[Dict[CompetitionType, Any]]:
+        return self._game.history
+
+    @cached_property
+    def last_results(self) -> List[DdMatchResult]:
+        return self._game._last_results
+
+    @cached_property
+    def opponent(self) -> Optional[OpponentDto]:
+        return self._game._get_opponent(self._club_id)
+
+    @cached_property
+    def practice_cost(self) -> int:
+        return self._game._calculate_club_practice_cost(club=self._club)
+
+    @cached_property
+    def remaining_matches(self) -> List[DdScheduledMatchStruct]:
+        return self._game.competition.get_club_schedule(self._club_id)
+
+    @cached_property
+    def standings(self) -> List[DdStandingsRowStruct]:
+        return self._game._standings
+
+    @cached_property
+    def title(self) -> str:
+        return self._game.competition.title
+
+    @cached_property
+    def user_players(self) -> List[ClubPlayerSlot]:
+        """Players of the club with contract prices for the next season."""
+
+        return self._game._get_user_players(self._club_id)
+
+    @cached_property
+    def competition(self) -> str:
+        return self._game.competition.title
+
+    @cached_property
+    def competition_type(self) -> CompetitionType:
+        return self._game._competition_type
+
+    @cached_property
+    def has_matches(self) -> bool:
+        return self._game._has_matches()
+
+
 logging.basicConfig(
     level=logging.DEBUG,
     format='%(asctime)s - %(levelname)s - %(message)s',  # Define the log message format
@@ -95,7 +190,12 @@ class Game:
     _player_factory: PlayerFactory
     _season_fame: Dict[str, int]
     _results: List[DdMatchResult]
+    # Class-level default for games saved before match days were tracked
+    _last_match_day: Optional[MatchDay] = None
+    _days_played: int = 0
     _practice_calculator: DdPracticeCalculator
+    # Class-level default for games saved before they had own random stream
+    _rng: Optional[GameRng] = None
 
     def __init__(
             self,
@@ -103,8 +203,10 @@ class Game:
             game_id: str,
             created_ts: int,
             updated_ts: int,
+            seed: Optional[int] = None,
     ):
         self._game_id = game_id
+        self._rng = GameRng(seed)
         self._manager_club_id = None
         self._free_agents = []
         self._history = [{}]
@@ -128,7 +230,8 @@ class Game:
 
         self._competition = RegularChampionship(
             clubs,
-            self._params.championship_params
+            self._params.championship_params,
+            self.rng,
         )
 
         self._simulate(self._params.years_to_simulate)
@@ -138,6 +241,25 @@ class Game:
     def day(self):
         return self._competition.day
 
+    @property
+    def rng(self) -> GameRng:
+        """
+        Random stream of the game.
+
+        Every random draw of the game comes from it, so the same stream
+        state and the same commands give the same game.
+        """
+
+        if self._rng is None:
+            self._rng = GameRng(f"{self._game_id}:{self._days_played}")
+        return self._rng
+
+    @property
+    def days_played(self) -> int:
+        """Number of days played since the game was created."""
+
+        return self._days_played
+
     @property
     def competition(self):
         return self._competition
@@ -154,6 +276,35 @@ class Game:
     def manager_club_id(self):
         return self._manager_club_id
 
+    @property
+    def last_match_day(self) -> Optional[MatchDay]:
+        """When the latest results were played."""
+
+        return self._last_match_day
+
+    @property
+    def next_match_day(self) -> MatchDay:
+        """When the matches of the next update are played."""
+
+        return MatchDay(
+            season=len(self._history),
+            competition_type=self._competition_type,
+            day=self._competition.day,
+            club_order=self._get_club_order(),
+        )
+
+    @property
+    def last_results(self) -> List[DdMatchResult]:
+        """Results of matches played during the latest update."""
+
+        return self._last_results
+
+    @property
+    def history(self) -> List[Dict[CompetitionType, Any]]:
+        """Results of the finished competitions, one dict per season."""
+
+        return self._history
+
     @property
     def is_over(self) -> bool:
         """Indicates if game is over."""
@@ -188,6 +339,16 @@ class Game:
 
         self._competition._clubs = clubs
 
+    def detach_manager(self):
+        """
+        Hands the manager's club over to the AI.
+
+        Meant for simulations that work on a copy of the game and should not
+        stop to wait for user decisions.
+        """
+
+        self._manager_club_id = None
+
     def fire_player(self, player_id: str, club_id: str):
         """Fires the selected player from user's club."""
 
@@ -198,35 +359,16 @@ class Game:
         )
 
         player = self._clubs[club_id].pop_player(player_id)
-        player.has_next_contract = False
         player.RecoverStamina(player.max_stamina)
 
         self._free_agents.append(player)
 
-    def get_context(self, pk: str) -> Dict[str, Any]:
-        """A dictionary with information available for user."""
+    def get_context(self, pk: str) -> GameContext:
+        """Information available for the user, computed on demand."""
 
         assert pk in self._clubs, _CLUB_ID_ERROR
 
-        # TODO: Replace this dict with a NamedTuple class
-        return dict(
-            balance=self._clubs[pk].account.balance,
-            club_name=self._clubs[pk].name,
-            day=self._competition.day,
-            clubs=[club.name for club in self._clubs.values()],
-            free_agents=self._get_free_agents(),
-            history=self._history,
-            last_results=self._last_results,
-            opponent=self._get_opponent(pk),
-            practice_cost=self._calculate_club_practice_cost(club=self._clubs[pk]),
-            remaining_matches=self._competition.get_club_schedule(pk),
-            standings=self._standings,
-            title=self._competition.title,
-            user_players=self._get_user_players(pk),
-            competition=self._competition.title,
-            competition_type=self._competition_type,
-            has_matches=self._has_matches(),
-        )
+        return GameContext(self, pk)
 
     def hire_free_agent(self, club_pk: str, player_pk: int):
         """Hires a free agent for the given club."""
@@ -245,6 +387,7 @@ class Game:
         player = self._player_factory.create_player(
             level=0,
             age=GameplayConstants.STARTING_AGE.value,
+            rng=self.rng,
         )
         self._process_player_hire(club_pk=club_id, player=player)
 
@@ -322,12 +465,13 @@ class Game:
 
         return True, "Ok"
 
-    def update(self):
+    def update(self, phase_timer=NULL_PHASE_TIMER):
         """
         Updates game state.
 
         Proceeds to the next day if possible.
         All scheduled matches are performed.
+        Time spent in every phase of the day is added to phase_timer.
         """
 
         for club_pk in self._clubs:
@@ -346,15 +490,19 @@ class Game:
         if not self._training_check:
             return False, "You have insufficient funds to perform such kind of training."
 
-        self._perform_practice()
-        self._play_one_day()
+        with phase_timer.phase(Phase.PRACTICE):
+            self._perform_practice()
 
-        upgrade_skills(
-            clubs=self._clubs,
-            manager_club_id=self._manager_club_id,
-        )
+        self._play_one_day(phase_timer)
+
+        with phase_timer.phase(Phase.SKILL_UPGRADES):
+            upgrade_skills(
+                clubs=self._clubs,
+                manager_club_id=self._manager_club_id,
+            )
 
         self._unselect()
+        self._days_played += 1
 
         if self.season_over:
             self._update_season_fame()
@@ -398,14 +546,11 @@ class Game:
 
     @property
     def _decision_required(self) -> bool:
-        if self._competition.current_matches is None:
+        if self._manager_club_id is None:
             return False
-        for match in self._competition.current_matches:
-            if self._manager_club_id not in (match.home_pk, match.away_pk):
-                continue
-            if not self._clubs[self._manager_club_id].has_selected_player:
-                return True
-        return False
+        if self._competition.get_current_match(self._manager_club_id) is None:
+            return False
+        return not self._clubs[self._manager_club_id].has_selected_player
 
     @property
     def _last_results(self) -> List[DdMatchResult]:
@@ -476,13 +621,14 @@ class Game:
 
     def _generate_free_agents(self):
         new_agents = []
-        for _ in range(randint(3, 10)):
+        for _ in range(self.rng.randint(3, 10)):
             new_agents.append(self._player_factory.create_player(
-                age=randint(
+                age=self.rng.randint(
                     GameplayConstants.STARTING_AGE.value,
                     GameplayConstants.RETIREMENT_AGE.value - 1
                 ),
-                level=randint(1, 10),
+                level=self.rng.randint(1, 10),
+                rng=self.rng,
             ))
         new_agents.sort(
             key=lambda x: x.level,
@@ -497,24 +643,12 @@ class Game:
         return res
 
     def _get_opponent(self, pk: str) -> Optional[OpponentDto]:
-        def schedule_filter(pair: DdScheduledMatchStruct):
-            if pair.home_pk == pk:
-                return True
-            return pair.away_pk == pk
-
         if self._competition.is_over:
             return None
 
-        schedule = self._competition.current_matches
-
-        # Just in case
-        if schedule is None:
+        actual_match = self._competition.get_current_match(pk)
+        if actual_match is None:
             return None
-        planned_match = [pair for pair in schedule if schedule_filter(pair)]
-
-        if not planned_match:
-            return None
-        actual_match = planned_match[0]
         if actual_match.home_pk == pk:
             # Home case
             res = OpponentDto()
@@ -549,6 +683,7 @@ class Game:
                 new_player = self._player_factory.create_player(
                     level=0,
                     age=GameplayConstants.STARTING_AGE.value,
+                    rng=self.rng,
                 )
                 club.add_player(new_player)
 
@@ -590,7 +725,8 @@ class Game:
 
             club.add_player(self._player_factory.create_player(
                 age=GameplayConstants.STARTING_AGE.value,
-                level=randint(5, 10),
+                level=self.rng.randint(5, 10),
+                rng=self.rng,
             ))
 
         self._generate_free_agents()
@@ -598,7 +734,8 @@ class Game:
         self._shuffle_coach_powers()
         self._competition = RegularChampionship(
             self._clubs,
-            self._params.championship_params
+            self._params.championship_params,
+            self.rng,
         )
         self._history.append({})
 
@@ -614,17 +751,28 @@ class Game:
                 ))
             club.perform_practice()
 
-    def _play_one_day(self):
+    def _play_one_day(self, phase_timer):
         current_matches = self._competition.current_matches
         playing_player_ids = self._get_playing_player_ids(current_matches)
 
-        self._results = self._competition.update()
-        self._calculate_match_income()
+        self._last_match_day = self.next_match_day
+
+        with phase_timer.phase(Phase.MATCHES):
+            # Every day plays from its own child stream
+            self._results = self._competition.update(self.rng.spawn())
+            self._calculate_match_income()
 
-        self._recover(excluded_player_ids=playing_player_ids)
+        with phase_timer.phase(Phase.RECOVERY):
+            self._recover(excluded_player_ids=playing_player_ids)
 
         self._hire_players_if_needed()
 
+    def _get_club_order(self) -> Tuple[str, ...]:
+        if self._competition_type != CompetitionType.CHAMPIONSHIP:
+            return ()
+
+        return self._competition.club_order
+
     def _process_player_hire(self, club_pk: str, player: Player):
         assert club_pk in self._clubs, _CLUB_ID_ERROR
 
@@ -685,6 +833,7 @@ class Game:
             self._clubs,
             self._params.playoff_params,
             self._competition.standings,
+            self.rng,
         )
 
     def _unselect(self):
@@ -697,7 +846,6 @@ class Game:
 
     # This whole method is a temporary hack before I'll implement a proper AI
     def _shuffle_coach_powers(self):
-        from random import shuffle
         strong_clubs = [pk for pk, club in self._clubs.items() if
                         club.coach_power == 3 and not self._is_manager_club(pk)]
         medium_clubs = [pk for pk, club in self._clubs.items() if
@@ -705,9 +853,9 @@ class Game:
         weaksy_clubs = [pk for pk, club in self._clubs.items() if
                         club.coach_power == 1 and not self._is_manager_club(pk)]
 
-        shuffle(strong_clubs)
-        shuffle(medium_clubs)
-        shuffle(weaksy_clubs)
+        self.rng.shuffle(strong_clubs)
+        self.rng.shuffle(medium_clubs)
+        self.rng.shuffle(weaksy_clubs)
 
         while len(strong_clubs) > 5:
             medium_clubs.append(strong_clubs.pop())
@@ -93,9 +93,9 @@ class GameService:
         context = game.get_context(manager_club_id)
 
         info = MainScreenInfo(
-            day=context["day"],
-            balance=context["balance"],
-            club_name=context["club_name"],
+            day=context.day,
+            balance=context.balance,
+            club_name=context.club_name,
         )
 
         return info
@@ -107,21 +107,14 @@ class GameService:
             _player_to_row_info(
                 player.player, player.is_selected, player.coach_level
             )
-            for player in context["user_players"]
+            for player in context.user_players
         ]
 
         return PlayerSelectionScreenInfo(
             players=players,
-            opponent=_opponent_dto_to_info(context.get("opponent", None)),
+            opponent=_opponent_dto_to_info(context.opponent),
         )
 
-    def proceed(self, game_id):
-        game = self._game_repository.get_game(game_id)
-        if game is None:
-            return
-        game.proceed_to_next_competition()
-        self._game_repository.save_game(game)
-
     def get_manager_club_id(self, game_id):
         game = self._game_repository.get_game(game_id)
         if game is None:
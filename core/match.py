@@ -10,14 +10,18 @@ from enum import Enum
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Generator
 from typing import List
 from typing import NamedTuple
 from typing import Optional
 from typing import Tuple
+from typing import Union
 
 from configuration.config_game import GameplayConstants
 from core.player import Player
-from stat_tools import LoadedToss
+from core.rng import GameRng
+from core.rng import ensure_rng
+from core.serialization import Slotted
 
 
 class DdSetStatuses(Enum):
@@ -66,9 +70,20 @@ class DdSetResult(NamedTuple):
 
 
 
-class DdMatchResult:
+class DdMatchResult(Slotted):
     """A class with results of a single match."""
 
+    __slots__ = (
+        "home_pk",
+        "away_pk",
+        "home_player_snapshot",
+        "away_player_snapshot",
+        "attendance",
+        "income",
+        "_sets_to_win",
+        "_sets",
+    )
+
     _sets: List[DdSetResult]
 
     def __init__(self, sets_to_win: int = 2):
@@ -150,6 +165,12 @@ class DdMatchResult:
 
         return sum(set_result.home_games for set_result in self._sets)
 
+    @property
+    def sets(self) -> Tuple[DdSetResult, ...]:
+        """Results of the played sets in order."""
+
+        return tuple(self._sets)
+
     @property
     def home_sets(self):
         """Sets won by home player."""
@@ -185,20 +206,59 @@ class DdMatchParams(NamedTuple):
 
     games_to_win: int = 6
     sets_to_win: int = 2
+    use_batch_engine: bool = False
+
+
+class GamePlayedEvent(NamedTuple):
+    """A single game of a match is over."""
+
+    # Sets are counted from one
+    set_number: int
+    # Score of the set after the game
+    home_games: int
+    away_games: int
+    home_won: bool
+    # Stamina and skill of the players while the game was played
+    home_stamina: int
+    away_stamina: int
+    home_actual_skill: float
+    away_actual_skill: float
+
+
+class SetPlayedEvent(NamedTuple):
+    """A set of a match is over."""
+
+    set_number: int
+    set_result: DdSetResult
+    # Score of the match after the set
+    home_sets: int
+    away_sets: int
+
+
+class MatchPlayedEvent(NamedTuple):
+    """The match is over, and the players are updated."""
+
+    result: DdMatchResult
+
+
+MatchEvent = Union[GamePlayedEvent, SetPlayedEvent, MatchPlayedEvent]
 
 
 class MatchEngine:
     """This class encapsulates inner logic of a tennis match."""
 
     _GAP: int = 2
+    _STAMINA_LOST_IN_GAME: int = 2
 
     _res: DdMatchResult
     _params: DdMatchParams
+    _rng: GameRng
     _stamina_counter: Dict[str, int]
 
-    def __init__(self, params: DdMatchParams):
+    def __init__(self, params: DdMatchParams, rng: Optional[GameRng] = None):
         self._res = DdMatchResult()
         self._params = params
+        self._rng = ensure_rng(rng)
         self._stamina_counter = {
             "home": 0,
             "away": 0,
@@ -209,14 +269,38 @@ class MatchEngine:
     ) -> DdMatchResult:
         """Processes match and returns the results."""
 
+        match = self._play_match(home_player, away_player, emit=False)
+        while True:
+            try:
+                next(match)
+            except StopIteration as stop:
+                return stop.value
+
+    def stream_match(
+        self, home_player: Player, away_player: Player
+    ) -> Generator[MatchEvent, None, DdMatchResult]:
+        """
+        Processes match lazily, game by game.
+
+        Yields an event after every game and every set, and the final
+        result in the last event. The match is the same one process_match
+        would play with the same random stream, and players are changed
+        in the same way, as soon as the stream reaches the set or the
+        match that changes them.
+        """
+
+        return (yield from self._play_match(home_player, away_player, emit=True))
+
+    def _play_match(self, home_player, away_player, emit: bool):
         sets_played = 0
         self._res.home_player_snapshot = home_player.json
         self._res.away_player_snapshot = away_player.json
 
         while not self._IsMatchOver():
-            set_result = self._ProcessSet(
+            set_result = yield from self._ProcessSet(
                 home_player,
-                away_player
+                away_player,
+                emit,
             )
             sets_played += 1
             self._res.AddSetResult(set_result)
@@ -228,6 +312,14 @@ class MatchEngine:
                 self._reputation_function(set_result.away_games) * sets_played
             )
 
+            if emit:
+                yield SetPlayedEvent(
+                    set_number=sets_played,
+                    set_result=set_result,
+                    home_sets=self._res.home_sets,
+                    away_sets=self._res.away_sets,
+                )
+
         home_player.add_experience(self._res.home_exp)
         away_player.add_experience(self._res.away_exp)
 
@@ -242,7 +334,10 @@ class MatchEngine:
         self._UpdateStats(player=home_player, is_home=True)
         self._UpdateStats(player=away_player, is_home=False)
 
-        return deepcopy(self._res)
+        result = deepcopy(self._res)
+        if emit:
+            yield MatchPlayedEvent(result=result)
+        return result
 
     def _CalculateActualSkill(self, player, actual_stamina=0):
         return player.calculate_actual_technique(actual_stamina)
@@ -251,7 +346,7 @@ class MatchEngine:
         return player.current_stamina - lost_stamina
 
     def _CalculateStaminaLostInGame(self):
-        return 2
+        return self._STAMINA_LOST_IN_GAME
 
     def _IsSetOver(self, hgames: int, agames: int) -> bool:
         games_to_win = self._params.games_to_win
@@ -265,7 +360,7 @@ class MatchEngine:
         away_won = self._res.away_sets == self._params.sets_to_win
         return home_won or away_won
 
-    def _ProcessSet(self, home_player, away_player):
+    def _ProcessSet(self, home_player, away_player, emit: bool = False):
         home_games, away_games = 0, 0
         while not self._IsSetOver(home_games, away_games):
             home_stamina = self._CalculateActualStamina(
@@ -296,9 +391,9 @@ class MatchEngine:
                     set_status=DdSetStatuses.AWAY_RETIRED
                 )
 
-            toss = LoadedToss(self._probability_function(
+            toss = self._rng.random() < self._probability_function(
                 home_actual_skill, away_actual_skill
-            ))
+            )
 
             if toss:
                 home_games += 1
@@ -308,6 +403,18 @@ class MatchEngine:
             self._stamina_counter["home"] += self._CalculateStaminaLostInGame()
             self._stamina_counter["away"] += self._CalculateStaminaLostInGame()
 
+            if emit:
+                yield GamePlayedEvent(
+                    set_number=len(self._res) + 1,
+                    home_games=home_games,
+                    away_games=away_games,
+                    home_won=toss,
+                    home_stamina=home_stamina,
+                    away_stamina=away_stamina,
+                    home_actual_skill=home_actual_skill,
+                    away_actual_skill=away_actual_skill,
+                )
+
         return DdSetResult(
             home_games=home_games,
             away_games=away_games,
@@ -315,20 +422,13 @@ class MatchEngine:
         )
 
     def _UpdateStats(self, player: Player, is_home: bool):
-        sets_won = self._res.home_sets if is_home else self._res.away_sets
-
-        home_won = int(self._res.home_sets > self._res.away_sets)
-        away_won = int(self._res.home_sets < self._res.away_sets)
-        matches_won = home_won if is_home else away_won
-
-        player.stats.matches_played += 1
-        player.stats.sets_played += (
-            self._res.home_sets + self._res.away_sets
+        update_player_stats(
+            player=player,
+            home_sets=self._res.home_sets,
+            away_sets=self._res.away_sets,
+            is_home=is_home,
         )
 
-        player.stats.matches_won += matches_won
-        player.stats.sets_won += sets_won
-
     @property
     def _exhaustion_function(self) -> Callable[[int], int]:
         return self._params.exhaustion_function
@@ -342,9 +442,11 @@ class MatchEngine:
         return self._params.reputation_function
 
 
-class DdScheduledMatchStruct:
+class DdScheduledMatchStruct(Slotted):
     """Passive class for a scheduled match."""
 
+    __slots__ = ("home_pk", "away_pk", "is_played")
+
     def __init__(self, home_pk, away_pk):
         self.home_pk = home_pk
         self.away_pk = away_pk
@@ -362,9 +464,11 @@ class DdScheduledMatchStruct:
         )
 
 
-class DdStandingsRowStruct:
+class DdStandingsRowStruct(Slotted):
     """Passive class for a row in standings."""
 
+    __slots__ = ("club_id", "matches_won", "sets_won", "games_won")
+
     def __init__(self, club_id):
         self.club_id = club_id
         self.matches_won = 0
@@ -415,6 +519,39 @@ class DdLinearProbabilityCalculator:
     def __init__(self, koefficient: float):
         self._koefficient = koefficient
 
+    def batch(self, home_skills, away_skills):
+        """
+        Same probability for NumPy arrays of skills.
+
+        Only array methods are used here, so this module does not depend on
+        NumPy itself.
+        """
+        delta = home_skills - away_skills
+
+        val = (self._koefficient * delta + 0.5).round(6)
+        return val.clip(0.005, 0.995)
+
+
+def update_player_stats(
+        player: Player,
+        home_sets: int,
+        away_sets: int,
+        is_home: bool,
+):
+    """Adds the outcome of the match to the player's stats."""
+
+    sets_won = home_sets if is_home else away_sets
+
+    home_won = int(home_sets > away_sets)
+    away_won = int(home_sets < away_sets)
+    matches_won = home_won if is_home else away_won
+
+    player.stats.matches_played += 1
+    player.stats.sets_played += home_sets + away_sets
+
+    player.stats.matches_won += matches_won
+    player.stats.sets_won += sets_won
+
 
 def _calculate_new_experience(games_won: int) -> int:
     return games_won * GameplayConstants.EXPERIENCE_COEFFICIENT.value
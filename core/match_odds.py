@@ -0,0 +1,304 @@
+"""
+Exact match outcome probabilities.
+
+Created October 18, 2026
+
+@author montreal91
+"""
+from collections import defaultdict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict
+from typing import Mapping
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+from core.match import DdMatchParams
+from core.match import MatchEngine
+from core.player import Player
+from core.player import calculate_actual_technique
+from core.player import calculate_max_stamina
+
+Score = Tuple[int, int]
+
+# (home_sets, away_sets, home_games, away_games)
+_State = Tuple[int, int, int, int]
+
+_CACHE_SIZE = 4096
+
+
+class MatchOdds(NamedTuple):
+    """Probabilities of the possible outcomes of a match."""
+
+    home_win_probability: float
+    score_distribution: Mapping[Score, float]
+
+    @property
+    def away_win_probability(self) -> float:
+        return 1 - self.home_win_probability
+
+
+class MatchOddsCalculator:
+    """
+    Callable class that calculates exact odds of a match between two players.
+
+    Unlike MatchEngine, players are not changed in any way. The game/set state
+    space is walked with dynamic programming, so the answer is exact rather
+    than sampled. Results are cached by players' technique, endurance and
+    stamina, and match parameters.
+    """
+
+    _params: DdMatchParams
+
+    def __call__(self, home_player: Player, away_player: Player) -> MatchOdds:
+        return _calculate_match_odds(
+            home=_make_player_state(home_player),
+            away=_make_player_state(away_player),
+            params=self._params,
+        )
+
+    def __init__(self, params: DdMatchParams):
+        self._params = params
+
+
+class _PlayerState(NamedTuple):
+    technique: int
+    endurance: int
+    stamina: int
+
+
+class _SkillTimeline:
+    """
+    Skills of the players depending on the number of games played.
+
+    Stamina only goes down during the match, so after some number of games
+    both players are stuck at their minimal technique. From that moment the
+    probability to win a game does not change anymore.
+    """
+
+    stable_from: int
+
+    def __init__(
+            self,
+            home: _PlayerState,
+            away: _PlayerState,
+            params: DdMatchParams,
+    ):
+        self._home = home
+        self._away = away
+        self._params = params
+
+        played = 0
+        while not (_is_exhausted(home, played) and _is_exhausted(away, played)):
+            played += 1
+        self.stable_from = played
+
+    def probability(self, played: int) -> float:
+        home_skill, away_skill = self.skills(played)
+        return self._params.probability_function(home_skill, away_skill)
+
+    def skills(self, played: int) -> Tuple[float, float]:
+        played = min(played, self.stable_from)
+        return (
+            _actual_skill(self._home, played),
+            _actual_skill(self._away, played),
+        )
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _calculate_match_odds(
+        home: _PlayerState,
+        away: _PlayerState,
+        params: DdMatchParams,
+) -> MatchOdds:
+    timeline = _SkillTimeline(home, away, params)
+    distribution: Dict[Score, float] = defaultdict(float)
+    frontier: Dict[_State, float] = {(0, 0, 0, 0): 1.0}
+
+    # Before the skills get stable every game leads to a new state, so mass
+    # is simply pushed forward game by game.
+    for played in range(timeline.stable_from):
+        retirement = _retirement_score(timeline.skills(played), params)
+        if retirement is not None:
+            distribution[retirement] += sum(frontier.values())
+            frontier = {}
+            break
+
+        frontier = _play_game(
+            frontier=frontier,
+            probability=timeline.probability(played),
+            distribution=distribution,
+            params=params,
+        )
+
+    if frontier:
+        stable = _StableMatch(timeline, params)
+        for state, mass in frontier.items():
+            for score, probability in stable.outcome(state).items():
+                distribution[score] += mass * probability
+
+    home_win_probability = sum(
+        (probability
+        for (home_sets, away_sets), probability in distribution.items()
+        if home_sets > away_sets),
+        0.0,
+    )
+
+    return MatchOdds(
+        home_win_probability=home_win_probability,
+        score_distribution=MappingProxyType(dict(distribution)),
+    )
+
+
+class _StableMatch:
+    """Outcomes of the rest of the match when probability doesn't change."""
+
+    def __init__(self, timeline: _SkillTimeline, params: DdMatchParams):
+        self._params = params
+        self._probability = timeline.probability(timeline.stable_from)
+        self._retirement = _retirement_score(
+            timeline.skills(timeline.stable_from),
+            params,
+        )
+        self._outcomes: Dict[_State, Dict[Score, float]] = {}
+
+    def outcome(self, state: _State) -> Dict[Score, float]:
+        if self._retirement is not None:
+            return {self._retirement: 1.0}
+
+        if state in self._outcomes:
+            return self._outcomes[state]
+
+        games_to_win = self._params.games_to_win
+        home_sets, away_sets, home_games, away_games = state
+        p = self._probability
+        q = 1 - p
+
+        if home_games == away_games == games_to_win - 1:
+            # Deuce-like tie: the set is over only after two games in a row
+            # are won by the same player, otherwise it's a tie again.
+            # W = p^2 * H + q^2 * A + 2pq * W
+            home_set = self._after_set(home_sets + 1, away_sets)
+            away_set = self._after_set(home_sets, away_sets + 1)
+            res = _mix((p * p, home_set), (q * q, away_set))
+            res = {score: val / (1 - 2 * p * q) for score, val in res.items()}
+        else:
+            res = _mix(
+                (p, self._after_game(state, home_won=True)),
+                (q, self._after_game(state, home_won=False)),
+            )
+
+        self._outcomes[state] = res
+        return res
+
+    def _after_game(self, state: _State, home_won: bool) -> Dict[Score, float]:
+        next_state, score = _advance(state, home_won, self._params)
+        if score is not None:
+            return {score: 1.0}
+        return self.outcome(next_state)
+
+    def _after_set(self, home_sets: int, away_sets: int) -> Dict[Score, float]:
+        if self._params.sets_to_win in (home_sets, away_sets):
+            return {(home_sets, away_sets): 1.0}
+        return self.outcome((home_sets, away_sets, 0, 0))
+
+
+def _actual_skill(player: _PlayerState, played: int) -> float:
+    lost_stamina = played * MatchEngine._STAMINA_LOST_IN_GAME
+    return calculate_actual_technique(
+        technique=player.technique,
+        max_stamina=calculate_max_stamina(player.endurance),
+        actual_stamina=player.stamina - lost_stamina,
+    )
+
+
+def _advance(
+        state: _State,
+        home_won: bool,
+        params: DdMatchParams,
+) -> Tuple[_State, Optional[Score]]:
+    """
+    Next state after one game.
+
+    If the game finishes the match, returns final score as well.
+    """
+
+    home_sets, away_sets, home_games, away_games = state
+    if home_won:
+        home_games += 1
+    else:
+        away_games += 1
+
+    games_to_win = params.games_to_win
+    gap = MatchEngine._GAP
+    if home_games >= games_to_win and home_games - away_games >= gap:
+        home_sets, home_games, away_games = home_sets + 1, 0, 0
+    elif away_games >= games_to_win and away_games - home_games >= gap:
+        away_sets, home_games, away_games = away_sets + 1, 0, 0
+
+    if params.sets_to_win in (home_sets, away_sets):
+        return state, (home_sets, away_sets)
+
+    # 6:6 is the same as 5:5, 7:6 is the same as 6:5 and so on
+    shift = min(home_games, away_games) - (games_to_win - 1)
+    if shift > 0:
+        home_games, away_games = home_games - shift, away_games - shift
+
+    return (home_sets, away_sets, home_games, away_games), None
+
+
+def _is_exhausted(player: _PlayerState, played: int) -> bool:
+    """Checks if the player's skill can't get any lower."""
+
+    lowest_skill = calculate_actual_technique(
+        technique=player.technique,
+        max_stamina=calculate_max_stamina(player.endurance),
+        actual_stamina=0,
+    )
+    return _actual_skill(player, played) == lowest_skill
+
+
+def _make_player_state(player: Player) -> _PlayerState:
+    return _PlayerState(
+        technique=player.technique,
+        endurance=player.endurance,
+        stamina=player.current_stamina,
+    )
+
+
+def _mix(*weighted) -> Dict[Score, float]:
+    res: Dict[Score, float] = defaultdict(float)
+    for weight, outcome in weighted:
+        for score, probability in outcome.items():
+            res[score] += weight * probability
+    return res
+
+
+def _play_game(
+        frontier: Dict[_State, float],
+        probability: float,
+        distribution: Dict[Score, float],
+        params: DdMatchParams,
+) -> Dict[_State, float]:
+    res: Dict[_State, float] = defaultdict(float)
+    for state, mass in frontier.items():
+        for home_won, chance in ((True, probability), (False, 1 - probability)):
+            next_state, score = _advance(state, home_won, params)
+            if score is not None:
+                distribution[score] += mass * chance
+            else:
+                res[next_state] += mass * chance
+    return res
+
+
+def _retirement_score(
+        skills: Tuple[float, float],
+        params: DdMatchParams,
+) -> Optional[Score]:
+    home_skill, away_skill = skills
+    if home_skill == 0:
+        return 0, params.sets_to_win
+    if away_skill == 0:
+        return params.sets_to_win, 0
+    return None
@@ -0,0 +1,55 @@
+"""
+Wall time measurement of game update phases.
+
+Created October 18, 2026
+
+@author montreal91
+"""
+from collections import defaultdict
+from contextlib import contextmanager
+from contextlib import nullcontext
+from enum import Enum
+from time import perf_counter
+from typing import ContextManager
+from typing import Dict
+
+
+class Phase(Enum):
+    PRACTICE = "practice"
+    MATCHES = "matches"
+    RECOVERY = "recovery"
+    SKILL_UPGRADES = "skill upgrades"
+    PERSISTENCE = "persistence"
+
+
+class PhaseTimer:
+    """Accumulates time spent in every phase."""
+
+    _totals: Dict[Phase, float]
+
+    def __init__(self):
+        self._totals = defaultdict(float)
+
+    @property
+    def totals(self) -> Dict[Phase, float]:
+        """Seconds spent in every phase, phases that never ran are zero."""
+
+        return {phase: self._totals[phase] for phase in Phase}
+
+    @contextmanager
+    def phase(self, phase: Phase):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self._totals[phase] += perf_counter() - start
+
+
+class NullPhaseTimer:
+    """Timer that measures nothing, used when nobody is interested."""
+
+    def phase(self, phase: Phase) -> ContextManager:
+        return nullcontext()
+
+
+NULL_PHASE_TIMER = NullPhaseTimer()
@@ -6,27 +6,33 @@ Created Apr 09, 2019
 """
 
 import json
+import math
 import uuid
 from enum import Enum
-from random import choice
+from random import Random
+from random import getrandbits
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Tuple
 
 from configuration.config_game import GameplayConstants
 from configuration.config_game import DdPlayerSkills
 from core.serialization import DdField
 from core.serialization import Jsonable
+from core.serialization import Slotted
 
 _ENDURANCE_FACTOR = DdPlayerSkills.ENDURANCE_FACTOR
 _PRECISION = 1
 
 
 # TODO: Get rid of Jsonable stuff
-class PlayerStats(Jsonable):
+class PlayerStats(Jsonable, Slotted):
     """A passive data structure to store player stats."""
 
+    __slots__ = ("sets_played", "sets_won", "matches_played", "matches_won")
+
     sets_played: int
     sets_won: int
     matches_played: int
@@ -51,9 +57,27 @@ class SkillSet(Enum):
     ENDURANCE = "endurance"
 
 
-class Player(Jsonable):
+class Player(Jsonable, Slotted):
     """A class that describes a tennis player."""
 
+    __slots__ = (
+        "_player_id",
+        "_first_name",
+        "_second_name",
+        "_last_name",
+        "_technique",
+        "_endurance",
+        "_exhaustion",
+        "_experience",
+        "_skill_points",
+        "_current_stamina",
+        "_age",
+        "_reputation",
+        "_stats",
+        "_cached_level",
+        "_cached_actual_technique",
+    )
+
     _FIELD_MAP = (
         DdField("_player_id", "player_id"),
         DdField("_first_name", "first_name"),
@@ -85,6 +109,10 @@ class Player(Jsonable):
     _reputation: int
     _stats: PlayerStats
 
+    # Derived attributes, None means they have to be calculated again
+    _cached_level: Optional[int]
+    _cached_actual_technique: Optional[float]
+
     def __init__(
         self,
         first_name: str = "Joan",
@@ -93,8 +121,14 @@ class Player(Jsonable):
         technique: int = 1,
         endurance: int = 1,
         age: int = 30,
+        player_id: Optional[str] = None,
     ):
-        self._player_id = str(uuid.uuid4())
+        self._cached_level = None
+        self._cached_actual_technique = None
+
+        if player_id is None:
+            player_id = make_player_id(getrandbits(128))
+        self._player_id = player_id
         self._first_name = first_name
         self._second_name = second_name
         self._last_name = last_name
@@ -112,6 +146,12 @@ class Player(Jsonable):
     def __from_json__(self, data: Dict[str, Any]):
         data.setdefault("skill_points", 0)
         super().__from_json__(data)
+        self._invalidate_cache()
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # Players pickled before caching have no cached attributes at all
+        self._invalidate_cache()
 
     @property
     def age(self):
@@ -119,14 +159,17 @@ class Player(Jsonable):
 
     @property
     def actual_technique(self) -> float:
-        return self.calculate_actual_technique(self._current_stamina)
+        if self._cached_actual_technique is None:
+            self._cached_actual_technique = self.calculate_actual_technique(
+                self._current_stamina
+            )
+        return self._cached_actual_technique
 
     def calculate_actual_technique(self, actual_stamina: float) -> float:
-        stamina_factor = actual_stamina / self.max_stamina
-        min_technique = self._technique * 0.1
-        return round(
-            max(self._technique * stamina_factor, min_technique),
-            _PRECISION,
+        return calculate_actual_technique(
+            technique=self._technique,
+            max_stamina=self.max_stamina,
+            actual_stamina=actual_stamina,
         )
 
     @property
@@ -205,14 +248,14 @@ class Player(Jsonable):
     @property
     def level(self) -> int:
         """Current level of the player."""
-        level = 0
-        while not self._experience < level_exp(level + 1):
-            level += 1
-        return level
+
+        if self._cached_level is None:
+            self._cached_level = level_for_experience(self._experience)
+        return self._cached_level
 
     @property
     def max_stamina(self):
-        return self._endurance * _ENDURANCE_FACTOR
+        return calculate_max_stamina(self._endurance)
 
     # 'exp' stands for experience
     @property
@@ -252,6 +295,7 @@ class Player(Jsonable):
             raise ValueError("Unknown skill")
 
         self._skill_points -= skill_points
+        self._invalidate_cache()
 
     def add_experience(self, experience: int):
         """
@@ -261,6 +305,7 @@ class Player(Jsonable):
         """
         old_level = self.level
         self._experience += experience
+        self._cached_level = None
         new_level = self.level
 
         while old_level < new_level:
@@ -285,10 +330,18 @@ class Player(Jsonable):
         self._current_stamina += recovered_stamina
         self._current_stamina = max(self._current_stamina, 0)
         self._current_stamina = min(self._current_stamina, self.max_stamina)
+        self._cached_actual_technique = None
 
     def RemoveStaminaLostInMatch(self, lost_stamina: int):
         self._current_stamina -= lost_stamina
         self._current_stamina = max(self._current_stamina, 0)
+        self._cached_actual_technique = None
+
+    def _invalidate_cache(self):
+        """Should be called after any change of the player's skills."""
+
+        self._cached_level = None
+        self._cached_actual_technique = None
 
 
 class PlayerFactory:
@@ -298,19 +351,23 @@ class PlayerFactory:
     def __init__(self):
         self._first_names, self._last_names = _load_names()
 
-    def create_player(self, level: int, age: int) -> Player:
+    def create_player(self, level: int, age: int, rng: Random) -> Player:
         """
         Creates a player object of given age and level.
+
+        Names and the id are drawn from rng, so replayed commands
+        create the same players.
         """
         skill_base = GameplayConstants.SKILL_BASE.value
 
         player = Player(
             age=age,
-            first_name=choice(self._first_names),
-            second_name=choice(self._first_names),
-            last_name=choice(self._last_names),
+            first_name=rng.choice(self._first_names),
+            second_name=rng.choice(self._first_names),
+            last_name=rng.choice(self._last_names),
             technique=skill_base,
             endurance=skill_base,
+            player_id=make_player_id(rng.getrandbits(128)),
         )
 
         player.add_experience(level_exp(level))
@@ -360,11 +417,32 @@ class ExhaustedLinearRecovery:
         self._exhaustion_factor = exhaustion_factor
 
 
+def calculate_actual_technique(
+        technique: int,
+        max_stamina: int,
+        actual_stamina: float,
+) -> float:
+    """Technique of the player which is left with given stamina."""
+
+    stamina_factor = actual_stamina / max_stamina
+    min_technique = technique * 0.1
+    return round(max(technique * stamina_factor, min_technique), _PRECISION)
+
+
+def calculate_max_stamina(endurance: int) -> int:
+    return endurance * _ENDURANCE_FACTOR
+
+
 def player_model_comparator(player_model):
     """Function used to compare two players."""
     return player_model.actual_technique * 1.2 + player_model.endurance
 
 
+def make_player_id(bits: int) -> str:
+    """Player id made of 128 random bits."""
+    return str(uuid.UUID(int=bits, version=4))
+
+
 def level_exp(n: int) -> int:
     """Total experience required to gain a level.
 
@@ -374,6 +452,25 @@ def level_exp(n: int) -> int:
     return int((n * (n + 1) / 2) * ec)
 
 
+def level_for_experience(experience: int) -> int:
+    """Highest level such that level_exp(level) <= experience.
+
+    Inverse of the formula of level_exp, so no iteration over levels.
+    """
+    if experience <= 0:
+        return 0
+
+    ec = GameplayConstants.LEVEL_EXPERIENCE_COEFFICIENT.value
+    level = (math.isqrt(int(8 * experience / ec) + 1) - 1) // 2
+
+    # level_exp truncates, so the estimate may be one level off
+    while level_exp(level + 1) <= experience:
+        level += 1
+    while level > 0 and level_exp(level) > experience:
+        level -= 1
+    return level
+
+
 def _load_names() -> Tuple[List[str], List[str]]:
     """Utility function that loads names from the file on the disk."""
     with open("data/names.json") as datafile:
@@ -5,7 +5,6 @@ Created Apr 26, 2019
 @author montreal91
 """
 
-from random import shuffle
 from typing import Dict
 from typing import List
 from typing import NamedTuple
@@ -19,6 +18,8 @@ from core.match import DdMatchParams
 from core.match import DdMatchResult
 from core.match import DdScheduledMatchStruct
 from core.match import DdStandingsRowStruct
+from core.rng import GameRng
+from core.rng import ensure_rng
 
 
 ClubPair = Tuple[str, str]
@@ -122,6 +123,8 @@ class DdPlayoffSeries:
 class DdPlayoffScheduledMatchStruct(DdScheduledMatchStruct):
     """Passive class for a scheduled playoff match."""
 
+    __slots__ = ("series",)
+
     series: Optional[DdPlayoffSeries]
     def __init__(self, home_pk: str, away_pk: str):
         super().__init__(home_pk, away_pk)
@@ -161,6 +164,7 @@ class DdPlayoff(DdAbstractCompetition):
         clubs: Dict[str, Club],
         params: DdPlayoffParams,
         standings: List[DdStandingsRowStruct],
+        rng: Optional[GameRng] = None,
     ):
         super().__init__(clubs, params)
         self._standings = sorted(
@@ -172,7 +176,7 @@ class DdPlayoff(DdAbstractCompetition):
         self._series = []
         self._past_series = []
         self._participants = []
-        self._MakeNewRound()
+        self._MakeNewRound(ensure_rng(rng))
 
     @property
     def current_matches(self) ->  Optional[ScheduleDay]:
@@ -221,31 +225,21 @@ class DdPlayoff(DdAbstractCompetition):
 
         return Apow(wins, 125)
 
-    def update(self):
+    def update(self, rng: Optional[GameRng] = None):
         if self.is_over:
             return []
 
         if self.current_matches is None:
             self._day += 1
             if self._day == len(self._schedule) and not self.is_over:
-                self._MakeNewRound()
+                self._MakeNewRound(ensure_rng(rng))
             return []
 
-        day_results = []
-        for match in self.current_matches:
-            processor = self._make_match_processor()
-            res = processor.process_match(
-                self._clubs[match.home_pk].selected_player,
-                self._clubs[match.away_pk].selected_player,
-            )
-            match.is_played = True
-
-            res.home_pk = match.home_pk
-            res.away_pk = match.away_pk
-            day_results.append(res)
+        current_matches = self.current_matches
+        day_results = self._play_matches(current_matches, rng)
+        for match, res in zip(current_matches, day_results):
             match.series.AddResult(res)
         self._day += 1
-        self._results.append(day_results)
         self._UpdateSchedule()
         return day_results
 
@@ -262,12 +256,12 @@ class DdPlayoff(DdAbstractCompetition):
         return -1
 
     def _InsertGap(self):
-        gaps = [None for _ in range(self._params.gap_days)]
-        self._schedule.extend(gaps)
+        for _ in range(self._params.gap_days):
+            self._add_schedule_day(None)
 
-    def _MakeInitialRound(self):
+    def _MakeInitialRound(self, rng: GameRng):
         if self._params.length == len(self._LONG) * 2:
-            predraw = _MakePreDraw(5)
+            predraw = _MakePreDraw(5, rng)
             for top, bottom in self._LONG:
                 series = DdPlayoffSeries(self._params)
                 series.pair = (
@@ -277,7 +271,7 @@ class DdPlayoff(DdAbstractCompetition):
                 self._series.append(series)
                 self._participants.extend(series.pair)
         elif self._params.length == len(self._SHORT) * 2:
-            predraw = _MakePreDraw(4)
+            predraw = _MakePreDraw(4, rng)
             for top, bottom in self._SHORT:
                 series = DdPlayoffSeries(self._params)
                 series.pair = (
@@ -287,9 +281,9 @@ class DdPlayoff(DdAbstractCompetition):
                 self._series.append(series)
                 self._participants.extend(series.pair)
 
-    def _MakeNewRound(self):
+    def _MakeNewRound(self, rng: GameRng):
         if not self._series:
-            self._MakeInitialRound()
+            self._MakeInitialRound(rng)
         else:
             self._round += 1
             self._past_series.extend(self._series)
@@ -320,7 +314,7 @@ class DdPlayoff(DdAbstractCompetition):
                 scheduled_match.SetSeries(series)
                 day.append(scheduled_match)
             day.reverse()
-            self._schedule.append(day)
+            self._add_schedule_day(day)
             self._InsertGap()
 
     def _UpdateSchedule(self):
@@ -338,9 +332,9 @@ def _DrawParts(num: int):
             yield list(range(2 ** (i - 1), 2 ** i))
 
 
-def _MakePreDraw(i: int) -> List[int]:
+def _MakePreDraw(i: int, rng: GameRng) -> List[int]:
     pre_draw: List[int] = []
     for chunk in _DrawParts(i):
-        shuffle(chunk)
+        rng.shuffle(chunk)
         pre_draw.extend(chunk)
     return pre_draw
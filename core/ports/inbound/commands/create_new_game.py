@@ -5,12 +5,15 @@ Created December 29, 2025
 """
 import time
 from typing import NamedTuple
+from typing import Optional
 
 from core.game import Game
 
 
 class CreateNewGameCommand(NamedTuple):
     game_id: str
+    # Seed of the game random stream, a random one if not set
+    seed: Optional[int] = None
 
 
 class CreateNewGameCommandResult(NamedTuple):
@@ -29,6 +32,7 @@ class CreateNewGameCommandHandler:
             params=self._parameters,
             created_ts=time.time_ns() // 1_000_000,
             updated_ts=time.time_ns() // 1_000_000,
+            seed=command.seed,
         )
         self._game_repository.save_game(game)
         self._club_provider.save_clubs(game.clubs.values())
@@ -0,0 +1,140 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+from enum import Enum
+from typing import Dict
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+
+from core.game import Game
+
+
+class StopCondition(Enum):
+    # A player of the manager club has reached a new level
+    LEVEL_UP = "level up"
+    COMPETITION_END = "competition end"
+    SEASON_END = "season end"
+
+
+class FastForwardCommand(NamedTuple):
+    game_id: str
+    days: int
+    # Values of StopCondition
+    stop_conditions: Sequence[str] = ()
+
+
+class FastForwardCommandResult(NamedTuple):
+    success: bool
+    reason: str
+    days_played: int
+    # Value of the StopCondition that has stopped the game, if any
+    stopped_by: Optional[str] = None
+
+
+class FastForwardCommandHandler:
+    """
+    Plays several days in a row and saves the game once at the end.
+
+    Stops after the given number of days, on any of the given stop
+    conditions, or when the game can't go on without a user decision.
+    """
+
+    def __init__(self, game_repository, club_repository, match_history_repository):
+        self._game_repository = game_repository
+        self._club_repository = club_repository
+        self._match_history_repository = match_history_repository
+
+    def __call__(self, command: FastForwardCommand) -> FastForwardCommandResult:
+        game = self._game_repository.get_game(command.game_id)
+
+        if game is None:
+            return FastForwardCommandResult(
+                success=False,
+                reason=f"Game with id={command.game_id} not found",
+                days_played=0,
+            )
+
+        stop_conditions = {StopCondition(value) for value in command.stop_conditions}
+        played_days = []
+        success, reason = True, "Ok"
+        stopped_by = None
+
+        while len(played_days) < command.days:
+            levels = _get_manager_player_levels(game)
+            competition = game.competition
+            season = len(game.history)
+
+            day_success, day_reason = game.update()
+            if not day_success:
+                # Not being able to play the first day is an error,
+                # later it's just a decision the user has to make.
+                success = bool(played_days)
+                reason = day_reason
+                break
+
+            played_days.append((game.last_match_day, game.last_results))
+            stopped_by = _check_stop_conditions(
+                game,
+                stop_conditions,
+                levels,
+                competition,
+                season,
+            )
+            if stopped_by is not None:
+                break
+
+        with self._game_repository.transaction():
+            self._game_repository.save_game(game)
+            self._club_repository.save_clubs(game.clubs.values())
+            # Standings of a new season are there before its first day
+            upcoming_days = [(game.next_match_day, [])] if played_days else []
+            self._match_history_repository.save_days(
+                game.game_id,
+                played_days + upcoming_days,
+            )
+
+        return FastForwardCommandResult(
+            success=success,
+            reason=reason,
+            days_played=len(played_days),
+            stopped_by=None if stopped_by is None else stopped_by.value,
+        )
+
+
+def _check_stop_conditions(
+        game: Game,
+        stop_conditions,
+        levels: Dict[str, int],
+        competition,
+        season: int,
+) -> Optional[StopCondition]:
+    if StopCondition.SEASON_END in stop_conditions:
+        if len(game.history) != season:
+            return StopCondition.SEASON_END
+
+    if StopCondition.COMPETITION_END in stop_conditions:
+        if game.competition is not competition:
+            return StopCondition.COMPETITION_END
+
+    if StopCondition.LEVEL_UP in stop_conditions:
+        new_levels = _get_manager_player_levels(game)
+        for player_id, level in new_levels.items():
+            if level > levels.get(player_id, level):
+                return StopCondition.LEVEL_UP
+
+    return None
+
+
+def _get_manager_player_levels(game: Game) -> Dict[str, int]:
+    club = game.clubs.get(game.manager_club_id)
+    if club is None:
+        return {}
+
+    return {
+        slot.player.player_id: slot.player.level
+        for slot in club.players
+        if slot.player is not None
+    }
@@ -0,0 +1,111 @@
+"""
+Journaling of the commands applied to a game.
+
+Created October 18, 2026
+
+@author montreal91
+"""
+import contextlib
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+
+from core.game import Game
+from core.ports.outbound.command_journal import JournalEntry
+
+# Makes a command handler from a game repository and a club provider
+HandlerFactory = Callable[[Any, Any], Callable]
+
+# Seeds are stored in a signed 64-bit SQLite integer
+_SEED_BITS = 63
+
+
+class JournaledCommandHandler:
+    """
+    Records every applied command in the game journal.
+
+    Right before the command is applied, the random stream of the game is
+    reseeded with a seed drawn from the stream itself, and the seed is saved
+    along with the command. So games with the same seed and the same commands
+    stay the same, and replaying the journal gives exactly the same game.
+    """
+
+    def __init__(self, handler, game_repository):
+        self._handler = handler
+        self._game_repository = game_repository
+
+    def __call__(self, command):
+        game = self._game_repository.get_game(command.game_id)
+        if game is None:
+            return self._handler(command)
+
+        seed = game.rng.getrandbits(_SEED_BITS)
+
+        with self._game_repository.transaction():
+            self._game_repository.record_command(
+                command.game_id,
+                type(command).__name__,
+                command._asdict(),
+                seed,
+            )
+            game.rng.seed(seed)
+            return self._handler(command)
+
+
+class CommandReplayer:
+    """
+    Applies journaled commands to a game loaded from a snapshot.
+
+    Commands are applied by the regular handlers, which work with the given
+    game only and save nothing.
+    """
+
+    def __init__(self, handler_factories: Dict[type, HandlerFactory]):
+        self._commands = {
+            command_type.__name__: (command_type, factory)
+            for command_type, factory in handler_factories.items()
+        }
+
+    def __call__(self, game: Game, entries: Iterable[JournalEntry]):
+        game_repository = _ReplayGameRepository(game)
+        storage = _NullStorage()
+
+        for entry in entries:
+            command_type, factory = self._commands[entry.command_type]
+            handler = factory(game_repository, storage)
+            game.rng.seed(entry.seed)
+            handler(command_type(**entry.payload))
+
+
+class _ReplayGameRepository:
+    def __init__(self, game: Game):
+        self._game = game
+
+    def get_game(self, game_id):
+        if game_id != self._game.game_id:
+            return None
+        return self._game
+
+    def save_game(self, game):
+        pass
+
+    def transaction(self):
+        return contextlib.nullcontext()
+
+
+class _NullStorage:
+    """Stands in for the club provider and the match history repository."""
+
+    def save_clubs(self, clubs):
+        pass
+
+    def save_club(self, club):
+        pass
+
+    def save_results(self, game_id, match_day, results: List):
+        pass
+
+    def save_days(self, game_id, days: List):
+        pass
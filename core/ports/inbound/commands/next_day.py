@@ -18,9 +18,15 @@ class NextDayCommandResult(NamedTuple):
 
 
 class NextDayCommandHandler:
-    def __init__(self, game_repository, club_repository: TemporalClubProvider):
+    def __init__(
+            self,
+            game_repository,
+            club_repository: TemporalClubProvider,
+            match_history_repository,
+    ):
         self._game_repository = game_repository
         self._club_repository = club_repository
+        self._match_history_repository = match_history_repository
 
     def __call__(self, command):
         game = self._game_repository.get_game(command.game_id)
@@ -32,7 +38,16 @@ class NextDayCommandHandler:
             )
 
         res, reason = game.update()
-        self._game_repository.save_game(game)
-        self._club_repository.save_clubs(game.clubs.values())
+
+        with self._game_repository.transaction():
+            self._game_repository.save_game(game)
+            self._club_repository.save_clubs(game.clubs.values())
+
+            if res:
+                # Standings of a new season are there before its first day
+                self._match_history_repository.save_days(game.game_id, [
+                    (game.last_match_day, game.last_results),
+                    (game.next_match_day, []),
+                ])
 
         return NextDayCommandResult(success=res, reason=reason)
@@ -0,0 +1,84 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import json
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+
+
+class JournalEntry(NamedTuple):
+    seq: int
+    command_type: str
+    payload: Dict[str, Any]
+    # The game random stream is seeded with it right before the command
+    # is applied
+    seed: int
+
+
+class CommandJournal:
+    """
+    Append-only log of commands applied to the games.
+
+    Entries are read on the reader connection, if one is given. The last
+    sequence number is always read on the writer, as it is read in the
+    transaction that appends the next entry.
+    """
+
+    def __init__(self, conn, reader=None):
+        self._conn = conn
+        self._reader = conn if reader is None else reader
+
+    def append(self, game_id: str, seq: int, command_type: str, payload, seed):
+        self._conn.execute(
+            """
+            INSERT INTO game_journal (game_id, seq, command_type, payload, seed)
+            VALUES (:game_id, :seq, :command_type, :payload, :seed)
+            """,
+            {
+                "game_id": game_id,
+                "seq": seq,
+                "command_type": command_type,
+                "payload": json.dumps(payload),
+                "seed": seed,
+            },
+        )
+
+    def get_entries(self, game_id: str, after_seq: int) -> List[JournalEntry]:
+        rows = self._reader.execute(
+            """
+            SELECT seq, command_type, payload, seed
+            FROM game_journal
+            WHERE game_id = :game_id AND seq > :seq
+            ORDER BY seq
+            """,
+            {"game_id": game_id, "seq": after_seq},
+        ).fetchall()
+
+        return [
+            JournalEntry(
+                seq=row[0],
+                command_type=row[1],
+                payload=json.loads(row[2]),
+                seed=row[3],
+            )
+            for row in rows
+        ]
+
+    def get_last_seq(self, game_id: str) -> int:
+        row = self._conn.execute(
+            "SELECT MAX(seq) FROM game_journal WHERE game_id = :game_id",
+            {"game_id": game_id},
+        ).fetchone()
+        return row[0] or 0
+
+    def truncate(self, game_id: str, up_to_seq: int):
+        """Drops entries which are already included in a snapshot."""
+
+        self._conn.execute(
+            "DELETE FROM game_journal WHERE game_id = :game_id AND seq <= :seq",
+            {"game_id": game_id, "seq": up_to_seq},
+        )
@@ -5,18 +5,62 @@ Created December 26, 2025
 """
 import pickle
 from sqlite3 import Binary
-from typing import Dict, Optional
+from typing import Callable
+from typing import Dict, List, Optional
 
 from core.game import Game
+from core.ports.outbound.command_journal import CommandJournal
+from core.ports.outbound.command_journal import JournalEntry
+from core.ports.outbound.identity_map import IdentityMap
 from persistence.sql import read_sql_file
+from persistence.transaction import on_rollback
+from persistence.transaction import transaction
+
+
+Replayer = Callable[[Game, List[JournalEntry]], None]
 
 
 class GameRepository:
+    """
+    Stores games as pickled snapshots.
+
+    Without a journal every save writes a new snapshot. With a journal,
+    commands are recorded as small journal entries and the snapshot is written
+    only once in snapshot_every days. Loading a game then replays the journal
+    entries newer than the snapshot.
+
+    Games are loaded on the reader connection, if one is given, so a query
+    that loads a game doesn't need the writer.
+    """
+
     _games: Dict[str, Game]
+    # Sequence number of the last journaled command for each game
+    _journal_seqs: Dict[str, int]
+    # Value of Game.days_played at the moment of the last snapshot
+    _snapshot_days: Dict[str, int]
+    # Incremented on every save, so anything computed from a game
+    # is up to date as long as the version of the game is the same
+    _versions: Dict[str, int]
 
-    def __init__(self, conn):
+    def __init__(
+            self,
+            conn,
+            journal: Optional[CommandJournal] = None,
+            replayer: Optional[Replayer] = None,
+            snapshot_every: int = 1,
+            identity_map: Optional[IdentityMap] = None,
+            reader=None,
+    ):
         self._games = {}
+        self._journal_seqs = {}
+        self._snapshot_days = {}
+        self._versions = {}
         self._conn = conn
+        self._reader = conn if reader is None else reader
+        self._journal = journal
+        self._replayer = replayer
+        self._snapshot_every = snapshot_every
+        self._identity_map = identity_map
 
         self._save_game_sql = read_sql_file("data/sql/save_game.sql")
         self._get_games_sql = read_sql_file("data/sql/get_game.sql")
@@ -28,29 +72,145 @@ class GameRepository:
 
         return self._games.get(game_id)
 
+    def get_version(self, game_id) -> int:
+        return self._versions.get(game_id, 0)
+
     def get_game_ids(self):
-        query_res = self._conn.execute(self._get_game_ids_sql).fetchall()
+        query_res = self._reader.execute(self._get_game_ids_sql).fetchall()
         return [row[0] for row in query_res]
 
+    def record_command(self, game_id: str, command_type: str, payload, seed):
+        """
+        Appends a command to the journal of the game.
+
+        Should be called in the same transaction in which the command is
+        applied, right before it. If the transaction is rolled back, the game
+        is loaded from the database again on the next get_game.
+        """
+
+        previous_seq = self._get_journal_seq(game_id)
+        seq = previous_seq + 1
+        self._journal.append(game_id, seq, command_type, payload, seed)
+        self._journal_seqs[game_id] = seq
+        self.on_rollback(lambda: self._forget_command(game_id, previous_seq))
+
     def save_game(self, game):
+        if self._is_snapshot_due(game):
+            self._save_game_to_file(game)
+        self._cache_game(game)
+        self.mark_changed(game)
+
+    def mark_changed(self, game):
+        """
+        Bumps the version of a game whose save is deferred.
+
+        The game should be cached already, that is loaded or saved before.
+        """
+
+        self._versions[game.game_id] = self.get_version(game.game_id) + 1
+        if self._identity_map is not None:
+            # Commands save the game after hiring or firing players
+            self._identity_map.forget_players(game.game_id)
+
+    def transaction(self):
+        """
+        Transaction on the repository connection.
+
+        Repositories sharing the connection may save in it as well,
+        so everything is committed at once.
+        """
+
+        return transaction(self._conn)
+
+    def on_rollback(self, callback: Callable[[], None]):
+        """Calls the callback if the current transaction is rolled back."""
+
+        on_rollback(self._conn, callback)
+
+    def _cache_game(self, game: Game):
         self._games[game.game_id] = game
-        self._save_game_to_file(game)
+        if self._identity_map is not None:
+            self._identity_map.add_clubs(game.game_id, game.clubs)
+
+    def _forget_command(self, game_id: str, previous_seq: int):
+        # The cached game may be changed by the command already
+        self._journal_seqs[game_id] = previous_seq
+        self._games.pop(game_id, None)
+        self._snapshot_days.pop(game_id, None)
+        # Anything computed from the changed game is out of date
+        self._versions[game_id] = self.get_version(game_id) + 1
+        if self._identity_map is not None:
+            self._identity_map.forget(game_id)
+
+    def _restore_snapshot_days(self, game_id: str, days: Optional[int]):
+        if days is None:
+            self._snapshot_days.pop(game_id, None)
+        else:
+            self._snapshot_days[game_id] = days
+
+    def _get_journal_seq(self, game_id: str) -> int:
+        if game_id not in self._journal_seqs:
+            self._journal_seqs[game_id] = self._journal.get_last_seq(game_id)
+        return self._journal_seqs[game_id]
+
+    def _is_snapshot_due(self, game: Game) -> bool:
+        if self._journal is None:
+            return True
+
+        # A game that is not cached yet is new, it has to be saved in full
+        if self._games.get(game.game_id) is not game:
+            return True
+
+        days = game.days_played - self._snapshot_days[game.game_id]
+        return days >= self._snapshot_every
 
     def _load_game(self, game_id):
-        res = self._conn.execute(self._get_games_sql, {"id": game_id}).fetchone()
+        res = self._reader.execute(self._get_games_sql, {"id": game_id}).fetchone()
+        if res is None:
+            return
+
         game = pickle.loads(res[1])
-        game.rebind_clubs_to_provider()
-        self._games[game_id] = game
+        journal_seq = res[2]
+        self._snapshot_days[game_id] = game.days_played
+
+        entries = []
+        if self._journal is not None:
+            entries = self._journal.get_entries(game_id, journal_seq)
+
+        if entries:
+            # Clubs in the database are newer than the snapshot,
+            # so the journal is replayed on the clubs from the snapshot.
+            self._replayer(game, entries)
+            journal_seq = entries[-1].seq
+        else:
+            game.rebind_clubs_to_provider()
+
+        self._cache_game(game)
+        self._journal_seqs[game_id] = journal_seq
 
     def _save_game_to_file(self, game: Game):
         blob = pickle.dumps(game, pickle.HIGHEST_PROTOCOL)
 
+        journal_seq = 0
+        if self._journal is not None:
+            journal_seq = self._get_journal_seq(game.game_id)
+
         args = {
             "blob": Binary(blob),
             "id": game.game_id,
             "created_ts": game.created_ts,
             "updated_ts": game.updated_ts,
+            "journal_seq": journal_seq,
         }
 
-        self._conn.execute(self._save_game_sql, args)
-        self._conn.commit()
+        with transaction(self._conn):
+            self._conn.execute(self._save_game_sql, args)
+            if self._journal is not None:
+                self._journal.truncate(game.game_id, journal_seq)
+
+            # An outer transaction may still roll the snapshot back
+            previous_days = self._snapshot_days.get(game.game_id)
+            self._snapshot_days[game.game_id] = game.days_played
+            self.on_rollback(
+                lambda: self._restore_snapshot_days(game.game_id, previous_days)
+            )
@@ -0,0 +1,91 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+from uuid import UUID
+
+from core.club import Club
+from core.club import ClubPlayerSlot
+
+
+class IdentityMap:
+    """
+    Clubs already loaded for each game, shared by the repositories.
+
+    Every club of a game exists in memory only once, so all readers see
+    the same objects as the live game, and the database is read only when
+    the game is not loaded yet.
+    """
+
+    _clubs: Dict[str, Dict[str, Club]]
+    # Club id of every player in a roster, by game. Built on the first
+    # lookup and dropped whenever the rosters of the game may have changed.
+    _player_clubs: Dict[str, Dict[UUID, str]]
+
+    def __init__(self):
+        self._clubs = {}
+        self._player_clubs = {}
+
+    def add_clubs(self, game_id: str, clubs: Dict[str, Club]):
+        self._clubs[game_id] = clubs
+        self._player_clubs.pop(game_id, None)
+
+    def get_clubs(self, game_id: str) -> Optional[Dict[str, Club]]:
+        """Clubs ordered by name, the same way they come from the database."""
+
+        clubs = self._clubs.get(game_id)
+        if clubs is None:
+            return None
+        return {
+            club.club_id: club
+            for club in sorted(clubs.values(), key=lambda club: club.name)
+        }
+
+    def get_club(self, game_id: str, club_id: str) -> Optional[Club]:
+        return self._clubs.get(game_id, {}).get(club_id)
+
+    def find_player(
+            self,
+            game_id: str,
+            player_id: str,
+    ) -> Optional[Tuple[Club, ClubPlayerSlot]]:
+        """Club and roster slot of the player, None if nobody has him."""
+
+        player_key = UUID(str(player_id))
+        club_id = self._get_player_clubs(game_id).get(player_key)
+        club = self.get_club(game_id, club_id)
+        if club is None:
+            return None
+
+        slot = club.get_player_slot(player_key)
+        if slot is None:
+            return None
+        return club, slot
+
+    def forget_players(self, game_id: str):
+        """Should be called after players of the game are hired or fired."""
+
+        self._player_clubs.pop(game_id, None)
+
+    def has_game(self, game_id: str) -> bool:
+        return game_id in self._clubs
+
+    def forget(self, game_id: str):
+        self._clubs.pop(game_id, None)
+        self._player_clubs.pop(game_id, None)
+
+    def _get_player_clubs(self, game_id: str) -> Dict[UUID, str]:
+        player_clubs = self._player_clubs.get(game_id)
+        if player_clubs is None:
+            player_clubs = {
+                UUID(str(slot.player.player_id)): club.club_id
+                for club in self._clubs.get(game_id, {}).values()
+                for slot in club.players
+                if slot.player is not None
+            }
+            self._player_clubs[game_id] = player_clubs
+        return player_clubs
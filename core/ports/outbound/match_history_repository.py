@@ -0,0 +1,351 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+
+from core.competition import CompetitionType
+from core.game import MatchDay
+from core.match import DdMatchResult
+from persistence.transaction import transaction
+
+
+class MatchHistoryRow(NamedTuple):
+    season: int
+    competition: str
+    day: int
+    home_club_id: str
+    away_club_id: str
+    home_player_id: str
+    away_player_id: str
+    home_sets: int
+    away_sets: int
+    home_games: int
+    away_games: int
+
+
+class ClubStanding(NamedTuple):
+    club_id: str
+    matches_played: int
+    sets_won: int
+    games_won: int
+
+
+class MatchHistoryRepository:
+    """
+    Results of all played matches, kept apart from the game itself.
+
+    Results are read on the reader connection, if one is given,
+    so queries don't wait for the writer.
+    """
+
+    def __init__(self, conn, reader=None):
+        self._conn = conn
+        self._reader = conn if reader is None else reader
+
+    def save_results(
+            self,
+            game_id: str,
+            match_day: MatchDay,
+            results: Iterable[DdMatchResult],
+    ):
+        """Saves results of a single day with one statement per table."""
+
+        self.save_days(game_id, [(match_day, results)])
+
+    def save_days(
+            self,
+            game_id: str,
+            days: Iterable[Tuple[MatchDay, Iterable[DdMatchResult]]],
+    ):
+        """
+        Saves results of several days with one statement per table.
+
+        Standings of the competitions are updated in the same transaction.
+        """
+
+        keyed_results = []
+        championships = {}
+        for match_day, results in days:
+            key = {
+                "game_id": game_id,
+                "season": match_day.season,
+                "competition": match_day.competition_type.value,
+                "day": match_day.day,
+            }
+            keyed_results.extend((key, result) for result in results)
+
+            if match_day.competition_type == CompetitionType.CHAMPIONSHIP:
+                championships[match_day.season] = match_day.club_order
+
+        if not keyed_results and not championships:
+            return
+
+        with transaction(self._conn):
+            # Every club takes part in the championship, so all of them
+            # are in the standings from the first day, even without matches.
+            self._conn.executemany(
+                """
+                INSERT INTO standings (
+                    game_id,
+                    season,
+                    competition,
+                    club_id,
+                    club_order
+                )
+                VALUES (
+                    :game_id,
+                    :season,
+                    :competition,
+                    :club_id,
+                    :club_order
+                )
+                ON CONFLICT (game_id, season, competition, club_id) DO UPDATE SET
+                    club_order = excluded.club_order
+                """,
+                [
+                    {
+                        "game_id": game_id,
+                        "season": season,
+                        "competition": CompetitionType.CHAMPIONSHIP.value,
+                        "club_id": club_id,
+                        "club_order": club_order,
+                    }
+                    for season, club_ids in sorted(championships.items())
+                    for club_order, club_id in enumerate(club_ids)
+                ],
+            )
+            if keyed_results:
+                self._save_results(keyed_results)
+
+    def get_standings(
+            self,
+            game_id: str,
+            season: int,
+            competition_type: CompetitionType,
+    ) -> List[ClubStanding]:
+        """
+        Clubs ordered by sets won, then by games won.
+
+        Clubs with equal results keep their order in the competition,
+        the same way as in the championship. A new game has no saved days,
+        its first championship lists the clubs in the order of creation.
+        """
+
+        rows = self._reader.execute(
+            """
+            SELECT club_id, matches_played, sets_won, games_won
+            FROM standings
+            WHERE game_id = :game_id
+              AND season = :season
+              AND competition = :competition
+            ORDER BY sets_won DESC, games_won DESC, club_order
+            """,
+            {
+                "game_id": game_id,
+                "season": season,
+                "competition": competition_type.value,
+            },
+        ).fetchall()
+
+        if not rows and competition_type == CompetitionType.CHAMPIONSHIP:
+            rows = self._reader.execute(
+                """
+                SELECT club_id, 0, 0, 0
+                FROM club
+                WHERE game_id = :game_id
+                ORDER BY rowid
+                """,
+                {"game_id": game_id},
+            ).fetchall()
+
+        return [ClubStanding(*row) for row in rows]
+
+    def get_club_results(self, game_id: str, club_id: str) -> List[MatchHistoryRow]:
+        # UNION instead of OR, so each part goes through its own index
+        rows = self._reader.execute(
+            """
+            SELECT *
+            FROM match_result
+            WHERE game_id = :game_id
+              AND home_club_id = :club_id
+            UNION ALL
+            SELECT *
+            FROM match_result
+            WHERE game_id = :game_id
+              AND away_club_id = :club_id
+            ORDER BY match_result_id
+            """,
+            {"game_id": game_id, "club_id": club_id},
+        ).fetchall()
+
+        return [_make_history_row(row) for row in rows]
+
+    def get_player_results(
+            self,
+            game_id: str,
+            player_id: str,
+    ) -> List[MatchHistoryRow]:
+        rows = self._reader.execute(
+            """
+            SELECT *
+            FROM match_result
+            WHERE game_id = :game_id
+              AND home_player_id = :player_id
+            UNION ALL
+            SELECT *
+            FROM match_result
+            WHERE game_id = :game_id
+              AND away_player_id = :player_id
+            ORDER BY match_result_id
+            """,
+            {"game_id": game_id, "player_id": player_id},
+        ).fetchall()
+
+        return [_make_history_row(row) for row in rows]
+
+
+    def _save_results(self, keyed_results):
+        self._conn.executemany(
+            """
+            INSERT INTO match_result (
+                game_id,
+                season,
+                competition,
+                day,
+                home_club_id,
+                away_club_id,
+                home_player_id,
+                away_player_id,
+                home_sets,
+                away_sets,
+                home_games,
+                away_games
+            )
+            VALUES (
+                :game_id,
+                :season,
+                :competition,
+                :day,
+                :home_club_id,
+                :away_club_id,
+                :home_player_id,
+                :away_player_id,
+                :home_sets,
+                :away_sets,
+                :home_games,
+                :away_games
+            )
+            """,
+            [
+                _make_result_params(key, result)
+                for key, result in keyed_results
+            ],
+        )
+        self._conn.executemany(
+            """
+            INSERT INTO match_set (
+                match_result_id,
+                set_number,
+                home_games,
+                away_games,
+                set_status
+            )
+            SELECT
+                match_result_id,
+                :set_number,
+                :home_games,
+                :away_games,
+                :set_status
+            FROM match_result
+            WHERE game_id = :game_id
+              AND season = :season
+              AND competition = :competition
+              AND day = :day
+              AND home_club_id = :home_club_id
+            """,
+            [
+                params
+                for key, result in keyed_results
+                for params in _make_set_params(key, result)
+            ],
+        )
+        self._conn.executemany(
+            """
+            INSERT INTO standings (
+                game_id,
+                season,
+                competition,
+                club_id,
+                matches_played,
+                sets_won,
+                games_won
+            )
+            VALUES (
+                :game_id,
+                :season,
+                :competition,
+                :club_id,
+                1,
+                :sets_won,
+                :games_won
+            )
+            ON CONFLICT (game_id, season, competition, club_id) DO UPDATE SET
+                matches_played = matches_played + 1,
+                sets_won = sets_won + excluded.sets_won,
+                games_won = games_won + excluded.games_won
+            """,
+            [
+                params
+                for key, result in keyed_results
+                for params in _make_standings_params(key, result)
+            ],
+        )
+
+def _make_history_row(row) -> MatchHistoryRow:
+    return MatchHistoryRow(**{field: row[field] for field in MatchHistoryRow._fields})
+
+
+def _make_result_params(key, result: DdMatchResult):
+    return dict(
+        key,
+        home_club_id=result.home_pk,
+        away_club_id=result.away_pk,
+        home_player_id=result.home_player_snapshot["player_id"],
+        away_player_id=result.away_player_snapshot["player_id"],
+        home_sets=result.home_sets,
+        away_sets=result.away_sets,
+        home_games=result.home_games,
+        away_games=result.away_games,
+    )
+
+
+def _make_standings_params(key, result: DdMatchResult):
+    yield dict(
+        key,
+        club_id=result.home_pk,
+        sets_won=result.home_sets,
+        games_won=result.home_games,
+    )
+    yield dict(
+        key,
+        club_id=result.away_pk,
+        sets_won=result.away_sets,
+        games_won=result.away_games,
+    )
+
+
+def _make_set_params(key, result: DdMatchResult):
+    for set_number, set_result in enumerate(result.sets, start=1):
+        yield dict(
+            key,
+            home_club_id=result.home_pk,
+            set_number=set_number,
+            home_games=set_result.home_games,
+            away_games=set_result.away_games,
+            set_status=set_result.set_status.value,
+        )
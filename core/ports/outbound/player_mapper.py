@@ -21,4 +21,5 @@ def make_player_from_row(row) -> Player:
     player._skill_points = row["skill_points"]
     player._current_stamina = row["current_stamina"]
     player._reputation = row["reputation"]
+    player._invalidate_cache()
     return player
@@ -3,11 +3,11 @@ Created August 20, 2026
 
 @author montreal91
 """
-from sqlite3 import Row
 from typing import NamedTuple
 from typing import Optional
 
 from core.player import Player
+from core.ports.outbound.identity_map import IdentityMap
 from core.ports.outbound.player_mapper import make_player_from_row
 
 
@@ -21,15 +21,20 @@ class PlayerRosterInfo(NamedTuple):
 
 
 class PlayerRepository:
-    def __init__(self, conn):
+    def __init__(self, conn, identity_map: Optional[IdentityMap] = None):
         self._conn = conn
-        self._conn.row_factory = Row
+        self._identity_map = identity_map
 
     def get_player(
             self,
             game_id: str,
             player_id: str,
     ) -> Optional[Player]:
+        found = self._find_loaded_player(game_id, player_id)
+        if found is not None:
+            _, slot = found
+            return slot.player
+
         row = self._conn.execute(
             """
             SELECT
@@ -66,6 +71,18 @@ class PlayerRepository:
             game_id: str,
             player_id: str,
     ) -> Optional[PlayerRosterInfo]:
+        found = self._find_loaded_player(game_id, player_id)
+        if found is not None:
+            club, slot = found
+            return PlayerRosterInfo(
+                player=slot.player,
+                club_id=club.club_id,
+                club_name=club.name,
+                coach_level=slot.coach_level,
+                contract_cost=slot.contract_cost,
+                has_next_contract=slot.has_next_contract,
+            )
+
         row = self._conn.execute(
             """
             SELECT
@@ -118,3 +135,8 @@ class PlayerRepository:
                 else bool(row["has_next_contract"])
             ),
         )
+
+    def _find_loaded_player(self, game_id: str, player_id: str):
+        if self._identity_map is None:
+            return None
+        return self._identity_map.find_player(game_id, player_id)
@@ -4,25 +4,47 @@ Created August 19, 2026
 @author montreal91
 """
 import json
+from collections import defaultdict
 from sqlite3 import Row
-from typing import Dict, Optional
+from typing import Dict
 from typing import Any
 from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
 
 from core.club import Club
 from core.club import ClubPlayerSlot
 from core.financial import DdTransaction
 from core.player import Player
+from core.ports.outbound.identity_map import IdentityMap
 from core.ports.outbound.player_mapper import make_player_from_row
 from core.serialization import DdJsonDecoder
+from persistence.transaction import on_rollback
+from persistence.transaction import transaction
 
 
 class TemporalClubProvider:
     _INSTANCE = None
 
+    # Rows as they are stored in the database, by table name and primary key.
+    # Only rows that differ from them are written on save.
+    _flushed_rows: Dict[Tuple[str, ...], Tuple[Any, ...]]
+    # Ids of players in the roster of each club as stored in the database
+    _flushed_rosters: Dict[Tuple[str, str], Set[str]]
+
     @staticmethod
-    def initialize(conn=None):
-        TemporalClubProvider._INSTANCE = TemporalClubProvider(conn)
+    def initialize(
+            conn=None,
+            identity_map: Optional[IdentityMap] = None,
+            reader=None,
+    ):
+        TemporalClubProvider._INSTANCE = TemporalClubProvider(
+            conn,
+            identity_map,
+            reader,
+        )
 
     @staticmethod
     def get_instance() -> "TemporalClubProvider": # LOL
@@ -31,11 +53,20 @@ class TemporalClubProvider:
 
         return TemporalClubProvider._INSTANCE
 
-    def __init__(self, conn=None):
+    def __init__(
+            self,
+            conn=None,
+            identity_map: Optional[IdentityMap] = None,
+            reader=None,
+    ):
         self._conn = conn
+        # Clubs are loaded on it, so queries that load them don't need the writer
+        self._reader = conn if reader is None else reader
+        self._identity_map = identity_map
+        self._flushed_rows = {}
+        self._flushed_rosters = {}
 
         if self._conn is not None:
-            self._conn.row_factory = Row
             self._conn.execute("PRAGMA foreign_keys = ON;")
 
     def init_clubs_for_game(self, game_id: str) -> Dict[str, Club]:
@@ -81,6 +112,13 @@ class TemporalClubProvider:
         clubs[club.club_id] = club
 
     def save_clubs(self, clubs: Iterable[Club]):
+        """
+        Saves clubs with their rosters and players.
+
+        Only rows which changed since they were last saved or loaded
+        are written, with one statement per kind of change.
+        """
+
         clubs = list(clubs)
         if not clubs:
             return
@@ -88,27 +126,39 @@ class TemporalClubProvider:
         if self._conn is None:
             raise RuntimeError("TemporalClubProvider has no SQLite connection.")
 
-        with self._conn:
-            for club in clubs:
-                self._save_club(club, delete_existing_roster=True)
+        with transaction(self._conn):
+            on_rollback(self._conn, self._forget_flushed_rows)
+            self._save_clubs(clubs)
 
     def save_club(self, club: Club):
-        if self._conn is None:
-            raise RuntimeError("TemporalClubProvider has no SQLite connection.")
-
-        with self._conn:
-            self._save_club(club, delete_existing_roster=True)
+        self.save_clubs([club])
 
     def get_clubs_for_game(self, game_id: str) -> Dict[str, Club]:
-        return self._load_clubs_for_game(game_id)
+        if self._identity_map is None:
+            return self._load_clubs_for_game(game_id)
+
+        clubs = self._identity_map.get_clubs(game_id)
+        if clubs is None:
+            clubs = self._load_clubs_for_game(game_id)
+            if clubs:
+                self._identity_map.add_clubs(game_id, clubs)
+        return clubs
 
     def _load_clubs_for_game(self, game_id: str) -> Dict[str, Club]:
+        """
+        Loads all clubs of the game with three queries.
+
+        Clubs, players and roster entries are each read at once
+        and put together in memory.
+        """
+
         if self._conn is None:
             return {}
 
         clubs = {}
         players = self._load_players_for_game(game_id)
-        club_rows = self._conn.execute(
+        rosters = self._load_rosters_for_game(game_id)
+        club_rows = self._reader.execute(
             """
             SELECT *
             FROM club
@@ -130,21 +180,7 @@ class TemporalClubProvider:
                 "Loaded balance",
             ))
 
-            roster_rows = self._conn.execute(
-                """
-                SELECT *
-                FROM roster_entry
-                WHERE game_id = :game_id
-                  AND club_id = :club_id
-                ORDER BY rowid
-                """,
-                {
-                    "game_id": game_id,
-                    "club_id": club.club_id,
-                },
-            ).fetchall()
-
-            for roster_row in roster_rows:
+            for roster_row in rosters.get(club.club_id, []):
                 player = players.get(roster_row["player_id"])
                 if player is None:
                     continue
@@ -157,11 +193,29 @@ class TemporalClubProvider:
 
             club.select_player(club_row["selected_player_id"])
             clubs[club.club_id] = club
+            self._remember_club(club)
 
         return clubs
 
+    def _load_rosters_for_game(self, game_id: str) -> Dict[str, List[Row]]:
+        rows = self._reader.execute(
+            """
+            SELECT *
+            FROM roster_entry
+            WHERE game_id = :game_id
+            ORDER BY rowid
+            """,
+            {"game_id": game_id},
+        ).fetchall()
+
+        rosters = defaultdict(list)
+        for row in rows:
+            rosters[row["club_id"]].append(row)
+
+        return rosters
+
     def _load_players_for_game(self, game_id: str) -> Dict[str, Player]:
-        rows = self._conn.execute(
+        rows = self._reader.execute(
             """
             SELECT *
             FROM player
@@ -177,160 +231,255 @@ class TemporalClubProvider:
 
         return players
 
-    def _save_club(self, club: Club, delete_existing_roster: bool):
-        if delete_existing_roster:
-            self._conn.execute(
-                """
-                DELETE FROM roster_entry
-                WHERE game_id = :game_id
-                  AND club_id = :club_id
-                """,
-                {
-                     "game_id": club.game_id,
-                    "club_id": club.club_id,
-                },
+    def _save_clubs(self, clubs: List[Club]):
+        whole_roster_deletes = []
+        roster_entry_deletes = []
+        player_rows = []
+        club_rows = []
+        roster_rows = []
+
+        for club in clubs:
+            slots = [slot for slot in club.players if slot.player is not None]
+            player_ids = {slot.player.player_id for slot in slots}
+            flushed_roster = self._flushed_rosters.get(_club_key(club))
+
+            if flushed_roster is None:
+                # Nothing is known about the roster in the database,
+                # so it is written from scratch.
+                whole_roster_deletes.append(
+                    {"game_id": club.game_id, "club_id": club.club_id}
+                )
+            else:
+                roster_entry_deletes.extend(
+                    {
+                        "game_id": club.game_id,
+                        "club_id": club.club_id,
+                        "player_id": player_id,
+                    }
+                    for player_id in flushed_roster - player_ids
+                )
+
+            for slot in slots:
+                player_rows.append(_make_player_row(club.game_id, slot.player))
+                roster_rows.append(_make_roster_row(club, slot))
+            club_rows.append(_make_club_row(club))
+
+        player_rows = self._filter_changed(_PLAYER, player_rows)
+        club_rows = self._filter_changed(_CLUB, club_rows)
+        # Deleted rosters lose all their entries
+        rewritten = {(row["game_id"], row["club_id"]) for row in whole_roster_deletes}
+        roster_rows = [
+            row for row in roster_rows
+            if (row["game_id"], row["club_id"]) in rewritten
+            or self._is_changed(_ROSTER_ENTRY, row)
+        ]
+
+        self._conn.executemany(_DELETE_ROSTER_SQL, whole_roster_deletes)
+        self._conn.executemany(_DELETE_ROSTER_ENTRY_SQL, roster_entry_deletes)
+        self._conn.executemany(_UPSERT_PLAYER_SQL, player_rows)
+        self._conn.executemany(_UPSERT_CLUB_SQL, club_rows)
+        self._conn.executemany(_UPSERT_ROSTER_ENTRY_SQL, roster_rows)
+
+        for row in roster_entry_deletes:
+            self._flushed_rows.pop(
+                (_ROSTER_ENTRY, row["game_id"], row["player_id"]),
+                None,
             )
+        for club in clubs:
+            self._remember_club(club)
 
-        for slot in club.players:
-            self._upsert_player(club.game_id, slot.player)
+    def _filter_changed(self, kind: str, rows: List[Dict[str, Any]]):
+        return [row for row in rows if self._is_changed(kind, row)]
 
-        self._upsert_club(club)
+    def _is_changed(self, kind: str, row: Dict[str, Any]) -> bool:
+        return self._flushed_rows.get(_row_key(kind, row)) != _row_image(row)
 
-        for slot in club.players:
-            self._upsert_roster_entry(club, slot)
+    def _forget_flushed_rows(self):
+        self._flushed_rows.clear()
+        self._flushed_rosters.clear()
 
-    def _upsert_player(self, game_id: str, player: Optional[Player]):
-        if player is None:
-            return
+    def _remember_club(self, club: Club):
+        """Remembers the club as it is stored in the database."""
 
-        self._conn.execute(
-            """
-            INSERT INTO player (
-                game_id,
-                player_id,
-                first_name,
-                second_name,
-                last_name,
-                age,
-                technique,
-                endurance,
-                exhaustion,
-                experience,
-                skill_points,
-                current_stamina,
-                reputation
-            )
-            VALUES (
-                :game_id,
-                :player_id,
-                :first_name,
-                :second_name,
-                :last_name,
-                :age,
-                :technique,
-                :endurance,
-                :exhaustion,
-                :experience,
-                :skill_points,
-                :current_stamina,
-                :reputation
-            )
-            ON CONFLICT(game_id, player_id) DO UPDATE SET
-                first_name = excluded.first_name,
-                second_name = excluded.second_name,
-                last_name = excluded.last_name,
-                age = excluded.age,
-                technique = excluded.technique,
-                endurance = excluded.endurance,
-                exhaustion = excluded.exhaustion,
-                experience = excluded.experience,
-                skill_points = excluded.skill_points,
-                current_stamina = excluded.current_stamina,
-                reputation = excluded.reputation
-            """,
-            {
-                "game_id": game_id,
-                "player_id": player.player_id,
-                "first_name": player.first_name,
-                "second_name": player.second_name,
-                "last_name": player.last_name,
-                "age": player.age,
-                "technique": player.technique,
-                "endurance": player.endurance,
-                "exhaustion": player.exhaustion,
-                "experience": player.experience,
-                "skill_points": player.skill_points,
-                "current_stamina": player.current_stamina,
-                "reputation": player.reputation,
-            },
-        )
+        slots = [slot for slot in club.players if slot.player is not None]
+        rows = [(_CLUB, _make_club_row(club))]
+        for slot in slots:
+            rows.append((_PLAYER, _make_player_row(club.game_id, slot.player)))
+            rows.append((_ROSTER_ENTRY, _make_roster_row(club, slot)))
 
-    def _upsert_club(self, club: Club):
-        self._conn.execute(
-            """
-            INSERT INTO club (
-                game_id,
-                club_id,
-                name,
-                balance,
-                coach_power,
-                selected_player_id
-            )
-            VALUES (
-                :game_id,
-                :club_id,
-                :name,
-                :balance,
-                :coach_power,
-                :selected_player_id
-            )
-            ON CONFLICT(game_id, club_id) DO UPDATE SET
-                name = excluded.name,
-                balance = excluded.balance,
-                coach_power = excluded.coach_power,
-                selected_player_id = excluded.selected_player_id
-            """,
-            {
-                "game_id": club.game_id,
-                "club_id": club.club_id,
-                "name": club.name,
-                "balance": club.account.balance,
-                "coach_power": club.coach_power,
-                "selected_player_id": club._selected_player,
-            },
-        )
+        for kind, row in rows:
+            self._flushed_rows[_row_key(kind, row)] = _row_image(row)
 
-    def _upsert_roster_entry(self, club: Club, slot: ClubPlayerSlot):
-        self._conn.execute(
-            """
-            INSERT INTO roster_entry (
-                game_id,
-                club_id,
-                player_id,
-                coach_level,
-                contract_cost,
-                has_next_contract
-            )
-            VALUES (
-                :game_id,
-                :club_id,
-                :player_id,
-                :coach_level,
-                :contract_cost,
-                :has_next_contract
-            )
-            ON CONFLICT(game_id, player_id) DO UPDATE SET
-                club_id = excluded.club_id,
-                coach_level = excluded.coach_level,
-                contract_cost = excluded.contract_cost,
-                has_next_contract = excluded.has_next_contract
-            """,
-            {
-                "game_id": club.game_id,
-                "club_id": club.club_id,
-                "player_id": slot.player.player_id,
-                "coach_level": slot.coach_level,
-                "contract_cost": slot.contract_cost,
-                "has_next_contract": int(slot.has_next_contract),
-            },
-        )
+        self._flushed_rosters[_club_key(club)] = {
+            slot.player.player_id for slot in slots
+        }
+
+
+_PLAYER = "player"
+_CLUB = "club"
+_ROSTER_ENTRY = "roster_entry"
+
+# Names of the primary key columns of each table
+_PRIMARY_KEYS = {
+    _PLAYER: ("game_id", "player_id"),
+    _CLUB: ("game_id", "club_id"),
+    _ROSTER_ENTRY: ("game_id", "player_id"),
+}
+
+_DELETE_ROSTER_SQL = """
+    DELETE FROM roster_entry
+    WHERE game_id = :game_id
+      AND club_id = :club_id
+"""
+
+_DELETE_ROSTER_ENTRY_SQL = """
+    DELETE FROM roster_entry
+    WHERE game_id = :game_id
+      AND club_id = :club_id
+      AND player_id = :player_id
+"""
+
+_UPSERT_PLAYER_SQL = """
+    INSERT INTO player (
+        game_id,
+        player_id,
+        first_name,
+        second_name,
+        last_name,
+        age,
+        technique,
+        endurance,
+        exhaustion,
+        experience,
+        skill_points,
+        current_stamina,
+        reputation
+    )
+    VALUES (
+        :game_id,
+        :player_id,
+        :first_name,
+        :second_name,
+        :last_name,
+        :age,
+        :technique,
+        :endurance,
+        :exhaustion,
+        :experience,
+        :skill_points,
+        :current_stamina,
+        :reputation
+    )
+    ON CONFLICT(game_id, player_id) DO UPDATE SET
+        first_name = excluded.first_name,
+        second_name = excluded.second_name,
+        last_name = excluded.last_name,
+        age = excluded.age,
+        technique = excluded.technique,
+        endurance = excluded.endurance,
+        exhaustion = excluded.exhaustion,
+        experience = excluded.experience,
+        skill_points = excluded.skill_points,
+        current_stamina = excluded.current_stamina,
+        reputation = excluded.reputation
+"""
+
+_UPSERT_CLUB_SQL = """
+    INSERT INTO club (
+        game_id,
+        club_id,
+        name,
+        balance,
+        coach_power,
+        selected_player_id
+    )
+    VALUES (
+        :game_id,
+        :club_id,
+        :name,
+        :balance,
+        :coach_power,
+        :selected_player_id
+    )
+    ON CONFLICT(game_id, club_id) DO UPDATE SET
+        name = excluded.name,
+        balance = excluded.balance,
+        coach_power = excluded.coach_power,
+        selected_player_id = excluded.selected_player_id
+"""
+
+_UPSERT_ROSTER_ENTRY_SQL = """
+    INSERT INTO roster_entry (
+        game_id,
+        club_id,
+        player_id,
+        coach_level,
+        contract_cost,
+        has_next_contract
+    )
+    VALUES (
+        :game_id,
+        :club_id,
+        :player_id,
+        :coach_level,
+        :contract_cost,
+        :has_next_contract
+    )
+    ON CONFLICT(game_id, player_id) DO UPDATE SET
+        club_id = excluded.club_id,
+        coach_level = excluded.coach_level,
+        contract_cost = excluded.contract_cost,
+        has_next_contract = excluded.has_next_contract
+"""
+
+
+def _club_key(club: Club) -> Tuple[str, str]:
+    return club.game_id, club.club_id
+
+
+def _row_key(kind: str, row: Dict[str, Any]) -> Tuple[str, ...]:
+    return (kind, *(row[column] for column in _PRIMARY_KEYS[kind]))
+
+
+def _row_image(row: Dict[str, Any]) -> Tuple[Any, ...]:
+    return tuple(row.values())
+
+
+def _make_player_row(game_id: str, player: Player) -> Dict[str, Any]:
+    return {
+        "game_id": game_id,
+        "player_id": player.player_id,
+        "first_name": player.first_name,
+        "second_name": player.second_name,
+        "last_name": player.last_name,
+        "age": player.age,
+        "technique": player.technique,
+        "endurance": player.endurance,
+        "exhaustion": player.exhaustion,
+        "experience": player.experience,
+        "skill_points": player.skill_points,
+        "current_stamina": player.current_stamina,
+        "reputation": player.reputation,
+    }
+
+
+def _make_club_row(club: Club) -> Dict[str, Any]:
+    return {
+        "game_id": club.game_id,
+        "club_id": club.club_id,
+        "name": club.name,
+        "balance": club.account.balance,
+        "coach_power": club.coach_power,
+        "selected_player_id": club._selected_player,
+    }
+
+
+def _make_roster_row(club: Club, slot: ClubPlayerSlot) -> Dict[str, Any]:
+    return {
+        "game_id": club.game_id,
+        "club_id": club.club_id,
+        "player_id": slot.player.player_id,
+        "coach_level": slot.coach_level,
+        "contract_cost": slot.contract_cost,
+        "has_next_contract": int(slot.has_next_contract),
+    }
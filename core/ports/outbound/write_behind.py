@@ -0,0 +1,177 @@
+"""
+Deferred saving of games and clubs.
+
+Created October 18, 2026
+
+@author montreal91
+"""
+import logging
+import threading
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+
+from core.club import Club
+from core.game import Game
+
+
+class WriteBehindQueue:
+    """
+    Coalesces saves of games and clubs and writes them a bit later.
+
+    Commands that save through game_repository and club_provider of the
+    queue only leave the game and its clubs pending. Pending changes of a
+    game are written in one transaction when the game is flushed: after
+    delay seconds, before the game advances a day and on close. Every save
+    of a game or a club replaces its pending save, so a burst of commands
+    is written once.
+
+    The game is still marked as changed in the repository at once,
+    so read models never get stale.
+    """
+
+    _games: Dict[str, Game]
+    _clubs: Dict[str, Dict[str, Club]]
+    _timer: Optional[threading.Timer]
+
+    def __init__(self, game_repository, club_provider, delay: float, lock=None):
+        self._game_repository = game_repository
+        self._club_provider = club_provider
+        self._delay = delay
+        self._lock = threading.RLock() if lock is None else lock
+
+        self._games = {}
+        self._clubs = {}
+        self._timer = None
+
+    @property
+    def game_repository(self) -> "_DeferredGameRepository":
+        return _DeferredGameRepository(self, self._game_repository)
+
+    @property
+    def club_provider(self) -> "_DeferredClubProvider":
+        return _DeferredClubProvider(self, self._club_provider)
+
+    def save_game(self, game: Game):
+        with self._lock:
+            self._games[game.game_id] = game
+            self._game_repository.mark_changed(game)
+            self._schedule_flush()
+
+    def save_clubs(self, clubs: Iterable[Club]):
+        with self._lock:
+            for club in clubs:
+                self._clubs.setdefault(club.game_id, {})[club.club_id] = club
+            self._schedule_flush()
+
+    def has_pending(self, game_id: str) -> bool:
+        with self._lock:
+            return game_id in self._games or game_id in self._clubs
+
+    def flush(self, game_id: Optional[str] = None):
+        """Writes pending changes of the game, or of all games."""
+
+        with self._lock:
+            if game_id is None:
+                game_ids = set(self._games) | set(self._clubs)
+            else:
+                game_ids = {game_id}
+
+            for pending_game_id in sorted(game_ids):
+                self._flush_game(pending_game_id)
+
+    def close(self):
+        """Writes all pending changes and stops the timer."""
+
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self.flush()
+
+    def _flush_game(self, game_id: str):
+        game = self._games.pop(game_id, None)
+        clubs = self._clubs.pop(game_id, {})
+        if game is None and not clubs:
+            return
+
+        # Changes stay pending if they are not written, or if the outer
+        # transaction the flush has joined is rolled back later.
+        try:
+            with self._game_repository.transaction():
+                self._game_repository.on_rollback(
+                    lambda: self._restore(game, clubs),
+                )
+                if game is not None:
+                    self._game_repository.save_game(game)
+                self._club_provider.save_clubs(clubs.values())
+        except BaseException:
+            self._restore(game, clubs)
+            raise
+
+    def _restore(self, game: Optional[Game], clubs: Dict[str, Club]):
+        # Newer pending saves of the same objects win
+        with self._lock:
+            if game is not None:
+                self._games.setdefault(game.game_id, game)
+            for club in clubs.values():
+                self._clubs.setdefault(club.game_id, {}).setdefault(
+                    club.club_id,
+                    club,
+                )
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        if self._timer is not None:
+            return
+
+        self._timer = threading.Timer(self._delay, self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self):
+        with self._lock:
+            self._timer = None
+            try:
+                self.flush()
+            except Exception:
+                logging.exception("Pending saves were not written")
+
+
+class FlushingCommandHandler:
+    """Writes pending saves of the game before the command is applied."""
+
+    def __init__(self, handler, write_behind_queue: WriteBehindQueue):
+        self._handler = handler
+        self._write_behind_queue = write_behind_queue
+
+    def __call__(self, command):
+        self._write_behind_queue.flush(command.game_id)
+        return self._handler(command)
+
+
+class _DeferredGameRepository:
+    def __init__(self, write_behind_queue: WriteBehindQueue, game_repository):
+        self._write_behind_queue = write_behind_queue
+        self._game_repository = game_repository
+
+    def __getattr__(self, name):
+        return getattr(self._game_repository, name)
+
+    def save_game(self, game: Game):
+        self._write_behind_queue.save_game(game)
+
+
+class _DeferredClubProvider:
+    def __init__(self, write_behind_queue: WriteBehindQueue, club_provider):
+        self._write_behind_queue = write_behind_queue
+        self._club_provider = club_provider
+
+    def __getattr__(self, name):
+        return getattr(self._club_provider, name)
+
+    def save_clubs(self, clubs: Iterable[Club]):
+        self._write_behind_queue.save_clubs(clubs)
+
+    def save_club(self, club: Club):
+        self._write_behind_queue.save_clubs([club])
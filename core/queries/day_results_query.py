@@ -12,10 +12,9 @@ from core.match import DdMatchResult
 from core.ports.outbound.temporal_club_provider import TemporalClubProvider
 
 
-class DayResultsQuery:
-    def __init__(self, game_id, manager_club_id):
-        self.game_id = game_id
-        self.manager_club_id = manager_club_id
+class DayResultsQuery(NamedTuple):
+    game_id: str
+    manager_club_id: str
 
 
 class SingleMatchResult(NamedTuple):
@@ -43,7 +42,7 @@ class DayResultsQueryHandler:
         game_context = self._game_repository.get_game(query.game_id).get_context(query.manager_club_id)
         clubs = self._club_provider.get_clubs_for_game(query.game_id)
 
-        last_results = game_context["last_results"]
+        last_results = game_context.last_results
         results = []
         for result in last_results:
             results.append(_make_single_match_result(result, clubs, query.manager_club_id))
@@ -15,6 +15,11 @@ _NO_PLAYOFF_CLUB_ID = ""
 _NO_PLAYOFF_VALUE = "N/A"
 
 
+class GameScreenQuery(NamedTuple):
+    game_id: str
+    manager_club_id: str
+
+
 class UpcomingMatch(NamedTuple):
     opponent_club_name: str
     home_away: str
@@ -64,16 +69,24 @@ class QueryResult(NamedTuple):
 
 
 class GameScreenGuiQueryHandler:
-    def __init__(self, game_repository, club_provider: TemporalClubProvider):
+    def __init__(
+            self,
+            game_repository,
+            club_provider: TemporalClubProvider,
+            match_history_repository,
+    ):
         self._game_repository = game_repository
         self._club_provider = club_provider
+        self._match_history_repository = match_history_repository
 
-    def __call__(self, game_id, manager_club_id):
+    def __call__(self, query: GameScreenQuery) -> QueryResult:
+        game_id = query.game_id
+        manager_club_id = query.manager_club_id
         game = self._game_repository.get_game(game_id)
         context = game.get_context(manager_club_id)
         clubs = self._club_provider.get_clubs_for_game(game_id)
 
-        match = _get_match(competition=game.competition, club_id=manager_club_id)
+        match = game.competition.get_current_match(manager_club_id)
 
         upcoming_match = None
 
@@ -93,23 +106,15 @@ class GameScreenGuiQueryHandler:
             else:
                 raise Exception("WTF Happened")
 
-        if context["competition_type"] == CompetitionType.CHAMPIONSHIP:
-            raw_standings = context.get("standings", [])
-            res_standings = []
-
-            for pos, standing in enumerate(raw_standings):
-                res_standings.append(StandingRow(
-                    pos=pos + 1,
-                    club_id=standing.club_id,
-                    sets=standing.sets_won,
-                    games=standing.games_won,
-                    club_name=clubs[standing.club_id].name,
-                ))
-
-            standings = ChampionshipStandings(rows=res_standings)
-        elif context["competition_type"] == CompetitionType.PLAY_OFFS:
+        if context.competition_type == CompetitionType.CHAMPIONSHIP:
+            standings = self._make_championship_standings(
+                game_id=game_id,
+                season=len(context.history),
+                clubs=clubs,
+            )
+        elif context.competition_type == CompetitionType.PLAY_OFFS:
             standings = _make_playoff_standings(
-                raw_standings=context.get("standings", []),
+                raw_standings=context.standings,
                 clubs=clubs,
                 manager_club_id=manager_club_id,
             )
@@ -117,13 +122,13 @@ class GameScreenGuiQueryHandler:
             raise Exception("Unknown competition type")
 
         return QueryResult(
-            day=context["day"],
-            season=len(context["history"]),
-            balance=context["balance"],
-            club_name=context["club_name"],
-            current_competition=context["competition"],
-            competition_type=context["competition_type"],
-            has_matches=context["has_matches"],
+            day=context.day,
+            season=len(context.history),
+            balance=context.balance,
+            club_name=context.club_name,
+            current_competition=context.competition,
+            competition_type=context.competition_type,
+            has_matches=context.has_matches,
             level_ups_count=_count_players_with_unspent_skill_points(
                 clubs,
                 manager_club_id,
@@ -133,6 +138,31 @@ class GameScreenGuiQueryHandler:
         )
 
 
+    def _make_championship_standings(
+            self,
+            game_id,
+            season,
+            clubs,
+    ) -> ChampionshipStandings:
+        raw_standings = self._match_history_repository.get_standings(
+            game_id,
+            season,
+            CompetitionType.CHAMPIONSHIP,
+        )
+
+        res_standings = []
+        for pos, standing in enumerate(raw_standings):
+            res_standings.append(StandingRow(
+                pos=pos + 1,
+                club_id=standing.club_id,
+                sets=standing.sets_won,
+                games=standing.games_won,
+                club_name=clubs[standing.club_id].name,
+            ))
+
+        return ChampionshipStandings(rows=res_standings)
+
+
 def _count_players_with_unspent_skill_points(clubs, manager_club_id) -> int:
     club = clubs.get(manager_club_id)
 
@@ -236,15 +266,3 @@ def _largest_power_of_two(value):
         res *= 2
     return res
 
-
-def _get_match(competition, club_id):
-    matches = competition.current_matches
-
-    if matches is None:
-        return None
-
-    for match in matches:
-        if match.home_pk == club_id or match.away_pk == club_id:
-            return match
-
-    return None
@@ -49,12 +49,12 @@ class PracticeScreenQueryHandler:
         context = game.get_context(query.manager_club_id)
         players = [
             _player_slot_to_practice_info(game, player_slot, player_pos)
-            for player_pos, player_slot in enumerate(context["user_players"])
+            for player_pos, player_slot in enumerate(context.user_players)
         ]
 
         return PracticeScreenQueryResult(
             success=True,
-            balance=context["balance"],
+            balance=context.balance,
             players=players,
         )
 
@@ -0,0 +1,75 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+from collections import OrderedDict
+from typing import Any
+from typing import Hashable
+from typing import Tuple
+
+_MISSING = object()
+
+
+class ReadModelCache:
+    """Bounded LRU cache of query results."""
+
+    def __init__(self, max_size: int = 128):
+        self._max_size = max_size
+        self._results: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(self, key: Hashable, default=None):
+        result = self._results.get(key, _MISSING)
+        if result is _MISSING:
+            return default
+
+        self._results.move_to_end(key)
+        return result
+
+    def put(self, key: Hashable, result: Any):
+        self._results[key] = result
+        self._results.move_to_end(key)
+
+        while len(self._results) > self._max_size:
+            self._results.popitem(last=False)
+
+    def clear(self):
+        self._results.clear()
+
+
+class CachedQueryHandler:
+    """
+    Returns a cached result while the game has not changed since the query.
+
+    Results are keyed by the query and by the version of its game, which
+    GameRepository increments every time a command saves the game. So no
+    explicit invalidation is needed, old results are just never asked for
+    again and fall out of the cache.
+
+    Queries should be hashable, and their results should not be changed
+    by the callers.
+    """
+
+    def __init__(self, handler, cache: ReadModelCache, game_repository):
+        self._handler = handler
+        self._cache = cache
+        self._game_repository = game_repository
+
+    def __call__(self, query):
+        key = self._make_key(query)
+
+        result = self._cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = self._handler(query)
+            self._cache.put(key, result)
+        return result
+
+    def _make_key(self, query) -> Tuple[Any, ...]:
+        return (
+            type(query),
+            query,
+            self._game_repository.get_version(query.game_id),
+        )
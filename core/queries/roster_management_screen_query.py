@@ -52,14 +52,14 @@ class RosterManagementScreenQueryHandler:
         context = game.get_context(query.manager_club_id)
         roster = [
             _player_slot_to_roster_info(player_slot, player_pos)
-            for player_pos, player_slot in enumerate(context["user_players"])
+            for player_pos, player_slot in enumerate(context.user_players)
         ]
 
         return RosterManagementScreenQueryResult(
             success=True,
             message="Ok",
             roster=roster,
-            balance=context["balance"],
+            balance=context.balance,
         )
 
 
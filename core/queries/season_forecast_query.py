@@ -0,0 +1,79 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+
+from core.season_forecast import SeasonForecaster
+
+
+class SeasonForecastQuery(NamedTuple):
+    game_id: str
+    runs: int = 1000
+    seed: int = 0
+
+
+class ClubOdds(NamedTuple):
+    club_id: str
+    club_name: str
+    expected_position: float
+    position_probabilities: Tuple[float, ...]
+    playoff_probability: float
+    cup_probability: float
+
+
+class SeasonForecastQueryResult(NamedTuple):
+    success: bool
+    message: str
+    runs: int
+    clubs: List[ClubOdds]
+
+
+class SeasonForecastQueryHandler:
+    def __init__(self, game_repository):
+        self._game_repository = game_repository
+
+    def __call__(self, query: SeasonForecastQuery) -> SeasonForecastQueryResult:
+        game = self._game_repository.get_game(query.game_id)
+
+        if game is None:
+            return SeasonForecastQueryResult(
+                success=False,
+                message=f"Game with id={query.game_id} not found",
+                runs=0,
+                clubs=[],
+            )
+
+        forecaster = SeasonForecaster(runs=query.runs, seed=query.seed)
+        forecast = forecaster(game)
+
+        clubs = [
+            _make_club_odds(club_forecast, game.clubs[club_id].name)
+            for club_id, club_forecast in forecast.clubs.items()
+        ]
+        clubs.sort(key=lambda odds: odds.expected_position)
+
+        return SeasonForecastQueryResult(
+            success=True,
+            message="Ok",
+            runs=forecast.runs,
+            clubs=clubs,
+        )
+
+
+def _make_club_odds(club_forecast, club_name) -> ClubOdds:
+    probabilities = club_forecast.position_probabilities
+    return ClubOdds(
+        club_id=club_forecast.club_id,
+        club_name=club_name,
+        expected_position=sum(
+            (pos + 1) * probability
+            for pos, probability in enumerate(probabilities)
+        ),
+        position_probabilities=probabilities,
+        playoff_probability=club_forecast.playoff_probability,
+        cup_probability=club_forecast.cup_probability,
+    )
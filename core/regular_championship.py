@@ -4,11 +4,16 @@ Created May 20, 2019
 
 @author montreal91
 """
-from random import shuffle
+from bisect import bisect_left
+from bisect import insort
+from typing import Any
 from typing import Dict
 from typing import Generator
+from typing import Iterable
 from typing import List
 from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
 
 from core.competition import DdAbstractCompetition
 from core.competition import ScheduleDay
@@ -16,6 +21,8 @@ from core.match import DdMatchParams
 from core.match import DdMatchResult
 from core.match import DdScheduledMatchStruct
 from core.match import DdStandingsRowStruct
+from core.rng import GameRng
+from core.rng import ensure_rng
 
 
 class ChampionshipParams(NamedTuple):
@@ -31,14 +38,27 @@ class RegularChampionship(DdAbstractCompetition):
     """A class to encapsulate logic of a regular championship."""
 
     _params: ChampionshipParams
-    _results: List[List[DdMatchResult]]
-    _standings: Dict[int, List[DdStandingsRowStruct]]
+    _table: "_StandingsTable"
 
-    def __init__(self, clubs, params):
+    def __init__(self, clubs, params, rng: Optional[GameRng] = None):
         super().__init__(clubs, params)
-        self._make_schedule()
+        self._make_schedule(ensure_rng(rng))
 
-        self._standings = {}
+        self._table = _StandingsTable(self._clubs)
+
+    def __setstate__(self, state: Dict[str, Any]):
+        # Games saved before the table was introduced kept all the results
+        # and cached sorted standings for every day instead, so the table is
+        # rebuilt from the results.
+        state.pop("_standings", None)
+        legacy_results = state.pop("_results", [])
+        self.__dict__.update(state)
+
+        if "_table" not in state:
+            self._table = _StandingsTable(self._clubs)
+            for day in legacy_results:
+                for match in day:
+                    self._table.add_result(match)
 
     @property
     def is_over(self) -> bool:
@@ -50,61 +70,43 @@ class RegularChampionship(DdAbstractCompetition):
 
     @property
     def standings(self) -> List[DdStandingsRowStruct]:
-        if self._day in self._standings:
-            return self._standings[self._day]
-
-        # results = [DdStandingsRowStruct(i) for i in self._clubs]
-        results = {}
-        for club_id in self._clubs:
-            results[club_id] = DdStandingsRowStruct(club_id=club_id)
-
-        for day in self._results:
-            for match in day:
-                results[match.home_pk].sets_won += match.home_sets
-                results[match.home_pk].games_won += match.home_games
+        """
+        Clubs ordered by sets won, then by games won.
 
-                results[match.away_pk].sets_won += match.away_sets
-                results[match.away_pk].games_won += match.away_games
+        Rows are live: they keep changing as the championship goes on.
+        """
 
-        results_list = [results[cid] for cid in results]
+        return self._table.ranking
 
-        self._standings[self._day] = sorted(
-            results_list,
-            key=lambda x: (x.sets_won, x.games_won),
-            reverse=True
-        )
+    @property
+    def club_order(self) -> Tuple[str, ...]:
+        """Clubs in the order that breaks ties in the standings."""
 
-        return self._standings[self._day]
+        return tuple(self._table.club_ids)
 
     @property
     def title(self):
         return "Regular Season"
 
     def get_club_fame(self, club_pk):
-        for pos, row in enumerate(self.standings):
-            if row.club_id == club_pk and pos == 0:
-                return 500
+        if self._table.get_position(club_pk) == 0:
+            return 500
 
         return 0
 
-    def update(self) -> List[DdMatchResult]:
+    def get_club_position(self, club_pk: str) -> int:
+        """Zero-based position of the club in the standings."""
+
+        return self._table.get_position(club_pk)
+
+    def update(self, rng: Optional[GameRng] = None) -> List[DdMatchResult]:
         if self.current_matches is None:
             self._day += 1
             return []
-        day_results = []
-        for match in self.current_matches:
-            processor = self._make_match_processor()
-            res = processor.process_match(
-                self._clubs[match.home_pk].selected_player,
-                self._clubs[match.away_pk].selected_player,
-            )
-            match.is_played = True
-
-            res.home_pk = match.home_pk
-            res.away_pk = match.away_pk
-            day_results.append(res)
+        day_results = self._play_matches(self.current_matches, rng)
         self._day += 1
-        self._results.append(day_results)
+        for match in day_results:
+            self._table.add_result(match)
         return day_results
 
     def _make_full_schedule(self, pk_list: List[str]):
@@ -138,24 +140,92 @@ class RegularChampionship(DdAbstractCompetition):
                 res.extend(compose_days(match, in_div))
         return res
 
-    def _make_schedule(self):
+    def _make_schedule(self, rng: GameRng):
         pk_list = [cid for cid in self._clubs]
-        shuffle(pk_list)
+        rng.shuffle(pk_list)
         days = self._make_full_schedule(pk_list)
-        shuffle(days)
+        rng.shuffle(days)
 
         day = -1
         done = 0
         while done < len(days):
             day += 1
             if day % self._params.recovery_day == 0:
-                self._schedule.append(None)
+                self._add_schedule_day(None)
                 continue
 
-            self._schedule.append(days[done])
+            self._add_schedule_day(days[done])
             done += 1
 
-        self._schedule.append(None)
+        self._add_schedule_day(None)
+
+
+# (-sets_won, -games_won, order of the club), so that ascending order of keys
+# is the ranking, and clubs with equal results keep their initial order.
+_RankingKey = Tuple[int, int, int]
+
+
+class _StandingsTable:
+    """
+    Standings updated match by match.
+
+    Keys of the rows are kept sorted, so neither ranking nor position lookup
+    needs a full sort.
+    """
+
+    _rows: Dict[str, DdStandingsRowStruct]
+    _order: Dict[str, int]
+    _club_ids: List[str]
+    _index: List[_RankingKey]
+
+    def __init__(self, club_ids: Iterable[str]):
+        self._club_ids = list(club_ids)
+        self._order = {cid: pos for pos, cid in enumerate(self._club_ids)}
+        self._rows = {cid: DdStandingsRowStruct(cid) for cid in self._club_ids}
+        self._index = sorted(self._make_key(cid) for cid in self._club_ids)
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+
+        if "_order" not in state:
+            # Tables pickled while ties were broken by club id lost the
+            # order, but their rows are still in the initial order of clubs.
+            self._club_ids = list(self._rows)
+            self._order = {cid: pos for pos, cid in enumerate(self._club_ids)}
+            self._index = sorted(self._make_key(cid) for cid in self._club_ids)
+
+    @property
+    def club_ids(self) -> List[str]:
+        """Clubs in the order that breaks ties."""
+
+        return list(self._club_ids)
+
+    @property
+    def ranking(self) -> List[DdStandingsRowStruct]:
+        return [self._rows[self._club_ids[key[-1]]] for key in self._index]
+
+    def add_result(self, result: DdMatchResult):
+        self._add(result.home_pk, result.home_sets, result.home_games)
+        self._add(result.away_pk, result.away_sets, result.away_games)
+
+    def get_position(self, club_id: str) -> int:
+        return bisect_left(self._index, self._make_key(club_id))
+
+    def _add(self, club_id: str, sets_won: int, games_won: int):
+        if not sets_won and not games_won:
+            return
+
+        del self._index[self.get_position(club_id)]
+
+        row = self._rows[club_id]
+        row.sets_won += sets_won
+        row.games_won += games_won
+
+        insort(self._index, self._make_key(club_id))
+
+    def _make_key(self, club_id: str) -> _RankingKey:
+        row = self._rows[club_id]
+        return -row.sets_won, -row.games_won, self._order[club_id]
 
 
 def _make_basic_schedule(pk_list: List[str]):
@@ -0,0 +1,51 @@
+"""
+Random streams of the simulation.
+
+Created October 18, 2026
+
+@author montreal91
+"""
+import random
+from typing import Optional
+
+import numpy as np
+
+_SPAWN_SEED_BITS = 64
+
+
+class GameRng(random.Random):
+    """
+    Random stream owned by a single game.
+
+    Every random draw of the game comes from its stream, so a game with the
+    same seed and the same commands plays exactly the same seasons. The
+    stream is pickled along with the game.
+
+    Child streams are split off with spawn. A child is seeded with a draw
+    from its parent, so it depends only on the parent state, and it never
+    changes how many numbers the parent gives to anybody else. Days, matches
+    and forecast runs use their own children, which makes them independent
+    of each other and safe to run in parallel.
+    """
+
+    def spawn(self) -> "GameRng":
+        """Splits off an independent child stream."""
+
+        return GameRng(self.getrandbits(_SPAWN_SEED_BITS))
+
+    def spawn_numpy(self) -> np.random.Generator:
+        """Splits off an independent child stream for vectorized code."""
+
+        return np.random.default_rng(self.getrandbits(_SPAWN_SEED_BITS))
+
+
+def ensure_rng(rng: Optional[GameRng]) -> GameRng:
+    """
+    Returns the given stream, or a new one seeded from the random module.
+
+    Lets code that works outside a game stay reproducible with random.seed.
+    """
+
+    if rng is not None:
+        return rng
+    return GameRng(random.getrandbits(_SPAWN_SEED_BITS))
@@ -0,0 +1,194 @@
+"""
+Monte Carlo forecast of the current season.
+
+Created October 18, 2026
+
+@author montreal91
+"""
+import os
+import pickle
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from core.competition import CompetitionType
+from core.game import Game
+
+_CHUNKS_PER_WORKER = 4
+
+
+class ClubForecast(NamedTuple):
+    """Forecast for a single club."""
+
+    club_id: str
+    # Index 0 is the first place of the regular championship
+    position_probabilities: Tuple[float, ...]
+    playoff_probability: float
+    cup_probability: float
+
+
+class SeasonForecast(NamedTuple):
+    """Forecast of the rest of the season for every club."""
+
+    runs: int
+    clubs: Dict[str, ClubForecast]
+
+
+class SeasonOutcome(NamedTuple):
+    """Outcome of a single simulated season."""
+
+    championship_positions: Dict[str, int]
+    playoff_participants: Tuple[str, ...]
+    cup_winner: str
+
+
+class SeasonForecaster:
+    """
+    Simulates the rest of the season many times to get odds for each club.
+
+    Every run works on its own copy of the game made from a single pickled
+    snapshot, and the random stream of the copy is seeded for the run. So
+    results depend only on the game, the number of runs and the seed, and
+    not on the number of worker processes.
+    """
+
+    def __init__(
+            self,
+            runs: int = 1000,
+            seed: int = 0,
+            max_workers: Optional[int] = None,
+    ):
+        self._runs = runs
+        self._seed = seed
+        self._max_workers = max_workers
+
+    def __call__(self, game: Game) -> SeasonForecast:
+        snapshot = pickle.dumps(game, pickle.HIGHEST_PROTOCOL)
+        run_ids = list(range(self._runs))
+
+        if self._max_workers == 1:
+            tallies = [_simulate_runs(snapshot, self._seed, run_ids)]
+        else:
+            tallies = self._simulate_in_pool(snapshot, run_ids)
+
+        tally = _SeasonTally()
+        for partial in tallies:
+            tally.merge(partial)
+
+        return tally.to_forecast(club_ids=list(game.clubs), runs=self._runs)
+
+    def _simulate_in_pool(
+            self,
+            snapshot: bytes,
+            run_ids: List[int],
+    ) -> List["_SeasonTally"]:
+        workers = self._max_workers or os.cpu_count() or 1
+        chunks = _split(run_ids, workers * _CHUNKS_PER_WORKER)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_simulate_runs, snapshot, self._seed, chunk)
+                for chunk in chunks
+            ]
+            return [future.result() for future in futures]
+
+
+def simulate_season(game: Game) -> SeasonOutcome:
+    """
+    Plays the game until the current season is over.
+
+    The game is changed in place, so it should be a copy of the real one.
+    Raises RuntimeError if the game can't play a day.
+    """
+
+    game.detach_manager()
+    season = len(game.history)
+
+    while len(game.history) == season:
+        success, reason = game.update()
+        if not success:
+            raise RuntimeError(reason)
+
+    return make_season_outcome(game.history[season - 1])
+
+
+def make_season_outcome(results: Dict[CompetitionType, Any]) -> SeasonOutcome:
+    """Summarizes results of a finished season from the game history."""
+
+    standings = results[CompetitionType.CHAMPIONSHIP]
+    series = results[CompetitionType.PLAY_OFFS]
+
+    participants = []
+    for row in series:
+        participants.extend(
+            club_id for club_id in row["clubs"] if club_id not in participants
+        )
+
+    final = series[-1]
+    top_score, bottom_score = final["score"]
+    winner = final["clubs"][0] if top_score > bottom_score else final["clubs"][1]
+
+    return SeasonOutcome(
+        championship_positions={
+            row.club_id: pos for pos, row in enumerate(standings)
+        },
+        playoff_participants=tuple(participants),
+        cup_winner=winner,
+    )
+
+
+class _SeasonTally:
+    """Counters of season outcomes, cheap to send between processes."""
+
+    def __init__(self):
+        self.positions: Counter = Counter()
+        self.playoffs: Counter = Counter()
+        self.cups: Counter = Counter()
+
+    def add(self, outcome: SeasonOutcome):
+        self.positions.update(outcome.championship_positions.items())
+        self.playoffs.update(outcome.playoff_participants)
+        self.cups[outcome.cup_winner] += 1
+
+    def merge(self, other: "_SeasonTally"):
+        self.positions.update(other.positions)
+        self.playoffs.update(other.playoffs)
+        self.cups.update(other.cups)
+
+    def to_forecast(self, club_ids: List[str], runs: int) -> SeasonForecast:
+        clubs = {}
+        for club_id in club_ids:
+            clubs[club_id] = ClubForecast(
+                club_id=club_id,
+                position_probabilities=tuple(
+                    self.positions[(club_id, pos)] / runs
+                    for pos in range(len(club_ids))
+                ),
+                playoff_probability=self.playoffs[club_id] / runs,
+                cup_probability=self.cups[club_id] / runs,
+            )
+        return SeasonForecast(runs=runs, clubs=clubs)
+
+
+def _simulate_runs(
+        snapshot: bytes,
+        seed: int,
+        run_ids: Sequence[int],
+) -> _SeasonTally:
+    tally = _SeasonTally()
+    for run_id in run_ids:
+        game = pickle.loads(snapshot)
+        game.rng.seed(f"season-forecast:{seed}:{run_id}")
+        tally.add(simulate_season(game))
+    return tally
+
+
+def _split(items: List[int], chunks: int) -> List[List[int]]:
+    chunks = max(min(chunks, len(items)), 1)
+    return [items[i::chunks] for i in range(chunks)]
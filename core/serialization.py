@@ -10,11 +10,16 @@ Created Jun 27, 2019
 from json import JSONEncoder
 from typing import Any
 from typing import Dict
+from typing import FrozenSet
 from typing import Tuple
 from typing import NamedTuple
 from typing import Optional
 
 
+# All slot names of a class and its bases
+_SLOT_NAMES: Dict[type, FrozenSet[str]] = {}
+
+
 class DdField(NamedTuple):
     """Tuple that binds python object fields with JSON properties."""
 
@@ -22,6 +27,41 @@ class DdField(NamedTuple):
     json_name: str
 
 
+class Slotted:
+    """
+    Base class for compact objects that keep their fields in __slots__.
+
+    Objects pickled before their class got slots store a plain dict as their
+    state, so both kinds of state are restored here. Such a dict may keep
+    attributes the class has no slots for any more, they are dropped.
+    """
+
+    __slots__ = ()
+
+    def __setstate__(self, state):
+        # Slotted objects are pickled as (dict or None, slots dict)
+        if isinstance(state, tuple):
+            instance_dict, slots = state
+            state = {**(instance_dict or {}), **(slots or {})}
+
+        known_names = _get_slot_names(type(self))
+        for name, value in state.items():
+            if name in known_names:
+                setattr(self, name, value)
+
+
+def _get_slot_names(cls: type) -> FrozenSet[str]:
+    names = _SLOT_NAMES.get(cls)
+    if names is None:
+        names = frozenset(
+            name
+            for klass in cls.__mro__
+            for name in klass.__dict__.get("__slots__", ())
+        )
+        _SLOT_NAMES[cls] = names
+    return names
+
+
 class Jsonable:
     """
     Base class for all JSON serializable and deserializable objects.
@@ -30,18 +70,20 @@ class Jsonable:
     "default" constructor for correct serialization and deserialization.
     """
 
+    __slots__ = ()
+
     _FIELD_MAP: Tuple[DdField, ...]
 
     def __from_json__(self, data: Dict[str, Any]):
         """Restores object from raw JSON data."""
         for field in self._FIELD_MAP:
-            self.__dict__[field.py_name] = data[field.json_name]
+            setattr(self, field.py_name, data[field.json_name])
 
     def __to_json__(self) -> Dict[str, Any]:
         """Converts object into an easily json-serializable dict."""
         data = {self.__class__.__name__: True}
         for field in self._FIELD_MAP:
-            data[field.json_name] = self.__dict__[field.py_name]
+            data[field.json_name] = getattr(self, field.py_name)
         return data
 
 
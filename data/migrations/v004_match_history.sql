@@ -0,0 +1,45 @@
+--
+-- Created October 18, 2026
+--
+-- @author montreal91
+--
+
+CREATE TABLE IF NOT EXISTS match_result (
+    match_result_id INTEGER PRIMARY KEY,
+    game_id TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    competition TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    home_club_id TEXT NOT NULL,
+    away_club_id TEXT NOT NULL,
+    home_player_id TEXT NOT NULL,
+    away_player_id TEXT NOT NULL,
+    home_sets INTEGER NOT NULL,
+    away_sets INTEGER NOT NULL,
+    home_games INTEGER NOT NULL,
+    away_games INTEGER NOT NULL,
+    UNIQUE (game_id, season, competition, day, home_club_id),
+    FOREIGN KEY (game_id) REFERENCES game(game_id)
+);
+
+CREATE TABLE IF NOT EXISTS match_set (
+    match_result_id INTEGER NOT NULL,
+    set_number INTEGER NOT NULL,
+    home_games INTEGER NOT NULL,
+    away_games INTEGER NOT NULL,
+    set_status INTEGER NOT NULL,
+    PRIMARY KEY (match_result_id, set_number),
+    FOREIGN KEY (match_result_id) REFERENCES match_result(match_result_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_match_result_home_club_id
+    ON match_result(game_id, home_club_id);
+
+CREATE INDEX IF NOT EXISTS idx_match_result_away_club_id
+    ON match_result(game_id, away_club_id);
+
+CREATE INDEX IF NOT EXISTS idx_match_result_home_player_id
+    ON match_result(game_id, home_player_id);
+
+CREATE INDEX IF NOT EXISTS idx_match_result_away_player_id
+    ON match_result(game_id, away_player_id);
@@ -0,0 +1,18 @@
+--
+-- Created October 18, 2026
+--
+-- @author montreal91
+--
+
+-- Sequence number of the last journal entry included in the game snapshot
+ALTER TABLE game ADD COLUMN journal_seq INTEGER NOT NULL DEFAULT 0;
+
+CREATE TABLE IF NOT EXISTS game_journal (
+    game_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    command_type TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    PRIMARY KEY (game_id, seq),
+    FOREIGN KEY (game_id) REFERENCES game(game_id) ON DELETE CASCADE
+);
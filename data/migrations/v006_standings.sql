@@ -0,0 +1,98 @@
+--
+-- Created October 18, 2026
+--
+-- @author montreal91
+--
+
+-- Standings of every competition, updated along with the match results
+CREATE TABLE IF NOT EXISTS standings (
+    game_id TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    competition TEXT NOT NULL,
+    club_id TEXT NOT NULL,
+    matches_played INTEGER NOT NULL DEFAULT 0,
+    sets_won INTEGER NOT NULL DEFAULT 0,
+    games_won INTEGER NOT NULL DEFAULT 0,
+    -- Position of the club in the competition before the first match,
+    -- clubs with equal results keep this order in the ranking
+    club_order INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (game_id, season, competition, club_id),
+    FOREIGN KEY (game_id) REFERENCES game(game_id)
+);
+
+-- Rows of a competition in the order of the ranking, so it needs no sorting
+CREATE INDEX IF NOT EXISTS idx_standings_ranking
+    ON standings(game_id, season, competition, sets_won DESC, games_won DESC, club_order);
+
+-- Every club takes part in the championship, even on days it has no match.
+-- Saved games don't know the order of their championships, so clubs are
+-- ordered as they were created, like in the first season of a new game.
+INSERT OR IGNORE INTO standings (
+    game_id,
+    season,
+    competition,
+    club_id,
+    club_order
+)
+SELECT
+    seasons.game_id,
+    seasons.season,
+    seasons.competition,
+    clubs.club_id,
+    clubs.club_order
+FROM (
+    SELECT DISTINCT game_id, season, competition
+    FROM match_result
+    WHERE competition = 'championship'
+) AS seasons
+JOIN (
+    SELECT
+        game_id,
+        club_id,
+        ROW_NUMBER() OVER (PARTITION BY game_id ORDER BY rowid) - 1 AS club_order
+    FROM club
+) AS clubs ON clubs.game_id = seasons.game_id;
+
+INSERT INTO standings (
+    game_id,
+    season,
+    competition,
+    club_id,
+    matches_played,
+    sets_won,
+    games_won
+)
+SELECT
+    game_id,
+    season,
+    competition,
+    club_id,
+    COUNT(*),
+    SUM(sets_won),
+    SUM(games_won)
+FROM (
+    SELECT
+        game_id,
+        season,
+        competition,
+        home_club_id AS club_id,
+        home_sets AS sets_won,
+        home_games AS games_won
+    FROM match_result
+    UNION ALL
+    SELECT
+        game_id,
+        season,
+        competition,
+        away_club_id,
+        away_sets,
+        away_games
+    FROM match_result
+)
+-- Upsert needs a WHERE clause in the SELECT to be parsed
+WHERE true
+GROUP BY game_id, season, competition, club_id
+ON CONFLICT (game_id, season, competition, club_id) DO UPDATE SET
+    matches_played = excluded.matches_played,
+    sets_won = excluded.sets_won,
+    games_won = excluded.games_won;
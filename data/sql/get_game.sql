@@ -4,7 +4,7 @@
 -- @author montreal91
 --
 
-SELECT game_id, object
+SELECT game_id, object, journal_seq
 FROM game
 where game_id = :id
 ;
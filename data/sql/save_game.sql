@@ -3,9 +3,10 @@
 --
 -- @author montreal91
 --
-INSERT INTO game (game_id, object, created_ts, updated_ts)
-VALUES (:id, :blob, :created_ts, :updated_ts)
+INSERT INTO game (game_id, object, created_ts, updated_ts, journal_seq)
+VALUES (:id, :blob, :created_ts, :updated_ts, :journal_seq)
 ON CONFLICT(game_id) DO UPDATE SET
     object = excluded.object,
-    updated_ts  = excluded.updated_ts
+    updated_ts  = excluded.updated_ts,
+    journal_seq = excluded.journal_seq
 ;
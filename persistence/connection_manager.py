@@ -0,0 +1,114 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List
+from typing import Optional
+
+_MEMORY = ":memory:"
+
+
+class ConnectionManager:
+    """
+    Hands out SQLite connections to a single database.
+
+    There is one writer connection shared by all repositories, and every
+    thread that reads gets its own reader connection. The database works in
+    WAL mode, so readers see the last committed state and never wait for
+    the writer, even while a long simulation is being saved.
+
+    An in-memory database can't be shared between connections, so there
+    the writer serves reads as well.
+    """
+
+    def __init__(
+            self,
+            db_path: str,
+            cache_size_kib: int = 16 * 1024,
+            mmap_size: int = 64 * 2 ** 20,
+            cached_statements: int = 256,
+            busy_timeout: float = 5.0,
+    ):
+        self._db_path = str(db_path)
+        self._cache_size_kib = cache_size_kib
+        self._mmap_size = mmap_size
+        self._cached_statements = cached_statements
+        self._busy_timeout = busy_timeout
+
+        if self._db_path != _MEMORY:
+            Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+        # Writes from other threads must hold this lock
+        self.writer_lock = threading.RLock()
+        self._writer = self._connect()
+        if self._db_path != _MEMORY:
+            self._writer.execute("PRAGMA journal_mode = WAL;")
+
+    @property
+    def writer(self) -> sqlite3.Connection:
+        return self._writer
+
+    @property
+    def readers(self) -> "ThreadReaders":
+        """Connection-like object that reads on the reader of the caller."""
+
+        return ThreadReaders(self)
+
+    def reader(self) -> sqlite3.Connection:
+        """Reader connection of the calling thread."""
+
+        if self._db_path == _MEMORY:
+            return self._writer
+
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            conn.execute("PRAGMA query_only = ON;")
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    def close(self):
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers = []
+        self._local = threading.local()
+        self._writer.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._db_path,
+            timeout=self._busy_timeout,
+            cached_statements=self._cached_statements,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON;")
+        conn.execute("PRAGMA synchronous = NORMAL;")
+        conn.execute(f"PRAGMA cache_size = {-self._cache_size_kib};")
+        conn.execute(f"PRAGMA mmap_size = {self._mmap_size};")
+        return conn
+
+
+class ThreadReaders:
+    """
+    Runs every statement on the reader connection of the calling thread.
+
+    Can be given to a repository that only reads, instead of a connection.
+    """
+
+    def __init__(self, manager: ConnectionManager):
+        self._manager = manager
+
+    def execute(self, sql: str, parameters=()):
+        return self._manager.reader().execute(sql, parameters)
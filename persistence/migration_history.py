@@ -74,9 +74,13 @@ def init_db(db_path):
 
     conn = sqlite3.connect(db_path)
     try:
-        conn.execute("PRAGMA foreign_keys = ON;")
-        conn.executescript(read_sql_file("data/migrations/_schema_history.sql"))
-        apply_migrations(load_migrations("data/migrations/index.toml"), conn)
-        conn.commit()
+        migrate(conn)
     finally:
         conn.close()
+
+
+def migrate(conn):
+    conn.execute("PRAGMA foreign_keys = ON;")
+    conn.executescript(read_sql_file("data/migrations/_schema_history.sql"))
+    apply_migrations(load_migrations("data/migrations/index.toml"), conn)
+    conn.commit()
@@ -0,0 +1,49 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+from contextlib import contextmanager
+from typing import Callable
+from typing import Dict
+from typing import List
+
+# Callbacks to call if the current transaction of a connection is rolled back
+_rollback_callbacks: Dict[int, List[Callable[[], None]]] = {}
+
+
+@contextmanager
+def transaction(conn):
+    """
+    Commits everything done inside on success and rolls it back on error.
+
+    If the connection is already in a transaction, joins it, so the outer
+    transaction decides when to commit.
+    """
+
+    if conn.in_transaction:
+        yield
+        return
+
+    conn.execute("BEGIN")
+    try:
+        yield
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        for callback in _rollback_callbacks.pop(id(conn), []):
+            callback()
+        raise
+    finally:
+        _rollback_callbacks.pop(id(conn), None)
+
+
+def on_rollback(conn, callback: Callable[[], None]):
+    """
+    Calls the callback if the current transaction is rolled back.
+
+    Lets objects that cache what is written to the database forget
+    the writes that never happened. Should be called inside transaction().
+    """
+
+    _rollback_callbacks.setdefault(id(conn), []).append(callback)
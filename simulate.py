@@ -0,0 +1,133 @@
+"""
+Headless simulation of the game.
+
+Plays a new game without any GUI and reports how fast it goes. Meant for
+long automated runs and for comparison of engine speed.
+
+Usage examples:
+    python simulate.py --config long --seasons 10 --seed 1
+    python simulate.py --games 100 --workers 8 --seed 1
+
+Created October 18, 2026
+
+@author montreal91
+"""
+import argparse
+import json
+import time
+
+from configuration.game_params import LONG_GAME_CONFIG
+from configuration.game_params import SHORT_GAME_CONFIG
+from simulation.headless import SimulationConfig
+from simulation.headless import format_report
+from simulation.headless import run_simulation
+from simulation.pool import run_games
+
+_CONFIGS = {
+    "short": SHORT_GAME_CONFIG,
+    "long": LONG_GAME_CONFIG,
+}
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "--config",
+        default="short",
+        help="'short', 'long' or a path to an ini file (default: short)",
+    )
+    parser.add_argument("--seasons", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--db",
+        default=":memory:",
+        help="SQLite database to save the game to (default: in memory)",
+    )
+    parser.add_argument(
+        "--persist-every",
+        type=int,
+        default=1,
+        help="save the game every N days, 0 to never save (default: 1)",
+    )
+    parser.add_argument(
+        "--games",
+        type=int,
+        default=1,
+        help="number of independent games to simulate (default: 1)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="worker processes for many games (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="print the report as JSON",
+    )
+    return parser.parse_args()
+
+
+def _make_config(args, game_number=0):
+    seed = args.seed
+    if seed is not None:
+        seed += game_number
+
+    return SimulationConfig(
+        config_path=_CONFIGS.get(args.config, args.config),
+        seasons=args.seasons,
+        seed=seed,
+        db_path=args.db,
+        persist_every=args.persist_every,
+        game_id=f"headless-{game_number}",
+    )
+
+
+def _run_one(args):
+    report = run_simulation(_make_config(args))
+
+    if args.json:
+        print(json.dumps(report.json, indent=2))
+    else:
+        print(format_report(report))
+
+
+def _run_many(args):
+    if args.db != ":memory:":
+        raise SystemExit("Many games can't share one database file.")
+
+    configs = [_make_config(args, i) for i in range(args.games)]
+
+    start = time.perf_counter()
+    summaries = run_games(configs, max_workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    days = sum(summary.report.days for summary in summaries)
+    matches = sum(summary.report.matches for summary in summaries)
+    res = {
+        "games": len(summaries),
+        "elapsed": elapsed,
+        "games_per_second": len(summaries) / elapsed,
+        "days_per_second": days / elapsed,
+        "matches_per_second": matches / elapsed,
+    }
+
+    if args.json:
+        res["games_reports"] = [summary.report.json for summary in summaries]
+        print(json.dumps(res, indent=2))
+        return
+
+    print(f"Games:       {res['games']}")
+    print(f"Elapsed:     {elapsed:.3f} s")
+    print(f"Games/sec:   {res['games_per_second']:.2f}")
+    print(f"Days/sec:    {res['days_per_second']:.1f}")
+    print(f"Matches/sec: {res['matches_per_second']:.1f}")
+
+
+if __name__ == '__main__':
+    arguments = _parse_args()
+    if arguments.games > 1:
+        _run_many(arguments)
+    else:
+        _run_one(arguments)
@@ -0,0 +1,202 @@
+"""
+Simulation of the game without GUI.
+
+Created October 18, 2026
+
+@author montreal91
+"""
+import sys
+import time
+from typing import Dict
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+from configuration.game_params import SHORT_GAME_CONFIG
+from configuration.game_params import load_game_params
+from core.game import Game
+from core.phase_timer import Phase
+from core.phase_timer import PhaseTimer
+from core.ports.inbound.commands.create_new_game import CreateNewGameCommand
+from core.ports.inbound.commands.create_new_game import CreateNewGameCommandHandler
+from core.ports.outbound.game_repository import GameRepository
+from core.ports.outbound.match_history_repository import MatchHistoryRepository
+from core.ports.outbound.temporal_club_provider import TemporalClubProvider
+from persistence.connection_manager import ConnectionManager
+from persistence.migration_history import migrate
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class SimulationConfig(NamedTuple):
+    config_path: str = SHORT_GAME_CONFIG
+    seasons: int = 1
+    seed: Optional[int] = None
+    db_path: str = ":memory:"
+    # Game is saved every N days, zero turns persistence off
+    persist_every: int = 1
+    game_id: str = "headless"
+
+
+class SimulationReport(NamedTuple):
+    seasons: int
+    days: int
+    matches: int
+    elapsed: float
+    phase_times: Dict[Phase, float]
+    # In bytes, None if the platform can't tell
+    peak_rss: Optional[int]
+
+    @property
+    def days_per_second(self) -> float:
+        return self.days / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def matches_per_second(self) -> float:
+        return self.matches / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def json(self):
+        return {
+            "seasons": self.seasons,
+            "days": self.days,
+            "matches": self.matches,
+            "elapsed": self.elapsed,
+            "days_per_second": self.days_per_second,
+            "matches_per_second": self.matches_per_second,
+            "phase_times": {
+                phase.value: seconds
+                for phase, seconds in self.phase_times.items()
+            },
+            "peak_rss": self.peak_rss,
+        }
+
+
+def run_simulation(config: SimulationConfig) -> SimulationReport:
+    """
+    Creates a new game and plays the given number of seasons.
+
+    Nobody manages any club, so the game never waits for user decisions.
+    Saving goes through the same repositories as in the real game.
+    """
+
+    _, report = simulate_game(config)
+    return report
+
+
+def simulate_game(config: SimulationConfig) -> Tuple[Game, SimulationReport]:
+    """Same as run_simulation, but returns the simulated game as well."""
+
+    connection_manager = ConnectionManager(config.db_path)
+    conn = connection_manager.writer
+    migrate(conn)
+    try:
+        TemporalClubProvider.initialize(conn)
+        club_provider = TemporalClubProvider.get_instance()
+        game_repository = GameRepository(conn)
+        match_history_repository = MatchHistoryRepository(conn)
+
+        create_game = CreateNewGameCommandHandler(
+            game_repository,
+            load_game_params(config.config_path),
+            club_provider,
+        )
+        create_game(CreateNewGameCommand(
+            game_id=config.game_id,
+            seed=config.seed,
+        ))
+        game = game_repository.get_game(config.game_id)
+
+        timer = PhaseTimer()
+        days = 0
+        matches = 0
+        # Results of the days which are not saved yet
+        unsaved_results = []
+        start = time.perf_counter()
+
+        while len(game.history) <= config.seasons:
+            matches += _count_matches(game)
+            success, reason = game.update(phase_timer=timer)
+            if not success:
+                raise RuntimeError(f"Simulation stopped: {reason}")
+            days += 1
+
+            if not config.persist_every:
+                continue
+
+            unsaved_results.append((game.last_match_day, game.last_results))
+            if days % config.persist_every != 0:
+                continue
+
+            with timer.phase(Phase.PERSISTENCE):
+                with game_repository.transaction():
+                    game_repository.save_game(game)
+                    club_provider.save_clubs(game.clubs.values())
+                    for match_day, results in unsaved_results:
+                        match_history_repository.save_results(
+                            game.game_id,
+                            match_day,
+                            results,
+                        )
+            unsaved_results = []
+
+        elapsed = time.perf_counter() - start
+    finally:
+        connection_manager.close()
+
+    return game, SimulationReport(
+        seasons=config.seasons,
+        days=days,
+        matches=matches,
+        elapsed=elapsed,
+        phase_times=timer.totals,
+        peak_rss=get_peak_rss(),
+    )
+
+
+def format_report(report: SimulationReport) -> str:
+    lines = [
+        f"Seasons:     {report.seasons}",
+        f"Days:        {report.days}",
+        f"Matches:     {report.matches}",
+        f"Elapsed:     {report.elapsed:.3f} s",
+        f"Days/sec:    {report.days_per_second:.1f}",
+        f"Matches/sec: {report.matches_per_second:.1f}",
+        "Phases:",
+    ]
+
+    for phase, seconds in report.phase_times.items():
+        share = seconds / report.elapsed * 100 if report.elapsed else 0.0
+        lines.append(f"  {phase.value:<15}{seconds:9.3f} s {share:5.1f}%")
+
+    other = report.elapsed - sum(report.phase_times.values())
+    lines.append(f"  {'other':<15}{other:9.3f} s")
+
+    if report.peak_rss is None:
+        lines.append("Peak RSS:    n/a")
+    else:
+        lines.append(f"Peak RSS:    {report.peak_rss / 2 ** 20:.1f} MiB")
+
+    return "\n".join(lines)
+
+
+def get_peak_rss() -> Optional[int]:
+    """Peak resident set size of the current process in bytes."""
+
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports kilobytes, macOS reports bytes
+    if sys.platform == "darwin":
+        return peak
+    return peak * 1024
+
+
+def _count_matches(game: Game) -> int:
+    matches = game.competition.current_matches
+    return 0 if matches is None else len(matches)
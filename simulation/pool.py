@@ -0,0 +1,67 @@
+"""
+Simulation of many independent games in parallel.
+
+Created October 18, 2026
+
+@author montreal91
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+from core.season_forecast import SeasonOutcome
+from core.season_forecast import make_season_outcome
+from simulation.headless import SimulationConfig
+from simulation.headless import SimulationReport
+from simulation.headless import simulate_game
+
+
+class GameSummary(NamedTuple):
+    """What is left of a simulated game when it's sent back to the parent."""
+
+    game_id: str
+    seed: Optional[int]
+    report: SimulationReport
+    seasons: List[SeasonOutcome]
+
+
+def run_games(
+        configs: Iterable[SimulationConfig],
+        max_workers: Optional[int] = None,
+) -> List[GameSummary]:
+    """
+    Simulates every game in its own job and returns summaries in order.
+
+    TemporalClubProvider is a per-process singleton, and every job sets it
+    up with a connection of its own, so jobs share nothing but the code.
+    Games themselves never leave the worker, only small summaries do.
+
+    Jobs with the same db_path would fight for the SQLite lock, so every
+    game should have its own database or keep the default in-memory one.
+    """
+
+    configs = list(configs)
+    workers = min(max_workers or os.cpu_count() or 1, max(len(configs), 1))
+
+    if workers == 1:
+        return [run_game(config) for config in configs]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_game, configs))
+
+
+def run_game(config: SimulationConfig) -> GameSummary:
+    game, report = simulate_game(config)
+
+    # The last entry of the history is the season that is not over yet
+    seasons = [make_season_outcome(results) for results in game.history[:-1]]
+
+    return GameSummary(
+        game_id=config.game_id,
+        seed=config.seed,
+        report=report,
+        seasons=seasons,
+    )
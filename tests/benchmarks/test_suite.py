@@ -0,0 +1,92 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+from benchmarks.suite import BENCHMARKS
+from benchmarks.suite import BenchmarkResult
+from benchmarks.suite import compare
+from benchmarks.suite import load_baseline
+from benchmarks.suite import run_benchmarks
+from benchmarks.suite import save_baseline
+
+
+def test_only_slowdowns_past_threshold_are_regressions():
+    baseline = {
+        "fast": _make_result("fast", 1.0),
+        "slow": _make_result("slow", 1.0),
+    }
+    results = [
+        _make_result("fast", 1.1),
+        _make_result("slow", 1.3),
+        _make_result("new", 5.0),
+    ]
+
+    comparisons = compare(results, baseline, threshold=0.2)
+
+    assert [c.name for c in comparisons] == ["fast", "slow"]
+    assert [c.is_regression for c in comparisons] == [False, True]
+
+
+def test_times_are_compared_in_calibration_units():
+    baseline = {
+        "same": _make_result("same", 1.0),
+        "slower": _make_result("slower", 1.0),
+    }
+    # Everything is twice as slow on this machine
+    results = [
+        _make_result("same", 2.1, unit=2.0),
+        _make_result("slower", 3.0, unit=2.0),
+    ]
+
+    comparisons = compare(results, baseline, threshold=0.2)
+
+    assert [c.is_regression for c in comparisons] == [False, True]
+    assert comparisons[1].change == 0.5
+
+
+def test_noisy_benchmarks_need_bigger_slowdown():
+    baseline = {
+        "steady": _make_result("steady", 1.0),
+        "noisy": _make_result("noisy", 1.0, median=1.3),
+    }
+    results = [
+        _make_result("steady", 1.4),
+        _make_result("noisy", 1.4, median=1.6),
+    ]
+
+    comparisons = compare(results, baseline, threshold=0.2)
+
+    assert [c.is_regression for c in comparisons] == [True, False]
+
+
+def test_baseline_is_loaded_as_saved(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    results = [_make_result("a", 0.5), _make_result("b", 0.25)]
+
+    save_baseline(results, path)
+
+    assert load_baseline(path) == {result.name: result for result in results}
+
+
+def test_every_benchmark_in_baseline_exists():
+    assert set(load_baseline()) == set(BENCHMARKS)
+
+
+def test_benchmark_reports_time_per_call():
+    result, = run_benchmarks(names=["engine.process_match"], repeats=1)
+
+    assert result.name == "engine.process_match"
+    assert result.number > 0
+    assert result.unit > 0
+    assert 0 < result.best <= result.median
+
+
+def _make_result(name, seconds, median=None, unit=1.0):
+    return BenchmarkResult(
+        name=name,
+        number=1,
+        best=seconds,
+        median=seconds if median is None else median,
+        unit=unit,
+    )
@@ -0,0 +1,97 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import queue
+import threading
+
+from client.executor import ClientExecutor
+
+
+class _MainThread:
+    """Collects dispatched callbacks and runs them when asked."""
+
+    def __init__(self):
+        self._callbacks = queue.SimpleQueue()
+
+    def dispatch(self, callback):
+        self._callbacks.put(callback)
+
+    def run_next(self):
+        self._callbacks.get(timeout=5)()
+
+
+def test_tasks_of_game_run_in_submission_order():
+    main_thread = _MainThread()
+    executor = ClientExecutor(main_thread.dispatch)
+    started = threading.Event()
+    release = threading.Event()
+    applied = []
+
+    def slow_command():
+        started.set()
+        release.wait(timeout=5)
+        applied.append("command")
+
+    executor.submit("game", slow_command)
+    executor.submit("game", lambda: applied.append("query") or list(applied))
+    started.wait(timeout=5)
+    assert executor.is_busy("game")
+    assert not executor.is_busy("other game")
+
+    release.set()
+    results = []
+    executor.submit("game", lambda: None, on_done=results.append)
+    for _ in range(3):
+        main_thread.run_next()
+
+    assert applied == ["command", "query"]
+    assert results == [None]
+    assert not executor.is_busy("game")
+    executor.shutdown()
+
+
+def test_results_and_errors_are_delivered_by_dispatcher():
+    main_thread = _MainThread()
+    executor = ClientExecutor(main_thread.dispatch)
+    delivered = []
+
+    executor.submit(
+        "game",
+        lambda: threading.get_ident(),
+        on_done=lambda result: delivered.append(
+            ("done", result != threading.get_ident()),
+        ),
+    )
+    executor.submit(
+        "game",
+        lambda: 1 / 0,
+        on_done=delivered.append,
+        on_error=lambda error: delivered.append(("error", type(error))),
+    )
+    main_thread.run_next()
+    main_thread.run_next()
+
+    assert delivered == [("done", True), ("error", ZeroDivisionError)]
+    executor.shutdown()
+
+
+def test_only_commands_hold_lock():
+    main_thread = _MainThread()
+    lock = threading.Lock()
+    executor = ClientExecutor(main_thread.dispatch, lock=lock)
+    results = []
+
+    # A query doesn't wait while another thread writes
+    with lock:
+        executor.submit("game", lambda: "query", on_done=results.append)
+        main_thread.run_next()
+
+    executor.submit("game", lock.locked, on_done=results.append, writes=True)
+    executor.submit("game", lock.locked, on_done=results.append)
+    main_thread.run_next()
+    main_thread.run_next()
+
+    assert results == ["query", True, False]
+    executor.shutdown()
@@ -0,0 +1,46 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import sqlite3
+
+import pytest
+
+from configuration.game_params import load_game_params
+from core.ports.inbound.commands.create_new_game import CreateNewGameCommand
+from core.ports.inbound.commands.create_new_game import CreateNewGameCommandHandler
+from core.ports.outbound.temporal_club_provider import TemporalClubProvider
+from persistence.migration_history import migrate
+
+
+@pytest.fixture
+def identity_map():
+    # Tests of the identity map override it with a real one
+    return None
+
+
+@pytest.fixture
+def conn(identity_map):
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    migrate(conn)
+    TemporalClubProvider.initialize(conn, identity_map)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def create_game():
+    """Creates the game with default parameters in the given repository."""
+
+    def create(game_repository):
+        create_new_game = CreateNewGameCommandHandler(
+            game_repository,
+            load_game_params(),
+            TemporalClubProvider.get_instance(),
+        )
+        create_new_game(CreateNewGameCommand(game_id="game"))
+        return game_repository.get_game("game")
+
+    return create
@@ -0,0 +1,143 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from core.batch_match import BatchMatchEngine
+from core.match import DdLinearProbabilityCalculator
+from core.match import DdMatchParams
+from core.match import DdSetStatuses
+from core.match import ExhaustionCalculator
+from core.match import MatchEngine
+from core.player import Player
+from core.player import PlayerReputationCalculator
+
+_MATCHES = 3000
+
+
+def test_batch_engine_is_statistically_equivalent_to_match_engine():
+    params = _make_params()
+
+    random.seed(18)
+    reference = [
+        MatchEngine(params).process_match(*_make_pair())
+        for _ in range(_MATCHES)
+    ]
+
+    engine = BatchMatchEngine(params, rng=np.random.default_rng(18))
+    batch = engine.process_matches([_make_pair() for _ in range(_MATCHES)])
+
+    assert _home_win_rate(batch) == pytest.approx(
+        _home_win_rate(reference), abs=0.04
+    )
+    assert _mean_games(batch) == pytest.approx(
+        _mean_games(reference), abs=0.5
+    )
+
+    reference_scores = _score_frequencies(reference)
+    batch_scores = _score_frequencies(batch)
+    for score in set(reference_scores) | set(batch_scores):
+        assert batch_scores[score] == pytest.approx(
+            reference_scores[score], abs=0.04
+        )
+
+
+def test_batch_engine_applies_player_side_effects():
+    params = _make_params()
+    home_player, away_player = _make_pair()
+    home_stamina = home_player.current_stamina
+    away_stamina = away_player.current_stamina
+
+    engine = BatchMatchEngine(params, rng=np.random.default_rng(1))
+    result = engine.process_matches([(home_player, away_player)])[0]
+
+    games = result.home_games + result.away_games
+    sets_played = len(result)
+
+    assert result.home_player_snapshot["current_stamina"] == home_stamina
+    assert home_player.current_stamina == max(home_stamina - 2 * games, 0)
+    assert away_player.current_stamina == max(away_stamina - 2 * games, 0)
+    assert home_player.exhaustion == sets_played
+    assert away_player.exhaustion == sets_played
+    assert home_player.experience == result.home_exp
+    assert away_player.experience == result.away_exp
+    assert home_player.stats.matches_played == 1
+    assert home_player.stats.sets_won == result.home_sets
+    assert away_player.stats.sets_won == result.away_sets
+    assert (
+        home_player.stats.matches_won + away_player.stats.matches_won == 1
+    )
+
+
+def test_batch_engine_retires_player_without_technique():
+    params = _make_params()
+    home_player = Player(technique=0, endurance=50)
+    away_player = Player(technique=50, endurance=50)
+
+    engine = BatchMatchEngine(params, rng=np.random.default_rng(1))
+    result = engine.process_matches([(home_player, away_player)])[0]
+
+    assert len(result) == 1
+    assert result.home_sets == 0
+    assert result.away_sets == params.sets_to_win
+    assert not result.home_games and not result.away_games
+    assert str(result.full_score) == "Ret:0"
+    assert home_player.stats.matches_played == 1
+
+
+def test_batch_engine_keeps_order_of_pairs():
+    params = _make_params()
+    strong = [Player(technique=200, endurance=200) for _ in range(5)]
+    weak = [Player(technique=1, endurance=50) for _ in range(5)]
+    pairs = list(zip(strong, weak)) + list(zip(weak, strong))
+
+    engine = BatchMatchEngine(params, rng=np.random.default_rng(1))
+    results = engine.process_matches(pairs)
+
+    assert [res.home_sets > res.away_sets for res in results] == (
+        [True] * 5 + [False] * 5
+    )
+    assert all(
+        s.set_status == DdSetStatuses.REGULAR
+        for res in results
+        for s in res._sets
+    )
+
+
+def _home_win_rate(results):
+    return sum(res.home_sets > res.away_sets for res in results) / len(results)
+
+
+def _make_pair():
+    return (
+        Player(technique=60, endurance=50),
+        Player(technique=50, endurance=70),
+    )
+
+
+def _make_params():
+    return DdMatchParams(
+        exhaustion_function=ExhaustionCalculator(1),
+        probability_function=DdLinearProbabilityCalculator(0.004),
+        reputation_function=PlayerReputationCalculator(6, 5),
+        games_to_win=6,
+        sets_to_win=2,
+    )
+
+
+def _mean_games(results):
+    return sum(res.home_games + res.away_games for res in results) / len(results)
+
+
+def _score_frequencies(results):
+    counter = Counter((res.home_sets, res.away_sets) for res in results)
+    return Counter({
+        score: count / len(results)
+        for score, count in counter.items()
+    })
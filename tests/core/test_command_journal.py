@@ -0,0 +1,242 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import pytest
+
+from configuration.game_params import load_game_params
+from core.ports.inbound.commands.create_new_game import CreateNewGameCommand
+from core.ports.inbound.commands.create_new_game import CreateNewGameCommandHandler
+from core.ports.inbound.commands.hire_new_player import HireNewPlayerCommand
+from core.ports.inbound.commands.hire_new_player import HireNewPlayerCommandHandler
+from core.ports.inbound.commands.journal import CommandReplayer
+from core.ports.inbound.commands.journal import JournaledCommandHandler
+from core.ports.inbound.commands.next_day import NextDayCommand
+from core.ports.inbound.commands.next_day import NextDayCommandHandler
+from core.ports.outbound.command_journal import CommandJournal
+from core.ports.outbound.game_repository import GameRepository
+from core.ports.outbound.match_history_repository import MatchHistoryRepository
+from core.ports.outbound.temporal_club_provider import TemporalClubProvider
+from persistence.connection_manager import ConnectionManager
+from persistence.migration_history import migrate
+
+_SNAPSHOT_EVERY = 5
+
+
+def test_loaded_game_equals_played_game(conn, create_game):
+    game_repository = _make_repository(conn)
+    create_game(game_repository)
+    next_day, hire_new_player = _make_handlers(game_repository)
+
+    club_id = next(iter(game_repository.get_game("game").clubs))
+    for day in range(_SNAPSHOT_EVERY * 2 + 2):
+        if day % 3 == 0:
+            hire_new_player(HireNewPlayerCommand(club_id=club_id, game_id="game"))
+        assert next_day(NextDayCommand(game_id="game")).success
+
+    played = game_repository.get_game("game")
+    loaded = _make_repository(conn).get_game("game")
+
+    assert loaded is not played
+    assert loaded.days_played == played.days_played
+    assert _describe(loaded) == _describe(played)
+
+
+def test_games_with_same_seed_stay_the_same(conn):
+    games = []
+    for game_id in ("first", "second"):
+        game_repository = _make_repository(conn)
+        CreateNewGameCommandHandler(
+            game_repository,
+            load_game_params(),
+            TemporalClubProvider.get_instance(),
+        )(CreateNewGameCommand(game_id=game_id, seed=42))
+        next_day, _ = _make_handlers(game_repository)
+        for _ in range(_SNAPSHOT_EVERY + 2):
+            assert next_day(NextDayCommand(game_id=game_id)).success
+        games.append(game_repository.get_game(game_id))
+
+    first, second = games
+    assert _get_seeds(conn, "first") == _get_seeds(conn, "second")
+    assert _describe_players(first) == _describe_players(second)
+
+
+def test_snapshot_is_saved_once_in_several_days(conn, create_game):
+    game_repository = _make_repository(conn)
+    create_game(game_repository)
+    next_day, _ = _make_handlers(game_repository)
+
+    snapshots = []
+    for _ in range(_SNAPSHOT_EVERY * 2):
+        snapshots.append(_get_game_blob(conn))
+        next_day(NextDayCommand(game_id="game"))
+
+    assert len(set(snapshots)) == 2
+    assert _count(conn, "game_journal") < _SNAPSHOT_EVERY
+
+
+def test_game_is_reloaded_when_command_fails(conn, create_game):
+    game_repository = _make_repository(conn)
+    create_game(game_repository)
+    next_day, _ = _make_handlers(game_repository)
+    for _ in range(_SNAPSHOT_EVERY + 1):
+        assert next_day(NextDayCommand(game_id="game")).success
+    saved = _describe(_make_repository(conn).get_game("game"))
+    failed_game = game_repository.get_game("game")
+    version = game_repository.get_version("game")
+
+    broken_next_day = JournaledCommandHandler(
+        _BrokenHandler(NextDayCommandHandler(
+            game_repository,
+            TemporalClubProvider.get_instance(),
+            MatchHistoryRepository(conn),
+        )),
+        game_repository,
+    )
+    with pytest.raises(RuntimeError):
+        broken_next_day(NextDayCommand(game_id="game"))
+
+    game = game_repository.get_game("game")
+    assert game is not failed_game
+    assert _describe(game) == saved
+    assert game_repository.get_version("game") > version
+
+    # The seq of the failed command is free again
+    assert next_day(NextDayCommand(game_id="game")).success
+    seqs = [row[0] for row in conn.execute("SELECT seq FROM game_journal ORDER BY seq")]
+    assert seqs == list(range(seqs[0], seqs[0] + len(seqs)))
+
+
+def test_snapshot_rolled_back_by_outer_transaction_is_saved_again(conn, create_game):
+    game_repository = _make_repository(conn)
+    game = create_game(game_repository)
+    next_day, _ = _make_handlers(game_repository)
+    for _ in range(_SNAPSHOT_EVERY - 1):
+        assert next_day(NextDayCommand(game_id="game")).success
+
+    # The day is not journaled, so only a snapshot keeps it
+    assert game.update()[0]
+    with pytest.raises(RuntimeError):
+        with game_repository.transaction():
+            game_repository.save_game(game)
+            raise RuntimeError("Disk is full")
+    game_repository.save_game(game)
+
+    loaded = _make_repository(conn).get_game("game")
+    assert loaded.days_played == game.days_played
+
+
+def test_unknown_game_is_not_journaled(conn):
+    next_day, _ = _make_handlers(_make_repository(conn))
+
+    assert not next_day(NextDayCommand(game_id="missing")).success
+    assert _count(conn, "game_journal") == 0
+
+
+def test_game_is_loaded_on_reader_while_writer_is_busy(tmp_path, create_game):
+    manager = ConnectionManager(str(tmp_path / "duck.db"))
+    migrate(manager.writer)
+    TemporalClubProvider.initialize(manager.writer, reader=manager.readers)
+    game_repository = _make_repository(manager.writer, manager.readers)
+    create_game(game_repository)
+    next_day, _ = _make_handlers(game_repository)
+    for _ in range(_SNAPSHOT_EVERY + 2):
+        next_day(NextDayCommand(game_id="game"))
+    played = game_repository.get_game("game")
+
+    # Changes of a command that is not committed yet
+    manager.writer.execute("BEGIN")
+    manager.writer.execute("DELETE FROM game_journal")
+    manager.writer.execute("UPDATE club SET balance = 0")
+    loaded = _make_repository(manager.writer, manager.readers).get_game("game")
+    manager.writer.rollback()
+    manager.close()
+
+    assert loaded.days_played == played.days_played
+    assert _describe(loaded) == _describe(played)
+
+
+class _BrokenHandler:
+    """Fails after the command is journaled and applied to the game."""
+
+    def __init__(self, handler):
+        self._handler = handler
+
+    def __call__(self, command):
+        self._handler(command)
+        raise RuntimeError("Disk is full")
+
+
+def _make_handlers(game_repository):
+    club_provider = TemporalClubProvider.get_instance()
+    next_day = NextDayCommandHandler(
+        game_repository,
+        club_provider,
+        MatchHistoryRepository(game_repository._conn),
+    )
+    hire_new_player = HireNewPlayerCommandHandler(game_repository, club_provider)
+    return (
+        JournaledCommandHandler(next_day, game_repository),
+        JournaledCommandHandler(hire_new_player, game_repository),
+    )
+
+
+def _make_repository(conn, reader=None):
+    replayer = CommandReplayer({
+        NextDayCommand: lambda game_repository, storage: NextDayCommandHandler(
+            game_repository,
+            storage,
+            storage,
+        ),
+        HireNewPlayerCommand: HireNewPlayerCommandHandler,
+    })
+    return GameRepository(
+        conn,
+        journal=CommandJournal(conn, reader),
+        replayer=replayer,
+        snapshot_every=_SNAPSHOT_EVERY,
+        reader=reader,
+    )
+
+
+def _describe(game):
+    clubs = {
+        club_id: (
+            club.account.balance,
+            [slot.player.json for slot in club.players],
+        )
+        for club_id, club in game.clubs.items()
+    }
+    standings = [
+        (row.club_id, row.sets_won, row.games_won)
+        for row in game.competition.standings
+    ]
+    return game.day, clubs, standings
+
+
+def _describe_players(game):
+    # Ids are unique in the database, so games are compared without them
+    return [
+        [
+            {key: value for key, value in slot.player.json.items() if key != "player_id"}
+            for slot in club.players
+        ]
+        for club in game.clubs.values()
+    ]
+
+
+def _get_seeds(conn, game_id):
+    rows = conn.execute(
+        "SELECT seed FROM game_journal WHERE game_id = ? ORDER BY seq",
+        (game_id,),
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def _count(conn, table):
+    return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def _get_game_blob(conn):
+    return conn.execute("SELECT object FROM game").fetchone()[0]
@@ -0,0 +1,93 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+from core.competition import CompetitionType
+from core.playoffs import DdPlayoff
+from core.ports.inbound.commands.fast_forward import FastForwardCommand
+from core.ports.inbound.commands.fast_forward import FastForwardCommandHandler
+from core.ports.inbound.commands.fast_forward import StopCondition
+from core.ports.outbound.game_repository import GameRepository
+from core.ports.outbound.match_history_repository import MatchHistoryRepository
+from core.ports.outbound.temporal_club_provider import TemporalClubProvider
+
+
+def test_plays_given_number_of_days_and_saves_once(conn, create_game):
+    game_repository = GameRepository(conn)
+    create_game(game_repository)
+    fast_forward = _make_handler(game_repository)
+
+    statements = []
+    conn.set_trace_callback(statements.append)
+    result = fast_forward(FastForwardCommand(game_id="game", days=20))
+    conn.set_trace_callback(None)
+
+    assert result.success
+    assert result.days_played == 20
+    assert result.stopped_by is None
+    assert game_repository.get_game("game").days_played == 20
+    assert sum("INSERT INTO game " in statement for statement in statements) == 1
+    assert _count(conn, "match_result") > 0
+
+
+def test_stops_at_the_end_of_competition(conn, create_game):
+    game_repository = GameRepository(conn)
+    create_game(game_repository)
+    fast_forward = _make_handler(game_repository)
+
+    result = fast_forward(FastForwardCommand(
+        game_id="game",
+        days=1000,
+        stop_conditions=(StopCondition.COMPETITION_END.value,),
+    ))
+
+    game = game_repository.get_game("game")
+    assert result.success
+    assert result.stopped_by == StopCondition.COMPETITION_END.value
+    assert game.last_match_day.competition_type == CompetitionType.CHAMPIONSHIP
+    assert isinstance(game.competition, DdPlayoff)
+    assert len(game.history) == 1
+
+
+def test_stops_at_the_end_of_season(conn, create_game):
+    game_repository = GameRepository(conn)
+    create_game(game_repository)
+    fast_forward = _make_handler(game_repository)
+
+    result = fast_forward(FastForwardCommand(
+        game_id="game",
+        days=1000,
+        stop_conditions=(StopCondition.SEASON_END.value,),
+    ))
+
+    assert result.success
+    assert result.stopped_by == StopCondition.SEASON_END.value
+    assert len(game_repository.get_game("game").history) == 2
+
+
+def test_stops_when_user_decision_is_required(conn, create_game):
+    game_repository = GameRepository(conn)
+    create_game(game_repository)
+    game = game_repository.get_game("game")
+    club_id = next(iter(game.clubs))
+    game.set_managed(club_id, True)
+    fast_forward = _make_handler(game_repository)
+
+    result = fast_forward(FastForwardCommand(game_id="game", days=1000))
+
+    assert result.days_played < 1000
+    assert result.stopped_by is None
+    assert result.reason != "Ok"
+
+
+def _make_handler(game_repository):
+    return FastForwardCommandHandler(
+        game_repository,
+        TemporalClubProvider.get_instance(),
+        MatchHistoryRepository(game_repository._conn),
+    )
+
+
+def _count(conn, table):
+    return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
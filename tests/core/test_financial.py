@@ -0,0 +1,55 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import pickle
+
+from core.financial import DdFinancialAccount
+from core.financial import DdRetentionPolicy
+from core.financial import DdTransaction
+
+
+def test_balance_follows_transactions():
+    account = DdFinancialAccount()
+
+    assert account.ProcessTransaction(DdTransaction(100, "Income"))
+    assert account.ProcessTransaction(DdTransaction(-30, "Practice"))
+    assert not account.ProcessTransaction(DdTransaction(-71, "Contract"))
+
+    assert account.balance == 70
+    assert account.GetLatestTransactions(2) == [
+        DdTransaction(100, "Income"),
+        DdTransaction(-30, "Practice"),
+    ]
+
+
+def test_history_is_compacted_and_balance_is_kept():
+    policy = DdRetentionPolicy(keep_latest=5, period_length=3, max_periods=2)
+    account = DdFinancialAccount(policy)
+    transactions = [DdTransaction(i, f"Income {i}") for i in range(100)]
+
+    for transaction in transactions:
+        account.ProcessTransaction(transaction)
+
+    history = account.GetLatestTransactions(100)
+    assert account.balance == sum(range(100))
+    assert sum(t.value for t in history) == account.balance
+    assert len(history) <= (
+        policy.keep_latest + policy.period_length + policy.max_periods
+    )
+    assert account.GetLatestTransactions(5) == transactions[-5:]
+
+
+def test_account_saved_without_ledger_is_restored():
+    transactions = [DdTransaction(10, "Income") for _ in range(1000)]
+
+    # Imitate an account pickled by an older version of the game
+    legacy = DdFinancialAccount.__new__(DdFinancialAccount)
+    legacy.__setstate__({"_transactions": list(transactions)})
+    restored = pickle.loads(pickle.dumps(legacy))
+
+    assert restored.balance == 10_000
+    assert len(restored.GetLatestTransactions(1000)) < len(transactions)
+    assert restored.ProcessTransaction(DdTransaction(-10_000, "Contract"))
+    assert restored.balance == 0
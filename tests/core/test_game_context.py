@@ -0,0 +1,48 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import time
+
+import pytest
+
+from configuration.game_params import load_game_params
+from core.game import Game
+from core.ports.outbound.temporal_club_provider import TemporalClubProvider
+
+
+@pytest.fixture
+def game():
+    TemporalClubProvider.initialize(None)
+    now = time.time_ns() // 1_000_000
+    return Game(
+        params=load_game_params(),
+        game_id="game",
+        created_ts=now,
+        updated_ts=now,
+    )
+
+
+def test_fields_are_computed_on_first_access_only(game, monkeypatch):
+    calls = []
+    get_free_agents = game._get_free_agents
+    monkeypatch.setattr(
+        game,
+        "_get_free_agents",
+        lambda: calls.append(1) or get_free_agents(),
+    )
+    club_id = next(iter(game.clubs))
+
+    context = game.get_context(club_id)
+    assert context.balance == game.clubs[club_id].account.balance
+    assert context.day == game.day
+    assert calls == []
+
+    assert context.free_agents is context.free_agents
+    assert len(calls) == 1
+
+
+def test_context_of_unknown_club_is_an_error(game):
+    with pytest.raises(AssertionError):
+        game.get_context("unknown club")
@@ -0,0 +1,115 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import pytest
+
+from core.ports.inbound.commands.fire_player import FirePlayerCommand
+from core.ports.inbound.commands.fire_player import FirePlayerCommandHandler
+from core.ports.inbound.commands.hire_new_player import HireNewPlayerCommand
+from core.ports.inbound.commands.hire_new_player import HireNewPlayerCommandHandler
+from core.ports.outbound.game_repository import GameRepository
+from core.ports.outbound.identity_map import IdentityMap
+from core.ports.outbound.player_repository import PlayerRepository
+from core.ports.outbound.temporal_club_provider import TemporalClubProvider
+from core.ports.outbound.write_behind import WriteBehindQueue
+
+
+@pytest.fixture
+def identity_map():
+    return IdentityMap()
+
+
+def test_provider_returns_clubs_of_live_game(conn, identity_map, create_game):
+    game = create_game(GameRepository(conn, identity_map=identity_map))
+    provider = TemporalClubProvider.get_instance()
+
+    statements = []
+    conn.set_trace_callback(statements.append)
+    clubs = provider.get_clubs_for_game(game.game_id)
+    conn.set_trace_callback(None)
+
+    assert statements == []
+    assert list(clubs) == sorted(clubs, key=lambda club_id: clubs[club_id].name)
+    for club_id, club in clubs.items():
+        assert club is game.clubs[club_id]
+
+
+def test_player_repository_returns_live_player(conn, identity_map, create_game):
+    game = create_game(GameRepository(conn, identity_map=identity_map))
+    club = next(club for club in game.clubs.values() if club.players)
+    slot = club.players[0]
+    slot.player._skill_points += 5
+
+    repository = PlayerRepository(conn, identity_map)
+    info = repository.get_player_with_roster_info(
+        game.game_id,
+        slot.player.player_id,
+    )
+
+    assert repository.get_player(game.game_id, slot.player.player_id) is (
+        slot.player
+    )
+    assert info.player is slot.player
+    assert info.club_id == club.club_id
+    assert info.club_name == club.name
+
+
+def test_loaded_game_shares_clubs_with_provider(conn, identity_map, create_game):
+    game = create_game(GameRepository(conn, identity_map=identity_map))
+    identity_map.forget(game.game_id)
+
+    provider = TemporalClubProvider.get_instance()
+    clubs = provider.get_clubs_for_game(game.game_id)
+    loaded = GameRepository(conn, identity_map=identity_map).get_game("game")
+
+    for club_id, club in loaded.clubs.items():
+        assert club is clubs[club_id]
+
+
+def test_hired_and_fired_players_are_found_in_live_rosters(
+        conn,
+        identity_map,
+        create_game,
+):
+    game_repository = GameRepository(conn, identity_map=identity_map)
+    game = create_game(game_repository)
+    club = next(club for club in game.clubs.values() if club.players)
+    fired = club.players[0].player
+    assert identity_map.find_player(game.game_id, fired.player_id) == (
+        club,
+        club.get_player_slot(fired.player_id),
+    )
+
+    # The application saves roster changes later, as the game does
+    write_behind_queue = WriteBehindQueue(
+        game_repository,
+        TemporalClubProvider.get_instance(),
+        delay=60,
+    )
+    hire_new_player = HireNewPlayerCommandHandler(
+        write_behind_queue.game_repository,
+        write_behind_queue.club_provider,
+    )
+    fire_player = FirePlayerCommandHandler(
+        write_behind_queue.game_repository,
+        write_behind_queue.club_provider,
+    )
+    hire_new_player(HireNewPlayerCommand(
+        game_id=game.game_id,
+        club_id=club.club_id,
+    ))
+    fire_player(FirePlayerCommand(
+        game_id=game.game_id,
+        club_id=club.club_id,
+        player_id=fired.player_id,
+    ))
+
+    hired = club.players[-1].player
+    assert identity_map.find_player(game.game_id, fired.player_id) is None
+    assert identity_map.find_player(game.game_id, hired.player_id) == (
+        club,
+        club.get_player_slot(hired.player_id),
+    )
+    write_behind_queue.close()
@@ -0,0 +1,105 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import random
+
+from core.match import DdLinearProbabilityCalculator
+from core.match import DdMatchParams
+from core.match import ExhaustionCalculator
+from core.match import GamePlayedEvent
+from core.match import MatchEngine
+from core.match import MatchPlayedEvent
+from core.match import SetPlayedEvent
+from core.player import Player
+from core.player import PlayerReputationCalculator
+
+
+def test_streamed_match_is_the_same_as_processed_match():
+    for seed in range(20):
+        random.seed(seed)
+        home_player, away_player = _make_pair()
+        expected = MatchEngine(_make_params()).process_match(
+            home_player,
+            away_player,
+        )
+
+        random.seed(seed)
+        streamed_home_player, streamed_away_player = _make_pair()
+        events = list(MatchEngine(_make_params()).stream_match(
+            streamed_home_player,
+            streamed_away_player,
+        ))
+        result = events[-1].result
+
+        assert isinstance(events[-1], MatchPlayedEvent)
+        assert str(result.full_score) == str(expected.full_score)
+        assert result.home_exp == expected.home_exp
+        assert result.away_exp == expected.away_exp
+        assert streamed_home_player.json == home_player.json
+        assert streamed_away_player.json == away_player.json
+
+
+def test_events_add_up_to_final_score():
+    random.seed(3)
+    events = list(MatchEngine(_make_params()).stream_match(*_make_pair()))
+    result = events[-1].result
+
+    set_events = [event for event in events if isinstance(event, SetPlayedEvent)]
+    assert [event.set_result for event in set_events] == list(result.sets)
+    assert (set_events[-1].home_sets, set_events[-1].away_sets) == (
+        result.home_sets,
+        result.away_sets,
+    )
+
+    for set_event in set_events:
+        game_events = [
+            event
+            for event in events
+            if isinstance(event, GamePlayedEvent)
+            and event.set_number == set_event.set_number
+        ]
+        assert len(game_events) == (
+            set_event.set_result.home_games + set_event.set_result.away_games
+        )
+        assert sum(event.home_won for event in game_events) == (
+            set_event.set_result.home_games
+        )
+        assert game_events[-1].home_games == set_event.set_result.home_games
+        assert game_events[-1].away_games == set_event.set_result.away_games
+
+
+def test_players_are_not_changed_while_first_set_is_played():
+    random.seed(7)
+    home_player, away_player = _make_pair()
+    snapshot = home_player.json
+    stream = MatchEngine(_make_params()).stream_match(home_player, away_player)
+
+    first_event = next(stream)
+
+    assert isinstance(first_event, GamePlayedEvent)
+    assert first_event.set_number == 1
+    assert home_player.json == snapshot
+
+    events = list(stream)
+
+    assert isinstance(events[-1], MatchPlayedEvent)
+    assert home_player.stats.matches_played == 1
+
+
+def _make_pair():
+    return (
+        Player(technique=60, endurance=50),
+        Player(technique=50, endurance=70),
+    )
+
+
+def _make_params():
+    return DdMatchParams(
+        exhaustion_function=ExhaustionCalculator(1),
+        probability_function=DdLinearProbabilityCalculator(0.004),
+        reputation_function=PlayerReputationCalculator(6, 5),
+        games_to_win=6,
+        sets_to_win=2,
+    )
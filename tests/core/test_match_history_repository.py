@@ -0,0 +1,292 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import pytest
+
+from core.competition import CompetitionType
+from core.game import MatchDay
+from core.ports.inbound.commands.next_day import NextDayCommand
+from core.ports.inbound.commands.next_day import NextDayCommandHandler
+from core.ports.outbound.game_repository import GameRepository
+from core.ports.outbound.match_history_repository import MatchHistoryRepository
+from core.ports.outbound.temporal_club_provider import TemporalClubProvider
+from core.queries.game_screen_query import GameScreenGuiQueryHandler
+from core.queries.game_screen_query import GameScreenQuery
+from persistence.migration_history import migrate
+
+_DAYS = 12
+
+
+def test_next_day_saves_every_played_match(conn, create_game):
+    game_repository = GameRepository(conn)
+    create_game(game_repository)
+    history_repository = MatchHistoryRepository(conn)
+    next_day = NextDayCommandHandler(
+        game_repository,
+        TemporalClubProvider.get_instance(),
+        history_repository,
+    )
+
+    results = []
+    for _ in range(_DAYS):
+        assert next_day(NextDayCommand(game_id="game")).success
+        results.extend(game_repository.get_game("game").last_results)
+
+    assert results
+    assert _count(conn, "match_result") == len(results)
+    assert _count(conn, "match_set") == sum(len(res) for res in results)
+
+    club_id = results[0].home_pk
+    club_results = history_repository.get_club_results("game", club_id)
+    assert len(club_results) == sum(
+        club_id in (res.home_pk, res.away_pk) for res in results
+    )
+    assert club_results[0].home_sets == results[0].home_sets
+    assert club_results[0].away_games == results[0].away_games
+
+    player_id = results[0].home_player_snapshot["player_id"]
+    assert history_repository.get_player_results("game", player_id)
+
+
+def test_history_queries_use_indexes(conn):
+    queries = []
+    conn.set_trace_callback(queries.append)
+    MatchHistoryRepository(conn).get_club_results("game", "club")
+    conn.set_trace_callback(None)
+
+    plan = conn.execute(f"EXPLAIN QUERY PLAN {queries[-1]}").fetchall()
+
+    details = " ".join(row["detail"] for row in plan)
+    assert "idx_match_result_home_club_id" in details
+    assert "idx_match_result_away_club_id" in details
+
+
+def test_next_day_is_saved_in_single_transaction(conn, create_game):
+    game_repository = GameRepository(conn)
+    create_game(game_repository)
+    next_day = NextDayCommandHandler(
+        game_repository,
+        TemporalClubProvider.get_instance(),
+        _BrokenMatchHistoryRepository(),
+    )
+
+    # Days without matches are saved, the first day with matches fails
+    with pytest.raises(RuntimeError):
+        for _ in range(_DAYS):
+            saved_blob = _get_game_blob(conn)
+            next_day(NextDayCommand(game_id="game"))
+
+    assert not conn.in_transaction
+    assert _get_game_blob(conn) == saved_blob
+
+
+def test_standings_are_updated_every_match_day(conn, create_game):
+    game_repository = GameRepository(conn)
+    create_game(game_repository)
+    history_repository = MatchHistoryRepository(conn)
+    next_day = NextDayCommandHandler(
+        game_repository,
+        TemporalClubProvider.get_instance(),
+        history_repository,
+    )
+
+    for _ in range(_DAYS):
+        assert next_day(NextDayCommand(game_id="game")).success
+
+    game = game_repository.get_game("game")
+    standings = history_repository.get_standings(
+        "game",
+        len(game.history),
+        CompetitionType.CHAMPIONSHIP,
+    )
+
+    expected = {
+        row.club_id: (row.sets_won, row.games_won)
+        for row in game.competition.standings
+    }
+    assert {
+        row.club_id: (row.sets_won, row.games_won)
+        for row in standings
+    } == expected
+    assert [(row.sets_won, row.games_won) for row in standings] == sorted(
+        expected.values(),
+        reverse=True,
+    )
+    assert sum(row.matches_played for row in standings) == 2 * _count(
+        conn,
+        "match_result",
+    )
+
+
+def test_saved_standings_break_ties_like_championship(conn, create_game):
+    game_repository = GameRepository(conn)
+    create_game(game_repository)
+    history_repository = MatchHistoryRepository(conn)
+    next_day = NextDayCommandHandler(
+        game_repository,
+        TemporalClubProvider.get_instance(),
+        history_repository,
+    )
+    game = game_repository.get_game("game")
+
+    # Clubs without a match yet are all tied at zero
+    while not game.last_results:
+        assert next_day(NextDayCommand(game_id="game")).success
+
+    standings = history_repository.get_standings(
+        "game",
+        len(game.history),
+        CompetitionType.CHAMPIONSHIP,
+    )
+
+    assert _get_scores(standings) == _get_scores(game.competition.standings)
+
+
+def test_saved_standings_keep_order_of_championship_clubs(conn, create_game):
+    game = create_game(GameRepository(conn))
+    history_repository = MatchHistoryRepository(conn)
+
+    # Tied clubs are not ordered by id, but in the order of the competition
+    club_order = tuple(sorted(game.clubs, reverse=True))
+    match_day = MatchDay(
+        season=1,
+        competition_type=CompetitionType.CHAMPIONSHIP,
+        day=0,
+        club_order=club_order,
+    )
+    history_repository.save_results("game", match_day, [])
+
+    standings = history_repository.get_standings(
+        "game",
+        1,
+        CompetitionType.CHAMPIONSHIP,
+    )
+
+    assert tuple(row.club_id for row in standings) == club_order
+
+
+def test_game_screen_shows_saved_standings(conn, create_game):
+    game_repository = GameRepository(conn)
+    game = create_game(game_repository)
+    history_repository = MatchHistoryRepository(conn)
+    club_provider = TemporalClubProvider.get_instance()
+    handler = GameScreenGuiQueryHandler(
+        game_repository,
+        club_provider,
+        history_repository,
+    )
+    club_id = sorted(game.clubs)[0]
+    query = GameScreenQuery(game_id="game", manager_club_id=club_id)
+
+    # A new game shows its clubs before the first day is played
+    result = handler(query)
+    assert [
+        (row.club_id, row.sets, row.games) for row in result.standings.rows
+    ] == _get_scores(game.competition.standings)
+
+    next_day = NextDayCommandHandler(
+        game_repository,
+        club_provider,
+        history_repository,
+    )
+    for _ in range(_DAYS):
+        assert next_day(NextDayCommand(game_id="game")).success
+
+    # Standings are read from the database, not from the game
+    last_club_id = game.competition.standings[-1].club_id
+    conn.execute(
+        "UPDATE standings SET sets_won = 1000 WHERE club_id = ?",
+        (last_club_id,),
+    )
+    result = handler(query)
+
+    assert result.standings.rows[0].club_id == last_club_id
+    assert result.standings.rows[0].sets == 1000
+
+
+def test_new_season_standings_are_saved_before_first_day(conn, create_game):
+    game_repository = GameRepository(conn)
+    game = create_game(game_repository)
+    history_repository = MatchHistoryRepository(conn)
+    next_day = NextDayCommandHandler(
+        game_repository,
+        TemporalClubProvider.get_instance(),
+        history_repository,
+    )
+
+    season = len(game.history)
+    while len(game.history) == season:
+        assert next_day(NextDayCommand(game_id="game")).success
+
+    standings = history_repository.get_standings(
+        "game",
+        len(game.history),
+        CompetitionType.CHAMPIONSHIP,
+    )
+
+    assert _get_scores(standings) == _get_scores(game.competition.standings)
+    assert not any(row.matches_played for row in standings)
+
+
+def test_migration_fills_standings_of_older_saves(conn, create_game):
+    game_repository = GameRepository(conn)
+    create_game(game_repository)
+    history_repository = MatchHistoryRepository(conn)
+    next_day = NextDayCommandHandler(
+        game_repository,
+        TemporalClubProvider.get_instance(),
+        history_repository,
+    )
+    for _ in range(_DAYS):
+        assert next_day(NextDayCommand(game_id="game")).success
+
+    # Saves made before the standings table only have the match results
+    conn.execute("DROP TABLE standings")
+    conn.execute("DELETE FROM schema_migration_history WHERE migration_id = 6")
+    migrate(conn)
+
+    game = game_repository.get_game("game")
+    standings = history_repository.get_standings(
+        "game",
+        len(game.history),
+        CompetitionType.CHAMPIONSHIP,
+    )
+
+    assert _get_scores(standings) == _get_scores(game.competition.standings)
+
+
+def test_standings_query_reads_rows_in_index_order(conn):
+    queries = []
+    conn.set_trace_callback(queries.append)
+    MatchHistoryRepository(conn).get_standings(
+        "game",
+        1,
+        CompetitionType.CHAMPIONSHIP,
+    )
+    conn.set_trace_callback(None)
+
+    plan = conn.execute(f"EXPLAIN QUERY PLAN {queries[0]}").fetchall()
+
+    details = " ".join(row["detail"] for row in plan)
+    assert "idx_standings_ranking" in details
+    assert "TEMP B-TREE" not in details
+
+
+class _BrokenMatchHistoryRepository:
+    def save_days(self, game_id, days):
+        if any(results for _, results in days):
+            raise RuntimeError("Disk is full")
+
+
+def _count(conn, table):
+    return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def _get_scores(standings):
+    return [(row.club_id, row.sets_won, row.games_won) for row in standings]
+
+
+def _get_game_blob(conn):
+    return conn.execute("SELECT object FROM game").fetchone()[0]
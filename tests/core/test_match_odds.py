@@ -0,0 +1,111 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import random
+from collections import Counter
+
+import pytest
+
+from core.match import DdLinearProbabilityCalculator
+from core.match import DdMatchParams
+from core.match import ExhaustionCalculator
+from core.match import MatchEngine
+from core.match_odds import MatchOddsCalculator
+from core.player import Player
+from core.player import PlayerReputationCalculator
+
+_MATCHES = 5000
+
+
+def test_match_odds_agree_with_match_engine():
+    params = _make_params()
+    calculator = MatchOddsCalculator(params)
+
+    odds = calculator(*_make_pair())
+
+    random.seed(18)
+    scores = Counter()
+    for _ in range(_MATCHES):
+        result = MatchEngine(params).process_match(*_make_pair())
+        scores[(result.home_sets, result.away_sets)] += 1
+
+    home_wins = sum(
+        count for (home, away), count in scores.items() if home > away
+    )
+    assert odds.home_win_probability == pytest.approx(
+        home_wins / _MATCHES, abs=0.03
+    )
+    for score, count in scores.items():
+        assert odds.score_distribution[score] == pytest.approx(
+            count / _MATCHES, abs=0.03
+        )
+
+
+def test_match_odds_distribution_is_complete():
+    odds = MatchOddsCalculator(_make_params())(*_make_pair())
+
+    assert sum(odds.score_distribution.values()) == pytest.approx(1.0)
+    assert set(odds.score_distribution) == {(2, 0), (2, 1), (1, 2), (0, 2)}
+    assert odds.away_win_probability == pytest.approx(
+        1 - odds.home_win_probability
+    )
+
+
+def test_match_odds_are_even_for_equal_players():
+    calculator = MatchOddsCalculator(_make_params())
+
+    odds = calculator(
+        Player(technique=60, endurance=300),
+        Player(technique=60, endurance=300),
+    )
+
+    assert odds.home_win_probability == pytest.approx(0.5)
+
+
+def test_match_odds_for_player_without_technique():
+    calculator = MatchOddsCalculator(_make_params())
+
+    odds = calculator(Player(technique=0), Player(technique=50))
+
+    assert odds.home_win_probability == 0
+    assert dict(odds.score_distribution) == {(0, 2): 1.0}
+
+
+def test_match_odds_do_not_change_players():
+    calculator = MatchOddsCalculator(_make_params())
+    home_player, away_player = _make_pair()
+    home_json, away_json = home_player.json, away_player.json
+
+    calculator(home_player, away_player)
+
+    assert home_player.json == home_json
+    assert away_player.json == away_json
+    assert home_player.stats.matches_played == 0
+
+
+def test_match_odds_are_cached_by_player_skills():
+    calculator = MatchOddsCalculator(_make_params())
+
+    first = calculator(*_make_pair())
+    second = calculator(*_make_pair())
+
+    assert first is second
+
+
+def _make_pair():
+    return (
+        Player(technique=60, endurance=50),
+        Player(technique=50, endurance=70),
+    )
+
+
+def _make_params():
+    return DdMatchParams(
+        exhaustion_function=ExhaustionCalculator(1),
+        probability_function=DdLinearProbabilityCalculator(0.004),
+        reputation_function=PlayerReputationCalculator(6, 5),
+        games_to_win=6,
+        sets_to_win=2,
+    )
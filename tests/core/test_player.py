@@ -9,6 +9,7 @@ import pytest
 
 from configuration.config_game import GameplayConstants
 from core.player import level_exp
+from core.player import level_for_experience
 from core.player import Player
 from core.player import SkillSet
 
@@ -143,3 +144,40 @@ def test_improve_skill_raises_for_unknown_skill():
     assert player.technique == 50
     assert player.endurance == 40
     assert player.skill_points == 1
+
+
+def test_level_for_experience_matches_level_thresholds():
+    for level in range(200):
+        threshold = level_exp(level)
+
+        assert level_for_experience(threshold) == level
+        assert level_for_experience(level_exp(level + 1) - 1) == level
+
+
+def test_level_for_experience_is_zero_without_experience():
+    assert level_for_experience(0) == 0
+    assert level_for_experience(-10) == 0
+
+
+def test_actual_technique_follows_stamina_changes():
+    player = Player(technique=50, endurance=50)
+    assert player.actual_technique == 50
+
+    player.RemoveStaminaLostInMatch(25)
+    assert player.actual_technique == 25
+
+    player.RecoverStamina(10)
+    assert player.actual_technique == 35
+
+
+def test_actual_technique_follows_skill_improvement():
+    player = Player(technique=50, endurance=50)
+    player.add_experience(level_exp(1))
+    player.RemoveStaminaLostInMatch(25)
+    assert player.actual_technique == 25
+
+    player.improve_skill(1, SkillSet.ENDURANCE)
+
+    expected = player.calculate_actual_technique(player.current_stamina)
+    assert player.actual_technique == expected
+    assert player.actual_technique != 25
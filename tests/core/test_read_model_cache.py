@@ -0,0 +1,159 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+from core.ports.inbound.commands.fast_forward import FastForwardCommand
+from core.ports.inbound.commands.fast_forward import FastForwardCommandHandler
+from core.ports.inbound.commands.fire_player import FirePlayerCommand
+from core.ports.inbound.commands.fire_player import FirePlayerCommandHandler
+from core.ports.inbound.commands.hire_new_player import HireNewPlayerCommand
+from core.ports.inbound.commands.hire_new_player import HireNewPlayerCommandHandler
+from core.ports.inbound.commands.improve_player_skill_command import (
+    ImprovePlayerSkillCommand,
+)
+from core.ports.inbound.commands.improve_player_skill_command import (
+    ImprovePlayerSkillCommandHandler,
+)
+from core.ports.inbound.commands.next_day import NextDayCommand
+from core.ports.inbound.commands.next_day import NextDayCommandHandler
+from core.ports.inbound.commands.select_club import SelectClubCommand
+from core.ports.inbound.commands.select_club import SelectClubCommandHandler
+from core.ports.inbound.commands.select_coach_for_player import SelectCoachForPlayerCommand
+from core.ports.inbound.commands.select_coach_for_player import SelectCoachForPlayerCommandHandler
+from core.ports.inbound.commands.select_player_for_match import SelectPlayerForMatchCommand
+from core.ports.inbound.commands.select_player_for_match import SelectPlayerForMatchCommandHandler
+from core.ports.inbound.commands.sign_player import SignPlayerCommand
+from core.ports.inbound.commands.sign_player import SignPlayerCommandHandler
+from core.ports.outbound.game_repository import GameRepository
+from core.ports.outbound.match_history_repository import MatchHistoryRepository
+from core.ports.outbound.temporal_club_provider import TemporalClubProvider
+from core.queries.game_screen_query import GameScreenGuiQueryHandler
+from core.queries.game_screen_query import GameScreenQuery
+from core.queries.practice_screen_query import PracticeScreenQuery
+from core.queries.practice_screen_query import PracticeScreenQueryHandler
+from core.queries.read_model_cache import CachedQueryHandler
+from core.queries.read_model_cache import ReadModelCache
+from core.queries.roster_management_screen_query import RosterManagementScreenQuery
+from core.queries.roster_management_screen_query import RosterManagementScreenQueryHandler
+
+
+def test_least_recently_used_result_is_evicted():
+    cache = ReadModelCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_handler_is_not_called_while_game_is_unchanged(conn, create_game):
+    game_repository = GameRepository(conn)
+    create_game(game_repository)
+    calls = []
+    handler = CachedQueryHandler(
+        lambda query: calls.append(query) or len(calls),
+        ReadModelCache(),
+        game_repository,
+    )
+    query = PracticeScreenQuery(game_id="game", manager_club_id="club")
+
+    assert handler(query) == handler(query) == 1
+    assert len(calls) == 1
+
+    game_repository.save_game(game_repository.get_game("game"))
+
+    assert handler(query) == 2
+    assert len(calls) == 2
+
+
+def test_cached_results_are_never_stale(conn, create_game):
+    game_repository = GameRepository(conn)
+    create_game(game_repository)
+    club_provider = TemporalClubProvider.get_instance()
+    game = game_repository.get_game("game")
+    club_id = sorted(game.clubs)[0]
+
+    def make_handler(handler_type, *args):
+        return handler_type(game_repository, club_provider, *args)
+
+    def players():
+        return [slot.player.player_id for slot in game.clubs[club_id].players]
+
+    def free_agent():
+        player, _ = game.get_context(club_id).free_agents[0]
+        return player.player_id
+
+    match_history_repository = MatchHistoryRepository(conn)
+    commands = [
+        lambda: make_handler(SelectClubCommandHandler)(
+            SelectClubCommand(club_id=club_id, game_id="game"),
+        ),
+        lambda: make_handler(SelectCoachForPlayerCommandHandler)(
+            SelectCoachForPlayerCommand("game", club_id, players()[0], 1),
+        ),
+        lambda: make_handler(SelectPlayerForMatchCommandHandler)(
+            SelectPlayerForMatchCommand("game", club_id, players()[1]),
+        ),
+        lambda: make_handler(NextDayCommandHandler, match_history_repository)(
+            NextDayCommand(game_id="game"),
+        ),
+        lambda: make_handler(ImprovePlayerSkillCommandHandler)(
+            ImprovePlayerSkillCommand("game", club_id, players()[0], {"technique": 1}),
+        ),
+        lambda: make_handler(HireNewPlayerCommandHandler)(
+            HireNewPlayerCommand(club_id=club_id, game_id="game"),
+        ),
+        lambda: make_handler(SignPlayerCommandHandler)(
+            SignPlayerCommand("game", club_id, free_agent()),
+        ),
+        lambda: make_handler(FirePlayerCommandHandler)(
+            FirePlayerCommand("game", club_id, players()[-1]),
+        ),
+        lambda: make_handler(FastForwardCommandHandler, match_history_repository)(
+            FastForwardCommand(game_id="game", days=3),
+        ),
+    ]
+
+    query_handlers = [
+        (
+            GameScreenGuiQueryHandler(
+                game_repository,
+                club_provider,
+                match_history_repository,
+            ),
+            GameScreenQuery(game_id="game", manager_club_id=club_id),
+        ),
+        (
+            PracticeScreenQueryHandler(game_repository),
+            PracticeScreenQuery(game_id="game", manager_club_id=club_id),
+        ),
+        (
+            RosterManagementScreenQueryHandler(game_repository),
+            RosterManagementScreenQuery(game_id="game", manager_club_id=club_id),
+        ),
+    ]
+    cache = ReadModelCache()
+    cached_handlers = [
+        CachedQueryHandler(handler, cache, game_repository)
+        for handler, _ in query_handlers
+    ]
+
+    for command in commands:
+        for cached_handler, (_, query) in zip(cached_handlers, query_handlers):
+            cached_handler(query)
+
+        version = game_repository.get_version("game")
+        result = command()
+        if result.success:
+            assert game_repository.get_version("game") > version
+
+        for cached_handler, (handler, query) in zip(cached_handlers, query_handlers):
+            assert cached_handler(query) == handler(query)
+
+
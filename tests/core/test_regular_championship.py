@@ -0,0 +1,164 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import pickle
+import random
+
+from core.match import DdLinearProbabilityCalculator
+from core.match import DdMatchParams
+from core.match import ExhaustionCalculator
+from core.player import Player
+from core.player import PlayerReputationCalculator
+from core.ports.outbound.temporal_club_provider import TemporalClubProvider
+from core.regular_championship import ChampionshipParams
+from core.regular_championship import RegularChampionship
+
+
+def test_standings_match_full_recomputation_every_day():
+    championship = _make_championship()
+    results = []
+
+    while not championship.is_over:
+        results.extend(championship.update())
+
+        expected = _recompute_standings(championship, results)
+        actual = [
+            (row.club_id, row.sets_won, row.games_won)
+            for row in championship.standings
+        ]
+        assert actual == expected
+
+
+def test_club_position_and_fame():
+    championship = _make_championship()
+    for _ in range(10):
+        championship.update()
+
+    for pos, row in enumerate(championship.standings):
+        assert championship.get_club_position(row.club_id) == pos
+        assert championship.get_club_fame(row.club_id) == (500 if pos == 0 else 0)
+
+
+def test_standings_are_rebuilt_for_games_saved_without_table():
+    championship = _make_championship()
+    results = [championship.update() for _ in range(10)]
+    expected = _recompute_standings(championship, sum(results, []))
+
+    # Imitate a championship pickled by an older version of the game
+    state = championship.__dict__.copy()
+    del state["_table"]
+    state["_standings"] = {}
+    state["_results"] = results
+    legacy = RegularChampionship.__new__(RegularChampionship)
+    legacy.__setstate__(state)
+    restored = pickle.loads(pickle.dumps(legacy))
+
+    assert [
+        (row.club_id, row.sets_won, row.games_won)
+        for row in restored.standings
+    ] == expected
+
+
+def test_tables_pickled_with_club_id_keys_are_rebuilt():
+    championship = _make_championship()
+    results = [championship.update() for _ in range(10)]
+    expected = _recompute_standings(championship, sum(results, []))
+
+    # Imitate a table pickled when ties were broken by club id
+    table = championship._table
+    table._index = sorted(
+        (-row.sets_won, -row.games_won, row.club_id)
+        for row in table.ranking
+    )
+    del table._order
+    del table._club_ids
+    restored = pickle.loads(pickle.dumps(championship))
+
+    assert [
+        (row.club_id, row.sets_won, row.games_won)
+        for row in restored.standings
+    ] == expected
+
+
+def test_club_fixtures_match_full_schedule_scan():
+    championship = _make_championship()
+
+    while not championship.is_over:
+        for club_id in championship._clubs:
+            expected = _scan_current_match(championship, club_id)
+            assert championship.get_current_match(club_id) is expected
+            assert championship.get_club_schedule(club_id) == (
+                _scan_club_schedule(championship, club_id)
+            )
+        championship.update()
+
+
+def test_club_fixtures_are_rebuilt_after_unpickling():
+    championship = _make_championship()
+    for _ in range(10):
+        championship.update()
+
+    restored = pickle.loads(pickle.dumps(championship))
+
+    assert "_fixtures" not in restored.__dict__
+    for club_id in championship._clubs:
+        fixtures = restored.get_club_fixtures(club_id)
+        assert [(f.day, f.opponent_pk, f.is_home) for f in fixtures] == [
+            (f.day, f.opponent_pk, f.is_home)
+            for f in championship.get_club_fixtures(club_id)
+        ]
+
+
+def _scan_current_match(championship, club_id):
+    for match in championship.current_matches or []:
+        if club_id in (match.home_pk, match.away_pk):
+            return match
+    return None
+
+
+def _scan_club_schedule(championship, club_id):
+    return [
+        match
+        for day in championship._schedule if day is not None
+        for match in day
+        if not match.is_played and club_id in (match.home_pk, match.away_pk)
+    ]
+
+
+def _make_championship():
+    random.seed(6)
+    TemporalClubProvider.initialize(None)
+    clubs = TemporalClubProvider.get_instance().init_clubs_for_game("game")
+    for club in clubs.values():
+        if not club.players:
+            club.add_player(Player(technique=50, endurance=50))
+
+    match_params = DdMatchParams(
+        exhaustion_function=ExhaustionCalculator(1),
+        probability_function=DdLinearProbabilityCalculator(0.003),
+        reputation_function=PlayerReputationCalculator(6, 5),
+        games_to_win=6,
+        sets_to_win=2,
+    )
+    params = ChampionshipParams(
+        match_params=match_params,
+        recovery_day=4,
+        rounds=2,
+        match_importance=1500,
+    )
+    return RegularChampionship(clubs, params)
+
+
+def _recompute_standings(championship, results):
+    totals = {club_id: [0, 0] for club_id in championship._clubs}
+    for match in results:
+        totals[match.home_pk][0] += match.home_sets
+        totals[match.home_pk][1] += match.home_games
+        totals[match.away_pk][0] += match.away_sets
+        totals[match.away_pk][1] += match.away_games
+
+    # Clubs with equal results keep their initial order
+    rows = [(club_id, sets, games) for club_id, (sets, games) in totals.items()]
+    return sorted(rows, key=lambda row: (-row[1], -row[2]))
@@ -0,0 +1,123 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import pickle
+import random
+
+from core.game import Game
+from core.game import GameParams
+from core.match import DdLinearProbabilityCalculator
+from core.match import DdMatchParams
+from core.match import ExhaustionCalculator
+from core.player import PlayerReputationCalculator
+from core.playoffs import DdPlayoffParams
+from core.ports.outbound.temporal_club_provider import TemporalClubProvider
+from core.regular_championship import ChampionshipParams
+from core.rng import GameRng
+
+_DAYS = 30
+
+
+def test_child_stream_does_not_change_parent_sequence():
+    used = GameRng(1)
+    unused = GameRng(1)
+
+    child = used.spawn()
+    [child.random() for _ in range(100)]
+    unused.spawn()
+
+    assert used.random() == unused.random()
+
+
+def test_games_with_same_seed_play_same_seasons():
+    first = _make_game(seed=11)
+    random.seed(1)
+    [first.update() for _ in range(_DAYS)]
+
+    second = _make_game(seed=11)
+    random.seed(2)
+    [second.update() for _ in range(_DAYS)]
+
+    assert _describe(first) == _describe(second)
+
+
+def test_games_with_different_seeds_play_different_seasons():
+    first = _make_game(seed=11)
+    second = _make_game(seed=12)
+
+    [first.update() for _ in range(_DAYS)]
+    [second.update() for _ in range(_DAYS)]
+
+    assert _describe(first) != _describe(second)
+
+
+def test_stream_state_is_saved_with_game():
+    game = _make_game(seed=5)
+    [game.update() for _ in range(_DAYS)]
+    saved = pickle.loads(pickle.dumps(game, pickle.HIGHEST_PROTOCOL))
+
+    [game.update() for _ in range(_DAYS)]
+    [saved.update() for _ in range(_DAYS)]
+
+    assert _describe(saved) == _describe(game)
+
+
+def test_game_saved_without_stream_gets_one():
+    game = _make_game(seed=5)
+    del game.__dict__["_rng"]
+
+    restored = pickle.loads(pickle.dumps(game, pickle.HIGHEST_PROTOCOL))
+
+    assert isinstance(restored.rng, GameRng)
+    assert restored.rng is restored.rng
+    assert restored.update()[0]
+
+
+def _describe(game):
+    clubs = {
+        club_id: (
+            club.coach_power,
+            [slot.player.json for slot in club.players],
+        )
+        for club_id, club in game.clubs.items()
+    }
+    free_agents = [player.json for player, _ in game._get_free_agents()]
+    results = [str(result.full_score) for result in game.last_results]
+    return clubs, free_agents, results
+
+
+def _make_game(seed):
+    TemporalClubProvider.initialize(None)
+    return Game(_make_params(), "game", 0, 0, seed=seed)
+
+
+def _make_params():
+    match_params = DdMatchParams(
+        exhaustion_function=ExhaustionCalculator(1),
+        probability_function=DdLinearProbabilityCalculator(0.003),
+        reputation_function=PlayerReputationCalculator(6, 5),
+        games_to_win=6,
+        sets_to_win=2,
+    )
+    return GameParams(
+        championship_params=ChampionshipParams(
+            match_params=match_params,
+            recovery_day=4,
+            rounds=2,
+            match_importance=1500,
+        ),
+        playoff_params=DdPlayoffParams(
+            series_matches_pattern=(True, True, False, False, True, False, True),
+            match_params=match_params,
+            length=8,
+            gap_days=1,
+            match_importance=2000,
+        ),
+        contracts=[10000, 20000, 30000],
+        exhaustion_factor=8,
+        is_hard=True,
+        training_coefficient=500,
+        years_to_simulate=0,
+    )
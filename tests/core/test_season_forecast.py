@@ -0,0 +1,103 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import pytest
+
+from core.game import Game
+from core.game import GameParams
+from core.match import DdLinearProbabilityCalculator
+from core.match import DdMatchParams
+from core.match import ExhaustionCalculator
+from core.player import PlayerReputationCalculator
+from core.playoffs import DdPlayoffParams
+from core.ports.outbound.temporal_club_provider import TemporalClubProvider
+from core.regular_championship import ChampionshipParams
+from core.season_forecast import SeasonForecaster
+from core.season_forecast import simulate_season
+
+_RUNS = 4
+
+
+def test_forecast_is_reproducible():
+    game = _make_game()
+
+    first = SeasonForecaster(runs=_RUNS, seed=3, max_workers=1)(game)
+    second = SeasonForecaster(runs=_RUNS, seed=3, max_workers=1)(game)
+
+    assert first == second
+
+
+def test_forecast_does_not_depend_on_number_of_workers():
+    game = _make_game()
+
+    inline = SeasonForecaster(runs=_RUNS, seed=5, max_workers=1)(game)
+    pooled = SeasonForecaster(runs=_RUNS, seed=5, max_workers=2)(game)
+
+    assert inline == pooled
+
+
+def test_forecast_probabilities_are_consistent():
+    game = _make_game()
+    day = game.day
+
+    forecast = SeasonForecaster(runs=_RUNS, seed=7, max_workers=1)(game)
+
+    assert game.day == day
+    assert forecast.runs == _RUNS
+    assert set(forecast.clubs) == set(game.clubs)
+
+    for club in forecast.clubs.values():
+        assert sum(club.position_probabilities) == pytest.approx(1)
+
+    playoff_places = game._params.playoff_params.length
+    assert sum(
+        club.playoff_probability for club in forecast.clubs.values()
+    ) == pytest.approx(playoff_places)
+    assert sum(
+        club.cup_probability for club in forecast.clubs.values()
+    ) == pytest.approx(1)
+
+
+def test_day_that_can_not_be_played_stops_simulation():
+    game = _make_game()
+    game.update = lambda: (False, "Players are not selected.")
+
+    with pytest.raises(RuntimeError, match="Players are not selected."):
+        simulate_season(game)
+
+
+def _make_game():
+    TemporalClubProvider.initialize(None)
+    return Game(_make_params(), "game", 0, 0)
+
+
+def _make_params():
+    match_params = DdMatchParams(
+        exhaustion_function=ExhaustionCalculator(1),
+        probability_function=DdLinearProbabilityCalculator(0.003),
+        reputation_function=PlayerReputationCalculator(6, 5),
+        games_to_win=6,
+        sets_to_win=2,
+    )
+    return GameParams(
+        championship_params=ChampionshipParams(
+            match_params=match_params,
+            recovery_day=4,
+            rounds=2,
+            match_importance=1500,
+        ),
+        playoff_params=DdPlayoffParams(
+            series_matches_pattern=(True, True, False, False, True, False, True),
+            match_params=match_params,
+            length=8,
+            gap_days=1,
+            match_importance=2000,
+        ),
+        contracts=[10000, 20000, 30000],
+        exhaustion_factor=8,
+        is_hard=True,
+        training_coefficient=500,
+        years_to_simulate=0,
+    )
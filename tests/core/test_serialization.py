@@ -0,0 +1,133 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import base64
+import json
+import pickle
+
+from core.club import ClubPlayerSlot
+from core.match import DdMatchResult
+from core.match import DdScheduledMatchStruct
+from core.match import DdSetResult
+from core.match import DdSetStatuses
+from core.match import DdStandingsRowStruct
+from core.player import Player
+from core.player import level_exp
+from core.playoffs import DdPlayoffScheduledMatchStruct
+from core.serialization import DdJsonDecoder
+from core.serialization import DdJsonEncoder
+
+# A fired player pickled before slots, when firing set has_next_contract
+_FIRED_PLAYER_PICKLE = base64.b64decode(
+    "gASVcgEAAAAAAACMC2NvcmUucGxheWVylIwGUGxheWVylJOUKYGUfZQojApfcGxh"
+    "eWVyX2lklIwFZmlyZWSUjAtfZmlyc3RfbmFtZZSMBEpvYW6UjAxfc2Vjb25kX25h"
+    "bWWUjAdLYXRlbHlulIwKX2xhc3RfbmFtZZSMB1Jvd2xpbmeUjApfdGVjaG5pcXVl"
+    "lEsyjApfZW5kdXJhbmNllEsojARfYWdllEsYjAtfZXhoYXVzdGlvbpRLAIwLX2V4"
+    "cGVyaWVuY2WUSwCMDV9za2lsbF9wb2ludHOUSwCMEF9jdXJyZW50X3N0YW1pbmGU"
+    "SyiMC19yZXB1dGF0aW9ulEsAjAZfc3RhdHOUaACMC1BsYXllclN0YXRzlJOUKYGU"
+    "fZQojAtzZXRzX3BsYXllZJRLAIwIc2V0c193b26USwCMDm1hdGNoZXNfcGxheWVk"
+    "lEsAjAttYXRjaGVzX3dvbpRLAHVijBFoYXNfbmV4dF9jb250cmFjdJSJdWIu"
+)
+
+
+def test_records_have_no_instance_dict():
+    records = [
+        Player(),
+        Player().stats,
+        ClubPlayerSlot(Player()),
+        DdMatchResult(),
+        DdScheduledMatchStruct("a", "b"),
+        DdPlayoffScheduledMatchStruct("a", "b"),
+        DdStandingsRowStruct("a"),
+    ]
+
+    for record in records:
+        assert not hasattr(record, "__dict__"), type(record).__name__
+
+
+def test_player_survives_pickling():
+    player = Player(technique=40, endurance=60)
+    player.add_experience(level_exp(3))
+    player.RemoveStaminaLostInMatch(10)
+    player.stats.sets_won = 4
+
+    restored = pickle.loads(pickle.dumps(player, pickle.HIGHEST_PROTOCOL))
+
+    assert restored.json == player.json
+    assert restored.stats.sets_won == 4
+
+
+def test_match_result_survives_pickling():
+    result = DdMatchResult(sets_to_win=2)
+    result.home_pk = "a"
+    result.away_pk = "b"
+    result.AddSetResult(DdSetResult(
+        away_games=4,
+        home_games=6,
+        set_status=DdSetStatuses.REGULAR,
+    ))
+
+    restored = pickle.loads(pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+
+    assert (restored.home_pk, restored.away_pk) == ("a", "b")
+    assert restored.full_score == "6:4"
+
+
+def test_records_pickled_with_instance_dict_are_restored():
+    # Objects pickled before slots store their __dict__ as the state
+    player = Player.__new__(Player)
+    player.__setstate__({
+        "_player_id": "1",
+        "_first_name": "Joan",
+        "_second_name": "Katelyn",
+        "_last_name": "Rowling",
+        "_technique": 50,
+        "_endurance": 50,
+        "_exhaustion": 0,
+        "_experience": level_exp(2),
+        "_skill_points": 2,
+        "_current_stamina": 25,
+        "_age": 20,
+        "_reputation": 0,
+        "_stats": Player().stats,
+    })
+    match = DdPlayoffScheduledMatchStruct.__new__(DdPlayoffScheduledMatchStruct)
+    match.__setstate__({
+        "home_pk": "a",
+        "away_pk": "b",
+        "is_played": True,
+        "series": None,
+    })
+
+    assert player.level == 2
+    assert player.actual_technique == 25
+    assert match.is_played
+    assert match.series is None
+
+
+def test_fired_player_pickled_before_slots_is_restored():
+    player = pickle.loads(_FIRED_PLAYER_PICKLE)
+
+    assert player.player_id == "fired"
+    assert player.technique == 50
+    assert player.current_stamina == 40
+    assert not hasattr(player, "has_next_contract")
+
+
+def test_club_player_slot_json_round_trip():
+    slot = ClubPlayerSlot(Player(technique=30, endurance=20), coach_level=2)
+    slot.has_next_contract = True
+
+    decoder = DdJsonDecoder()
+    decoder.register(Player)
+    decoder.register(ClubPlayerSlot)
+    restored = json.loads(
+        json.dumps(slot, cls=DdJsonEncoder),
+        object_hook=decoder,
+    )
+
+    assert restored.coach_level == 2
+    assert restored.has_next_contract
+    assert restored.player.json == slot.player.json
@@ -0,0 +1,118 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import pytest
+
+from core.ports.outbound.game_repository import GameRepository
+from core.ports.outbound.temporal_club_provider import TemporalClubProvider
+from persistence.transaction import transaction
+
+
+def test_unchanged_clubs_are_not_written(conn, create_game):
+    game = create_game(GameRepository(conn))
+    provider = TemporalClubProvider.get_instance()
+
+    statements = _trace(conn, lambda: provider.save_clubs(game.clubs.values()))
+
+    assert _writes(statements) == []
+
+
+def test_only_changed_player_is_written(conn, create_game):
+    game = create_game(GameRepository(conn))
+    provider = TemporalClubProvider.get_instance()
+    player = _first_player(game)
+    player._skill_points += 3
+
+    statements = _trace(conn, lambda: provider.save_clubs(game.clubs.values()))
+
+    writes = _writes(statements)
+    assert len(writes) == 1
+    assert "INSERT INTO player" in writes[0]
+    assert _load_player(game.game_id, player.player_id).skill_points == (
+        player.skill_points
+    )
+
+
+def test_removed_player_leaves_roster(conn, create_game):
+    game = create_game(GameRepository(conn))
+    provider = TemporalClubProvider.get_instance()
+    player = _first_player(game)
+    club = _find_club(game.clubs, player.player_id)
+    club.pop_player(player.player_id)
+
+    provider.save_clubs(game.clubs.values())
+
+    loaded = provider.get_clubs_for_game(game.game_id)[club.club_id]
+    assert not loaded.has_player(player.player_id)
+    assert len(loaded.players) == len(club.players)
+
+
+def test_clubs_are_loaded_with_fixed_number_of_queries(conn, create_game):
+    game = create_game(GameRepository(conn))
+    provider = TemporalClubProvider.get_instance()
+
+    statements = _trace(conn, lambda: provider.get_clubs_for_game(game.game_id))
+
+    assert len(statements) == 3
+    loaded = provider.get_clubs_for_game(game.game_id)
+    for club_id, club in game.clubs.items():
+        assert [slot.player.player_id for slot in loaded[club_id].players] == [
+            slot.player.player_id for slot in club.players
+        ]
+
+
+def test_rolled_back_changes_are_written_again(conn, create_game):
+    game = create_game(GameRepository(conn))
+    provider = TemporalClubProvider.get_instance()
+    player = _first_player(game)
+    player._skill_points += 3
+
+    with pytest.raises(RuntimeError):
+        with transaction(conn):
+            provider.save_clubs(game.clubs.values())
+            raise RuntimeError("Something went wrong")
+
+    provider.save_clubs(game.clubs.values())
+
+    assert _load_player(game.game_id, player.player_id).skill_points == (
+        player.skill_points
+    )
+
+
+def _first_player(game):
+    for club in game.clubs.values():
+        if club.players:
+            return club.players[0].player
+    return None
+
+
+def _load_player(game_id, player_id):
+    clubs = TemporalClubProvider.get_instance().get_clubs_for_game(game_id)
+    club = _find_club(clubs, player_id)
+    return club.get_player_slot(player_id).player
+
+
+def _find_club(clubs, player_id):
+    for club in clubs.values():
+        if club.has_player(player_id):
+            return club
+    return None
+
+
+def _trace(conn, action):
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        action()
+    finally:
+        conn.set_trace_callback(None)
+    return statements
+
+
+def _writes(statements):
+    return [
+        statement for statement in statements
+        if "INSERT" in statement or "DELETE" in statement
+    ]
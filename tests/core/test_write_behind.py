@@ -0,0 +1,185 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import time
+
+from core.ports.inbound.commands.journal import CommandReplayer
+from core.ports.inbound.commands.journal import JournaledCommandHandler
+from core.ports.inbound.commands.next_day import NextDayCommand
+from core.ports.inbound.commands.next_day import NextDayCommandHandler
+from core.ports.inbound.commands.select_coach_for_player import SelectCoachForPlayerCommand
+from core.ports.inbound.commands.select_coach_for_player import SelectCoachForPlayerCommandHandler
+from core.ports.outbound.command_journal import CommandJournal
+from core.ports.outbound.game_repository import GameRepository
+from core.ports.outbound.match_history_repository import MatchHistoryRepository
+from core.ports.outbound.temporal_club_provider import TemporalClubProvider
+from core.ports.outbound.write_behind import FlushingCommandHandler
+from core.ports.outbound.write_behind import WriteBehindQueue
+from persistence.connection_manager import ConnectionManager
+from persistence.migration_history import migrate
+
+_COACH_INDEX = 0
+
+
+def test_burst_of_commands_is_written_once(conn, create_game):
+    game_repository = GameRepository(conn)
+    create_game(game_repository)
+    write_behind_queue = WriteBehindQueue(
+        game_repository,
+        TemporalClubProvider.get_instance(),
+        delay=60,
+    )
+    version = game_repository.get_version("game")
+
+    statements = []
+    conn.set_trace_callback(statements.append)
+    expected = _select_coaches(_make_handler(write_behind_queue), game_repository)
+
+    assert statements == []
+    assert write_behind_queue.has_pending("game")
+    assert game_repository.get_version("game") == version + len(expected)
+
+    write_behind_queue.close()
+    conn.set_trace_callback(None)
+
+    assert not write_behind_queue.has_pending("game")
+    assert statements.count("BEGIN") == 1
+    assert sum("INSERT INTO game " in statement for statement in statements) == 1
+    assert _get_saved_coach_levels(conn, expected) == expected
+
+
+def test_day_advance_writes_pending_saves_first(conn, create_game):
+    game_repository = GameRepository(conn)
+    create_game(game_repository)
+    club_provider = TemporalClubProvider.get_instance()
+    write_behind_queue = WriteBehindQueue(game_repository, club_provider, delay=60)
+    expected = _select_coaches(_make_handler(write_behind_queue), game_repository)
+
+    next_day = FlushingCommandHandler(
+        NextDayCommandHandler(
+            game_repository,
+            club_provider,
+            MatchHistoryRepository(conn),
+        ),
+        write_behind_queue,
+    )
+    assert next_day(NextDayCommand(game_id="game")).success
+
+    assert not write_behind_queue.has_pending("game")
+    assert _get_saved_coach_levels(conn, expected) == expected
+    write_behind_queue.close()
+
+
+def test_pending_saves_are_written_after_delay(create_game):
+    manager = ConnectionManager(":memory:")
+    conn = manager.writer
+    migrate(conn)
+    TemporalClubProvider.initialize(conn)
+    game_repository = GameRepository(conn)
+    create_game(game_repository)
+    write_behind_queue = WriteBehindQueue(
+        game_repository,
+        TemporalClubProvider.get_instance(),
+        delay=0.01,
+    )
+    expected = _select_coaches(_make_handler(write_behind_queue), game_repository)
+
+    deadline = time.monotonic() + 5
+    while write_behind_queue.has_pending("game") and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert not write_behind_queue.has_pending("game")
+    assert _get_saved_coach_levels(conn, expected) == expected
+    manager.close()
+
+
+def test_pending_saves_are_recovered_from_journal_after_crash(tmp_path, create_game):
+    db_path = tmp_path / "duck.db"
+    manager = ConnectionManager(db_path)
+    migrate(manager.writer)
+    game_repository = _make_journaled_repository(manager.writer)
+    create_game(game_repository)
+    write_behind_queue = WriteBehindQueue(
+        game_repository,
+        TemporalClubProvider.get_instance(),
+        delay=60,
+        lock=manager.writer_lock,
+    )
+    select_coach = JournaledCommandHandler(
+        _make_handler(write_behind_queue),
+        game_repository,
+    )
+    expected = _select_coaches(select_coach, game_repository)
+
+    # The process dies before anything pending is written
+    write_behind_queue._timer.cancel()
+    assert _get_saved_coach_levels(manager.writer, expected) != expected
+    manager.close()
+
+    manager = ConnectionManager(db_path)
+    game = _make_journaled_repository(manager.writer).get_game("game")
+
+    assert _get_coach_levels(game, expected) == expected
+    manager.close()
+
+
+def _make_journaled_repository(conn):
+    TemporalClubProvider.initialize(conn)
+    return GameRepository(
+        conn,
+        journal=CommandJournal(conn),
+        replayer=CommandReplayer({
+            SelectCoachForPlayerCommand: SelectCoachForPlayerCommandHandler,
+        }),
+        snapshot_every=7,
+    )
+
+
+def _make_handler(write_behind_queue):
+    return SelectCoachForPlayerCommandHandler(
+        write_behind_queue.game_repository,
+        write_behind_queue.club_provider,
+    )
+
+
+def _select_coaches(select_coach, game_repository):
+    """Selects a coach for every player of a club, returns their coach levels."""
+
+    game = game_repository.get_game("game")
+    club_id = sorted(game.clubs)[0]
+    player_ids = [
+        slot.player.player_id
+        for slot in game.clubs[club_id].players
+    ]
+
+    for player_id in player_ids:
+        assert select_coach(SelectCoachForPlayerCommand(
+            game_id="game",
+            club_id=club_id,
+            player_id=player_id,
+            coach_index=_COACH_INDEX,
+        )).success
+
+    return _get_coach_levels(game, {player_id: None for player_id in player_ids})
+
+
+def _get_coach_levels(game, player_ids):
+    return {
+        slot.player.player_id: slot.coach_level
+        for club in game.clubs.values()
+        for slot in club.players
+        if slot.player.player_id in player_ids
+    }
+
+
+def _get_saved_coach_levels(conn, player_ids):
+    rows = conn.execute(
+        "SELECT player_id, coach_level FROM roster_entry WHERE game_id = 'game'"
+    ).fetchall()
+    return {
+        row["player_id"]: row["coach_level"]
+        for row in rows
+        if row["player_id"] in player_ids
+    }
@@ -0,0 +1,71 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import sqlite3
+import threading
+
+import pytest
+
+from persistence.connection_manager import ConnectionManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = ConnectionManager(str(tmp_path / "duck.db"))
+    manager.writer.execute("CREATE TABLE note (text TEXT)")
+    yield manager
+    manager.close()
+
+
+def test_database_works_in_wal_mode(manager):
+    mode = manager.writer.execute("PRAGMA journal_mode").fetchone()[0]
+
+    assert mode == "wal"
+    assert manager.reader().execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+def test_readers_are_not_blocked_by_writer(manager):
+    manager.writer.execute("INSERT INTO note VALUES ('committed')")
+    manager.writer.commit()
+
+    manager.writer.execute("BEGIN")
+    manager.writer.execute("INSERT INTO note VALUES ('pending')")
+
+    # Reads from another thread while the writer holds its transaction
+    seen = []
+    thread = threading.Thread(
+        target=lambda: seen.extend(
+            row["text"] for row in manager.readers.execute("SELECT text FROM note")
+        )
+    )
+    thread.start()
+    thread.join()
+    manager.writer.rollback()
+
+    assert seen == ["committed"]
+
+
+def test_every_thread_has_own_reader(manager):
+    readers = []
+    thread = threading.Thread(target=lambda: readers.append(manager.reader()))
+    thread.start()
+    thread.join()
+
+    assert manager.reader() is manager.reader()
+    assert readers[0] is not manager.reader()
+    assert readers[0] is not manager.writer
+
+
+def test_readers_can_not_write(manager):
+    with pytest.raises(sqlite3.OperationalError):
+        manager.reader().execute("INSERT INTO note VALUES ('text')")
+
+
+def test_memory_database_is_read_by_writer():
+    manager = ConnectionManager(":memory:")
+    try:
+        assert manager.reader() is manager.writer
+    finally:
+        manager.close()
@@ -0,0 +1,57 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import sqlite3
+
+import pytest
+
+from persistence.transaction import on_rollback
+from persistence.transaction import transaction
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("PRAGMA foreign_keys = ON;")
+    conn.execute("CREATE TABLE club (club_id TEXT PRIMARY KEY)")
+    conn.execute(
+        """
+        CREATE TABLE player (
+            player_id TEXT PRIMARY KEY,
+            club_id TEXT REFERENCES club (club_id) DEFERRABLE INITIALLY DEFERRED
+        )
+        """
+    )
+    yield conn
+    conn.close()
+
+
+def test_failed_commit_is_rolled_back(conn):
+    rolled_back = []
+
+    # Deferred foreign key is checked only on commit
+    with pytest.raises(sqlite3.IntegrityError):
+        with transaction(conn):
+            on_rollback(conn, lambda: rolled_back.append(True))
+            conn.execute("INSERT INTO player VALUES ('player', 'missing club')")
+
+    assert rolled_back == [True]
+    assert not conn.in_transaction
+    assert conn.execute("SELECT COUNT(*) FROM player").fetchone()[0] == 0
+
+
+def test_callbacks_are_forgotten_after_transaction(conn):
+    rolled_back = []
+
+    with transaction(conn):
+        on_rollback(conn, lambda: rolled_back.append("committed"))
+        conn.execute("INSERT INTO club VALUES ('club')")
+
+    with pytest.raises(ZeroDivisionError):
+        with transaction(conn):
+            on_rollback(conn, lambda: rolled_back.append("failed"))
+            1 / 0
+
+    assert rolled_back == ["failed"]
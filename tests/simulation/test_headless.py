@@ -0,0 +1,50 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+import sqlite3
+
+from core.phase_timer import Phase
+from simulation.headless import SimulationConfig
+from simulation.headless import run_simulation
+
+
+def test_simulation_plays_whole_season():
+    report = run_simulation(SimulationConfig(seasons=1, seed=1, persist_every=0))
+
+    assert report.days > 0
+    assert report.matches > report.days
+    assert set(report.phase_times) == set(Phase)
+    assert report.phase_times[Phase.MATCHES] > 0
+    assert report.phase_times[Phase.PERSISTENCE] == 0
+    assert sum(report.phase_times.values()) <= report.elapsed
+
+
+def test_simulation_is_reproducible_with_seed():
+    config = SimulationConfig(seasons=1, seed=7, persist_every=0)
+
+    first = run_simulation(config)
+    second = run_simulation(config)
+
+    assert (first.days, first.matches) == (second.days, second.matches)
+
+
+def test_simulation_saves_game(tmp_path):
+    db_path = str(tmp_path / "duck.db")
+
+    report = run_simulation(SimulationConfig(
+        seasons=1,
+        seed=1,
+        db_path=db_path,
+        persist_every=30,
+    ))
+
+    assert report.phase_times[Phase.PERSISTENCE] > 0
+
+    conn = sqlite3.connect(db_path)
+    try:
+        games = conn.execute("SELECT game_id FROM game").fetchall()
+    finally:
+        conn.close()
+    assert games == [("headless",)]
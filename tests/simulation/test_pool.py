@@ -0,0 +1,38 @@
+"""
+Created October 18, 2026
+
+@author montreal91
+"""
+from simulation.headless import SimulationConfig
+from simulation.pool import run_games
+
+
+def test_games_are_independent_of_number_of_workers():
+    configs = [
+        SimulationConfig(seasons=1, seed=seed, persist_every=0, game_id=f"g{seed}")
+        for seed in range(3)
+    ]
+
+    inline = run_games(configs, max_workers=1)
+    pooled = run_games(configs, max_workers=2)
+
+    assert [summary.game_id for summary in pooled] == ["g0", "g1", "g2"]
+    assert [summary.seasons for summary in inline] == [
+        summary.seasons for summary in pooled
+    ]
+    assert [summary.report.days for summary in inline] == [
+        summary.report.days for summary in pooled
+    ]
+
+
+def test_game_summary_has_every_finished_season():
+    config = SimulationConfig(seasons=2, seed=1, persist_every=0)
+
+    summary, = run_games([config])
+
+    assert len(summary.seasons) == 2
+    for season in summary.seasons:
+        assert season.cup_winner in season.playoff_participants
+        assert sorted(season.championship_positions.values()) == list(
+            range(len(season.championship_positions))
+        )